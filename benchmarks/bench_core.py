@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the core game engine
+
+Times the hot paths (guessing, word loading, game state, statistics and the
+hangman art lookup) and full-game throughput over synthetic corpora from 10
+to 1,000,000 words. Runs offline and writes JSON so runs can be compared::
+
+    python benchmarks/bench_core.py --output baseline.json
+    python benchmarks/bench_core.py --compare baseline.json --threshold 0.25
+
+With ``--compare`` the exit status is 1 when any benchmark is slower than
+the baseline by more than the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hangman_game.core.game_logic import HangmanLogic, clear_word_cache
+from hangman_game.core.statistics import Statistics
+from hangman_game.ui.hangman_art import get_hangman_stage
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+ENGLISH_ORDER = "etaoinsrhldcumfpgwybvkxjqz"
+
+CORPUS_SIZES = (10, 100, 1000, 10000, 100000, 1000000)
+DEFAULT_THRESHOLD = 0.25
+
+# A benchmark body runs a batch of operations and returns how many it ran
+Body = Callable[[], int]
+
+
+def measure(body: Body, repeat: int = 5, min_time: float = 0.05) -> Dict:
+    """
+    Time a benchmark body
+
+    The body is called in a loop until ``min_time`` has passed, ``repeat``
+    times; the best round is reported, as it is the least disturbed by
+    other load on the machine.
+
+    Returns:
+        Dict with seconds per operation (best and median) and ops per second
+    """
+    rounds = []
+    for _ in range(repeat):
+        ops = 0
+        start = time.perf_counter()
+        while True:
+            ops += body()
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        rounds.append(elapsed / ops)
+    best = min(rounds)
+    return {
+        "seconds_per_op": best,
+        "median_seconds_per_op": statistics.median(rounds),
+        "ops_per_sec": 1 / best,
+    }
+
+
+def synthetic_corpus(size: int, seed: int = 0) -> Dict[str, str]:
+    """Generate ``size`` distinct random words with placeholder hints"""
+    rng = random.Random(seed)
+    words: Dict[str, str] = {}
+    while len(words) < size:
+        word = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(4, 12)))
+        words.setdefault(word, f"Synthetic word {len(words)}")
+    return words
+
+
+def write_corpus(directory: str, size: int) -> str:
+    """Write a synthetic words file with ``size`` medium words"""
+    path = os.path.join(directory, f"words_{size}.json")
+    with open(path, "w") as f:
+        json.dump({"medium": synthetic_corpus(size)}, f)
+    return path
+
+
+def bench_make_guess() -> Body:
+    """Every letter guessed once, starting over on a fresh game"""
+    game = HangmanLogic("medium")
+    game.start_new_game()
+    game.max_incorrect_guesses = len(ALPHABET)
+
+    def body():
+        game.guessed_letters = []
+        game.incorrect_guesses = 0
+        game.game_won = game.game_lost = False
+        for letter in ALPHABET:
+            game.make_guess(letter)
+        return len(ALPHABET)
+    return body
+
+
+def bench_load_words() -> Body:
+    """Corpus lookup through the shared cache"""
+    game = HangmanLogic("medium")
+
+    def body():
+        for _ in range(100):
+            game._load_words()
+        return 100
+    return body
+
+
+def bench_load_words_cold() -> Body:
+    """Corpus lookup after the cache has been dropped (parses words.json)"""
+    game = HangmanLogic("medium")
+
+    def body():
+        clear_word_cache()
+        game._load_words()
+        return 1
+    return body
+
+
+def bench_get_game_state() -> Body:
+    """Game state of a game in progress"""
+    game = HangmanLogic("medium")
+    game.start_new_game()
+    for letter in "eai":
+        game.make_guess(letter)
+
+    def body():
+        for _ in range(100):
+            game.get_game_state()
+        return 100
+    return body
+
+
+def bench_record_game(stats: Statistics) -> Body:
+    """Recording a game result in a temporary statistics file"""
+    def body():
+        for i in range(10):
+            stats.record_game(i % 3 != 0, "medium", 7, "benchmark")
+        return 10
+    return body
+
+
+def bench_get_hangman_stage() -> Body:
+    """Hangman art lookup for every stage of every difficulty"""
+    stages = [(wrong, limit) for limit in (8, 6, 4) for wrong in range(limit + 1)]
+
+    def body():
+        for wrong, limit in stages:
+            get_hangman_stage(wrong, limit)
+        return len(stages)
+    return body
+
+
+def bench_games(words_file: str) -> Body:
+    """Full games (new game and guesses in English letter order)"""
+    game = HangmanLogic("medium", words_file=words_file)
+
+    def body():
+        for _ in range(20):
+            game.start_new_game()
+            for letter in ENGLISH_ORDER:
+                game.make_guess(letter)
+                if game.game_won or game.game_lost:
+                    break
+        return 20
+    return body
+
+
+def run_benchmarks(sizes=CORPUS_SIZES, repeat: int = 5, min_time: float = 0.05,
+                   log: Callable[[str], None] = lambda line: None) -> Dict:
+    """
+    Run every benchmark
+
+    Args:
+        sizes: Corpus sizes for the full-game throughput benchmark
+        repeat: Timed rounds per benchmark
+        min_time: Minimum seconds per round
+        log: Called with a line of progress for each result
+
+    Returns:
+        Report dict with environment details and a result per benchmark
+    """
+    results: Dict[str, Dict] = {}
+
+    def run(name: str, body: Body):
+        results[name] = measure(body, repeat, min_time)
+        log(f"{name:32} {results[name]['seconds_per_op'] * 1e6:12.3f} us/op")
+
+    with tempfile.TemporaryDirectory() as directory:
+        run("make_guess", bench_make_guess())
+        run("load_words", bench_load_words())
+        run("load_words_cold", bench_load_words_cold())
+        run("get_game_state", bench_get_game_state())
+        for name, buffered in (("record_game", False), ("record_game_buffered", True)):
+            stats = Statistics(os.path.join(directory, name + ".json"), buffered=buffered)
+            run(name, bench_record_game(stats))
+            stats.flush()
+        run("get_hangman_stage", bench_get_hangman_stage())
+
+        for size in sizes:
+            words_file = write_corpus(directory, size)
+            start = time.perf_counter()
+            HangmanLogic("medium", words_file=words_file)
+            load_seconds = time.perf_counter() - start
+            run(f"game[{size}]", bench_games(words_file))
+            results[f"game[{size}]"]["load_seconds"] = load_seconds
+            clear_word_cache()
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, float]]:
+    """
+    Find benchmarks that got slower than a baseline run
+
+    Args:
+        baseline: Earlier report from ``run_benchmarks``
+        current: New report
+        threshold: Allowed slowdown as a fraction (0.25 = 25% slower)
+
+    Returns:
+        List of (benchmark name, new/old time ratio) over the threshold
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        ratio = result["seconds_per_op"] / old["seconds_per_op"]
+        if ratio > 1 + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv=None):
+    """Main entry point for the benchmarks"""
+    parser = argparse.ArgumentParser(description="Benchmark the Hangman core engine")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="baseline JSON report to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown against the baseline (default: 0.25)")
+    parser.add_argument("--sizes", default=",".join(map(str, CORPUS_SIZES)),
+                        help="comma-separated corpus sizes for game throughput")
+    parser.add_argument("--repeat", type=int, default=5, help="timed rounds per benchmark")
+    parser.add_argument("--quick", action="store_true", help="fewer, shorter rounds and corpora up to 10k")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    repeat, min_time = args.repeat, 0.05
+    if args.quick:
+        sizes = [size for size in sizes if size <= 10000]
+        repeat, min_time = 3, 0.02
+
+    report = run_benchmarks(sizes, repeat, min_time, log=lambda line: print(line, file=sys.stderr))
+    for size in sizes:
+        result = report["results"][f"game[{size}]"]
+        print(f"{size:>8} words: {result['ops_per_sec']:10.0f} games/sec "
+              f"(corpus loaded in {result['load_seconds']:.3f}s)", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        for name, ratio in regressions:
+            print(f"REGRESSION {name}: {ratio:.2f}x the baseline time", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions over {args.threshold:.0%}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,21 +1,43 @@
 #!/usr/bin/env python3
 """
 Simple command-line version of Hangman game for systems without Tkinter
+
+``hangman-cli --batch [FILE]`` plays scripted games from FILE (or stdin)
+instead, one game per line, and writes one JSON line per guess and per
+game::
+
+    $ echo '{"difficulty": "easy", "word": "cat", "guesses": "eact"}' | hangman-cli --batch
+    {"type":"guess","game":1,"letter":"e","valid":true,"correct":false,"display_word":"_ _ _","incorrect_guesses":1}
+    ...
+    {"type":"game","game":1,"line":1,"difficulty":"easy","word":"cat","won":true,"lost":false,"incorrect_guesses":1,"guesses":4}
+
+Plain-text lines work too: an optional difficulty and the letters to guess
+(``hard etaoinshr``); the word is then drawn at random.
 """
 
-from hangman_game.core.game_logic import HangmanLogic
-from hangman_game.core.statistics import Statistics
+import os
+import sys
+
+from hangman_game.core.game_logic import HangmanLogic, MAX_INCORRECT_GUESSES
 from hangman_game.ui.hangman_art import get_hangman_stage
 
+# Statistics (and the json/pathlib/tempfile imports behind it) is loaded at
+# the end of the first game, so the CLI starts without touching the stats file
+
 
 def clear_screen():
     """Clear the terminal screen"""
-    import os
     os.system('clear' if os.name != 'nt' else 'cls')
 
 
-def play_game_cli():
-    """Play hangman game in command line"""
+def play_game_cli(game=None):
+    """
+    Play hangman game in command line
+    
+    Args:
+        game: HangmanLogic engine of a previous game to reuse, so playing
+            again doesn't reload the words
+    """
     print("\n" + "=" * 50)
     print("      🎮 WELCOME TO HANGMAN GAME! 🎮")
     print("=" * 50)
@@ -41,9 +63,12 @@ def play_game_cli():
             print("Invalid choice. Please enter 1, 2, or 3.")
     
     # Initialize game
-    game = HangmanLogic(difficulty=difficulty)
-    stats = Statistics()
-    word, hint = game.start_new_game()
+    if game is None:
+        game = HangmanLogic(difficulty=difficulty)
+        # Load every difficulty now, so playing again at another one
+        # doesn't read the words file
+        game.preload()
+    word, hint = game.reset(difficulty=difficulty)
     
     # Game loop
     while not game.game_won and not game.game_lost:
@@ -88,6 +113,8 @@ def play_game_cli():
         input("Press Enter to continue...")
     
     # Game over
+    from hangman_game.core.statistics import Statistics
+    stats = Statistics()
     clear_screen()
     art = get_hangman_stage(game.incorrect_guesses, game.max_incorrect_guesses)
     print(art)
@@ -97,11 +124,13 @@ def play_game_cli():
         print("🎉 CONGRATULATIONS! YOU WON! 🎉")
         print(f"\nThe word was: {game.word_to_guess.upper()}")
         print(f"You guessed it with {game.incorrect_guesses} wrong guesses!")
-        stats.record_game(won=True, difficulty=difficulty, guesses=len(game.guessed_letters))
+        stats.record_game(won=True, difficulty=difficulty, guesses=len(game.guessed_letters),
+                          word=game.word_to_guess)
     else:
         print("😢 GAME OVER - YOU LOST! 😢")
         print(f"\nThe word was: {game.word_to_guess.upper()}")
-        stats.record_game(won=False, difficulty=difficulty, guesses=len(game.guessed_letters))
+        stats.record_game(won=False, difficulty=difficulty, guesses=len(game.guessed_letters),
+                          word=game.word_to_guess)
     
     print(f"{'=' * 50}")
     
@@ -117,13 +146,213 @@ def play_game_cli():
     print("\n" + "=" * 50)
     play_again = input("\nPlay again? (y/n): ").strip().lower()
     if play_again == 'y':
-        play_game_cli()
+        play_game_cli(game)
     else:
         print("\nThanks for playing! Goodbye! 👋")
 
 
-def main():
+def parse_batch_line(line):
+    """
+    Parse one batch input line into a game description
+    
+    Args:
+        line: A JSON object with ``guesses`` (string or list of letters) and
+            optional ``difficulty``, ``word`` and ``hint``, or plain text:
+            an optional difficulty followed by the letters to guess
+            
+    Returns:
+        Dict with difficulty, word (None for a random one), hint and guesses
+        
+    Raises:
+        ValueError: If the line can't be parsed
+    """
+    if line.startswith("{"):
+        import json
+        spec = json.loads(line)
+        if not isinstance(spec, dict):
+            raise ValueError("Expected a JSON object")
+        guesses = spec.get("guesses", "")
+        if isinstance(guesses, str):
+            guesses = list(guesses)
+        elif not isinstance(guesses, list) or not all(isinstance(g, str) for g in guesses):
+            raise ValueError("guesses must be a string or a list of letters")
+        word = spec.get("word")
+        if word is not None and (not isinstance(word, str) or not word):
+            raise ValueError("word must be a non-empty string")
+        difficulty = spec.get("difficulty", "medium")
+        if not isinstance(difficulty, str):
+            raise ValueError("difficulty must be a string")
+        hint = spec.get("hint")
+        if hint is not None and not isinstance(hint, str):
+            raise ValueError("hint must be a string")
+    else:
+        tokens = line.split()
+        difficulty = tokens.pop(0) if tokens and tokens[0] in MAX_INCORRECT_GUESSES else "medium"
+        guesses = [letter for token in tokens for letter in token]
+        word = hint = None
+    if difficulty not in MAX_INCORRECT_GUESSES:
+        raise ValueError(f"Unknown difficulty: {difficulty}")
+    return {"difficulty": difficulty, "word": word, "hint": hint, "guesses": guesses}
+
+
+def play_batch(lines, out, words_file=None, guess_lines=True, stats=None):
+    """
+    Play scripted games and write their results as JSON lines
+    
+    One engine is reset for every game, and nothing is prompted, printed
+    for people or run in a subprocess. A game ends when it is won or lost
+    or its guesses run out; guesses after the end are ignored. Blank lines
+    and lines starting with "#" are skipped, and lines holding undecodable
+    bytes (as surrogate escapes) are reported as errors.
+    
+    Args:
+        lines: Iterable of input lines (see ``parse_batch_line``)
+        out: Text stream to write the JSON lines to
+        words_file: Optional words JSON file or word pack for random words
+        guess_lines: Write a line per guess as well as per game
+        stats: Optional Statistics to record every finished game in
+        
+    Returns:
+        Dict with counts of games, wins, losses and input errors
+    """
+    import json
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    write = out.write
+    summary = {"games": 0, "won": 0, "lost": 0, "errors": 0}
+    game = None
+    
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            if not line.isascii():
+                # Undecodable bytes arrive as surrogate escapes (see batch_main)
+                try:
+                    line.encode("utf-8")
+                except UnicodeEncodeError:
+                    raise ValueError("Line is not valid UTF-8") from None
+            spec = parse_batch_line(line)
+        except ValueError as e:
+            summary["errors"] += 1
+            write(encode({"type": "error", "line": number, "error": str(e)}) + "\n")
+            continue
+        
+        if game is None:
+            game = HangmanLogic(difficulty=spec["difficulty"], words_file=words_file)
+            game.preload()
+        game.reset(difficulty=spec["difficulty"])
+        if spec["word"] is not None:
+            game.word_to_guess = spec["word"].lower()
+            game.hint = spec["hint"] or game.words_with_clues.get(game.word_to_guess, "")
+        summary["games"] += 1
+        game_number = summary["games"]
+        
+        for letter in spec["guesses"]:
+            if game.game_won or game.game_lost:
+                break
+            letter = letter.lower()
+            if len(letter) == 1 and letter.isalpha():
+                result = game.make_guess(letter)
+                record = {"valid": result["valid"], "correct": result["correct"]}
+                if not result["valid"]:
+                    record["error"] = result["message"]
+            else:
+                record = {"valid": False, "correct": False, "error": "Not a single letter"}
+            if guess_lines:
+                write(encode(dict(
+                    {"type": "guess", "game": game_number, "letter": letter}, **record,
+                    display_word=game.get_display_word(),
+                    incorrect_guesses=game.incorrect_guesses
+                )) + "\n")
+        
+        summary["won"] += game.game_won
+        summary["lost"] += game.game_lost
+        write(encode({
+            "type": "game",
+            "game": game_number,
+            "line": number,
+            "difficulty": game.difficulty,
+            "word": game.word_to_guess,
+            "won": game.game_won,
+            "lost": game.game_lost,
+            "incorrect_guesses": game.incorrect_guesses,
+            "guesses": len(game.guessed_letters)
+        }) + "\n")
+        if stats is not None and (game.game_won or game.game_lost):
+            stats.record_game(won=game.game_won, difficulty=game.difficulty,
+                              guesses=len(game.guessed_letters), word=game.word_to_guess)
+    return summary
+
+
+def batch_main(args):
+    """
+    Run ``--batch`` mode; returns the exit status (1 if any line was
+    invalid, 2 if the input file can't be opened)
+    """
+    if args.seed is not None:
+        import random
+        random.seed(args.seed)
+    stats = None
+    if args.stats:
+        from hangman_game.core.statistics import Statistics
+        stats = Statistics(buffered=True)
+    
+    # Invalid UTF-8 is decoded with surrogate escapes, so that one bad line
+    # is reported as an error record instead of aborting the batch
+    try:
+        if args.batch == "-":
+            source = sys.stdin
+            if hasattr(source, "reconfigure"):
+                source.reconfigure(encoding="utf-8", errors="surrogateescape")
+        else:
+            source = open(args.batch, "r", encoding="utf-8", errors="surrogateescape")
+    except OSError as e:
+        print(f"hangman-cli: cannot read {args.batch}: {e.strerror or e}", file=sys.stderr)
+        return 2
+    try:
+        summary = play_batch(source, sys.stdout, words_file=args.words,
+                             guess_lines=not args.games_only, stats=stats)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. "| head"); silence the flush at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if stats is not None:
+            stats.flush()
+    return 1 if summary["errors"] else 0
+
+
+def parse_args(argv):
+    """Parse the command line"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Play Hangman in the terminal")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="FILE",
+                        help="play scripted games from FILE (default: stdin) and write JSON lines")
+    parser.add_argument("--words", help="words JSON file or word pack (batch mode)")
+    parser.add_argument("--seed", type=int, help="random seed for the words drawn (batch mode)")
+    parser.add_argument("--games-only", action="store_true",
+                        help="write only the per-game lines (batch mode)")
+    parser.add_argument("--stats", action="store_true",
+                        help="record batch games in your statistics")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main entry point for CLI version"""
+    if os.environ.get("HANGMAN_METRICS"):
+        from hangman_game.core import metrics
+        metrics.enable_from_env()
+    argv = sys.argv[1:] if argv is None else argv
+    # argparse is only imported when there are options to parse
+    if argv:
+        args = parse_args(argv)
+        if args.batch is not None:
+            return batch_main(args)
     try:
         play_game_cli()
     except KeyboardInterrupt:
@@ -133,4 +362,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
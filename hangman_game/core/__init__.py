@@ -1,6 +1,28 @@
 """Core package initialization"""
 
-from hangman_game.core.game_logic import HangmanLogic
-from hangman_game.core.statistics import Statistics
+# Names are imported from their modules on first access, so that importing
+# one core module doesn't load all of them
+_EXPORTS = {
+    'HangmanLogic': 'hangman_game.core.game_logic',
+    'load_words': 'hangman_game.core.game_logic',
+    'preload_words': 'hangman_game.core.game_logic',
+    'GameSession': 'hangman_game.core.session',
+    'SQLiteStatistics': 'hangman_game.core.sqlite_statistics',
+    'Statistics': 'hangman_game.core.statistics',
+}
 
-__all__ = ['HangmanLogic', 'Statistics']
+__all__ = ['HangmanLogic', 'GameSession', 'Statistics', 'SQLiteStatistics', 'load_words', 'preload_words']
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,107 @@
+"""
+Word families for the adversarial ("evil") Hangman mode
+
+In evil mode the secret word is never fixed: every guess splits the words
+still possible into families by where the guessed letter appears in them,
+and the game keeps the largest family. The split needs each candidate's
+position mask for the guessed letter, so per word length the masks are
+precomputed for every letter as compact arrays ("signatures"): a guess is
+one array lookup per candidate, with no string scanning.
+"""
+
+from array import array
+from collections import Counter
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from hangman_game.core.game_logic import cached_for_corpus, corpus_cache, words_by_length
+
+# Families of cached corpora, dropped when the corpus is reloaded
+_FAMILIES = corpus_cache()
+
+
+def _typecode(length: int) -> Optional[str]:
+    """Smallest array type holding a position mask for words of a length"""
+    for code in ("B", "H", "I", "L", "Q"):
+        if length <= array(code).itemsize * 8:
+            return code
+    return None
+
+
+class _LengthGroup:
+    """Words of one length with a position-mask array per letter"""
+
+    __slots__ = ("words", "signatures")
+
+    def __init__(self, words: List[str]):
+        self.words = words
+        self.signatures: Dict[str, Sequence[int]] = {}
+        length = len(words[0]) if words else 0
+        code = _typecode(length)
+        columns = {}
+        for i, word in enumerate(words):
+            for position, letter in enumerate(word):
+                column = columns.get(letter)
+                if column is None:
+                    column = columns[letter] = [0] * len(words)
+                column[i] |= 1 << position
+        for letter, column in columns.items():
+            self.signatures[letter] = array(code, column) if code else column
+
+
+class WordFamilies:
+    """Partition candidate words by the reveal pattern of a guessed letter"""
+
+    def __init__(self, words):
+        """
+        Group the words by length (signatures are built per length on use)
+
+        Args:
+            words: Dictionary words (lower-cased, duplicates removed)
+        """
+        self._by_length = words_by_length(words)
+        self._groups: Dict[int, _LengthGroup] = {}
+
+    @classmethod
+    def for_words(cls, words: Mapping) -> "WordFamilies":
+        """Get the families of a corpus mapping, built once per loaded corpus"""
+        return cached_for_corpus(_FAMILIES, words, cls)
+
+    def group(self, length: int) -> _LengthGroup:
+        """Get the words of a length and their signatures"""
+        group = self._groups.get(length)
+        if group is None:
+            group = self._groups[length] = _LengthGroup(self._by_length.get(length, []))
+        return group
+
+    def largest_family(self, length: int, candidates: Optional[List[int]],
+                       letter: str) -> Tuple[int, List[int]]:
+        """
+        Split candidates by where a letter appears and pick the largest family
+
+        Ties go to the family without the letter, then to the one revealing
+        the fewest positions.
+
+        Args:
+            length: Word length being played
+            candidates: Indices into ``group(length).words`` (None means all)
+            letter: The guessed letter
+
+        Returns:
+            Tuple of (position mask of the letter in the family, its indices)
+        """
+        group = self.group(length)
+        column = group.signatures.get(letter)
+        if column is None:
+            # No word of this length has the letter: one family, the letter misses
+            return 0, list(range(len(group.words))) if candidates is None else candidates
+
+        if candidates is None:
+            sizes = Counter(column)
+        else:
+            sizes = Counter([column[i] for i in candidates])
+        mask = max(sizes, key=lambda mask: (sizes[mask], mask == 0, -bin(mask).count("1")))
+        if candidates is None:
+            family = [i for i, value in enumerate(column) if value == mask]
+        else:
+            family = [i for i in candidates if column[i] == mask]
+        return mask, family
@@ -2,24 +2,465 @@
 Core game logic for Hangman game
 """
 
+from __future__ import annotations
+
+import os
 import random
-import json
-from pathlib import Path
-from typing import Tuple, List, Dict, Optional
+import sys
+from collections.abc import Mapping, Sequence
+from typing import Tuple, List, Dict, Optional, Iterable
+
+# Kept cheap to import for hangman-cli: json, the word-pack reader and the
+# shuffle bag are imported where they are used
+
+WORDS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "words.json")
+WORDPACK_SUFFIX = ".pack"
+WORDPACK_FILE = os.path.splitext(WORDS_FILE)[0] + WORDPACK_SUFFIX
+
+# Letters a player can guess
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+# JSON words files at least this big are streamed one difficulty at a time
+# instead of parsed whole (see hangman_game.core.jsonstream)
+STREAM_THRESHOLD = 32 * 1024 * 1024
+
+# Default words if the data file doesn't exist or can't be parsed
+DEFAULT_WORDS = {
+    "python": "A popular programming language.",
+    "hangman": "A word guessing game.",
+    "challenge": "A task that tests someone's abilities.",
+    "programming": "The process of writing computer code.",
+    "development": "The process of developing something.",
+    "computer": "An electronic device for processing data.",
+    "algorithm": "A step-by-step procedure for solving a problem.",
+    "database": "An organized collection of data.",
+    "network": "A group of interconnected computers.",
+    "software": "Programs and operating systems used by computers.",
+    "interface": "A point where two systems meet and interact.",
+    "function": "A block of code that performs a specific task.",
+    "variable": "A storage location with a symbolic name.",
+    "debugging": "The process of finding and fixing errors.",
+    "repository": "A storage location for software packages."
+}
+
+# Process-wide corpus cache shared by every HangmanLogic instance:
+# (words file path, difficulty) -> (file signature, words mapping or None)
+_CORPUS_CACHE: Dict[Tuple[str, str], Tuple[Optional[Tuple[int, int]], Optional[Mapping]]] = {}
+
+# Indexable (word, hint) sequences for cached dict corpora:
+# id(words dict) -> (words dict, entries)
+_ENTRY_CACHE: Dict[int, Tuple[Mapping, Sequence]] = {}
+
+
+# Caches of structures built from a corpus (pattern indexes, word
+# families, ...) made by corpus_cache(): id(words mapping) -> (words
+# mapping, value). Entries are dropped along with their corpus.
+_DERIVED_CACHES: List[Dict[int, Tuple[Mapping, object]]] = []
+
+
+def _cache_entries(words: Mapping):
+    """Precompute the indexable entry sequence of a cached dict corpus"""
+    _ENTRY_CACHE[id(words)] = (words, tuple(words.items()))
+
+
+_cache_entries(DEFAULT_WORDS)
+
+
+def _is_wordpack_section(words: Mapping) -> bool:
+    """Check for a word-pack section without importing the reader"""
+    wordpack = sys.modules.get("hangman_game.core.wordpack")
+    return wordpack is not None and isinstance(words, wordpack.WordPackSection)
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Get the (mtime_ns, size) signature of a file, or None if it is missing"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_words_file(path: str, signature: Optional[Tuple[int, int]]):
+    """Parse a words file and store every difficulty section in the cache"""
+    sections = {}
+    if signature is not None:
+        if path.endswith(WORDPACK_SUFFIX):
+            from hangman_game.core.wordpack import WordPack, WordPackError
+            try:
+                sections = WordPack(path).sections
+            except (WordPackError, IOError):
+                sections = {}
+        else:
+            import json
+            try:
+                with open(path, 'r') as f:
+                    sections = json.load(f)
+            except (json.JSONDecodeError, IOError):
+                sections = {}
+            if not isinstance(sections, dict):
+                sections = {}
+    
+    # Drop stale entries for this file before storing the fresh parse
+    _forget_file(path)
+    for difficulty, words in sections.items():
+        if isinstance(words, Mapping):
+            _CORPUS_CACHE[(path, difficulty)] = (signature, words)
+            if not _is_wordpack_section(words):
+                _cache_entries(words)
+
+
+def _read_words_section(path: str, signature: Tuple[int, int], difficulty: str):
+    """Stream one difficulty section of a large JSON words file into the cache"""
+    from hangman_game.core.jsonstream import load_member
+    try:
+        words = load_member(path, difficulty)
+    except (ValueError, IOError):
+        words = None
+    
+    _forget_file(path, keep=signature)
+    _forget_entry((path, difficulty))
+    if isinstance(words, Mapping):
+        _CORPUS_CACHE[(path, difficulty)] = (signature, words)
+        _cache_entries(words)
+
+
+def _forget_entry(key: Tuple[str, str]):
+    """Drop one cached section and its entry sequence"""
+    entry = _CORPUS_CACHE.pop(key, None)
+    if entry is not None and entry[1] is not None:
+        _ENTRY_CACHE.pop(id(entry[1]), None)
+        for cache in _DERIVED_CACHES:
+            cache.pop(id(entry[1]), None)
+
+
+def _forget_file(path: str, keep: Optional[Tuple[int, int]] = None):
+    """Drop a file's cached sections, except those read at signature ``keep``"""
+    for key, (signature, _) in list(_CORPUS_CACHE.items()):
+        if key[0] == path and (keep is None or signature != keep):
+            _forget_entry(key)
+
+
+def _cached_words(path: str, difficulty: str) -> Optional[Mapping]:
+    """Look up a difficulty section, (re)loading the file if it changed"""
+    signature = file_signature(path)
+    entry = _CORPUS_CACHE.get((path, difficulty))
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    
+    if (signature is not None and signature[1] >= STREAM_THRESHOLD
+            and not path.endswith(WORDPACK_SUFFIX)):
+        _read_words_section(path, signature, difficulty)
+    else:
+        _read_words_file(path, signature)
+    entry = _CORPUS_CACHE.get((path, difficulty))
+    if entry is None:
+        # Remember the miss so a missing section isn't re-parsed
+        _CORPUS_CACHE[(path, difficulty)] = (signature, None)
+        return None
+    return entry[1]
+
+
+def _default_words_files() -> Tuple[str, ...]:
+    """
+    The bundled words files to try in order: the word pack, if it has been
+    built and is at least as new as ``words.json``, then ``words.json``
+    """
+    pack = file_signature(WORDPACK_FILE)
+    if pack is None:
+        return (WORDS_FILE,)
+    source = file_signature(WORDS_FILE)
+    if source is not None and source[0] > pack[0]:
+        import warnings
+        warnings.warn(
+            f"{WORDPACK_FILE} is older than {WORDS_FILE}; using the JSON file "
+            "(rebuild the pack with python -m hangman_game.core.wordpack)",
+            stacklevel=3
+        )
+        return (WORDS_FILE,)
+    return (WORDPACK_FILE, WORDS_FILE)
+
+
+def load_words(difficulty: str = "medium", words_file=None) -> Mapping:
+    """
+    Get the words and clues for a difficulty from the shared corpus cache
+    
+    Each words file is parsed at most once per (mtime, size) signature; every
+    caller asking for the same file gets the same cached mapping, so it must
+    be treated as read-only. Files ending in ``.pack`` are memory-mapped word
+    packs (see ``hangman_game.core.wordpack``). Without an explicit file the
+    bundled ``words.pack`` is used if it has been built and ``words.json``
+    hasn't been modified since, falling back to ``words.json``.
+    
+    Args:
+        difficulty: Game difficulty level (easy, medium, hard)
+        words_file: Path to a words JSON file or word pack
+        
+    Returns:
+        Mapping of words to their clues
+    """
+    if words_file is not None:
+        candidates = (os.fspath(words_file),)
+    else:
+        candidates = _default_words_files()
+    
+    for path in candidates:
+        words = _cached_words(path, difficulty)
+        if words is not None:
+            return words
+    return DEFAULT_WORDS
+
+
+def word_entries(words: Mapping) -> Sequence:
+    """
+    Get an indexable sequence of (word, hint) pairs for a corpus
+    
+    Cached corpora and word packs answer in O(1); any other mapping is
+    copied into a new tuple.
+    
+    Args:
+        words: Mapping of words to clues, as returned by ``load_words``
+        
+    Returns:
+        Sequence of (word, hint) tuples
+    """
+    if _is_wordpack_section(words):
+        return words.entries
+    cached = _ENTRY_CACHE.get(id(words))
+    if cached is not None and cached[0] is words:
+        return cached[1]
+    return tuple(words.items())
+
+
+def words_by_length(words: Iterable[str]) -> Dict[int, List[str]]:
+    """
+    Group the distinct lower-cased words of a corpus by length
+    
+    Args:
+        words: Words of a corpus (e.g. a ``load_words`` mapping)
+        
+    Returns:
+        Dict of word length to the sorted words of that length
+    """
+    by_length: Dict[int, List[str]] = {}
+    for word in sorted({word.lower() for word in words}):
+        if word:
+            by_length.setdefault(len(word), []).append(word)
+    return by_length
+
+
+def corpus_cache() -> Dict[int, Tuple[Mapping, object]]:
+    """
+    Create a cache for structures built from corpora, for ``cached_for_corpus``
+    
+    The cache forgets a corpus when it leaves the corpus cache (its file
+    changed or ``clear_word_cache`` was called), so replaced corpora don't
+    accumulate.
+    """
+    cache: Dict[int, Tuple[Mapping, object]] = {}
+    _DERIVED_CACHES.append(cache)
+    return cache
+
+
+def cached_for_corpus(cache: Dict[int, Tuple[Mapping, object]], words: Mapping, build):
+    """
+    Get ``build(words)``, reusing the value cached for this corpus
+    
+    Only corpora held by the corpus cache (and ``DEFAULT_WORDS``) are
+    cached; for any other mapping the value is built on every call.
+    
+    Args:
+        cache: Cache made by ``corpus_cache``
+        words: Mapping of words to clues
+        build: Function building the value from the mapping
+    """
+    cached = cache.get(id(words))
+    if cached is not None and cached[0] is words:
+        return cached[1]
+    value = build(words)
+    if words is DEFAULT_WORDS or any(entry[1] is words for entry in _CORPUS_CACHE.values()):
+        cache[id(words)] = (words, value)
+    return value
+
+
+def preload_words(difficulties: Iterable[str] = ("easy", "medium", "hard"), words_file=None):
+    """
+    Warm the shared corpus cache, e.g. once at application startup
+    
+    Args:
+        difficulties: Difficulty levels to load
+        words_file: Path to a words JSON file or word pack
+    """
+    for difficulty in difficulties:
+        load_words(difficulty, words_file)
+
+
+def clear_word_cache():
+    """Drop every cached corpus so the next lookup re-reads from disk"""
+    _CORPUS_CACHE.clear()
+    _ENTRY_CACHE.clear()
+    for cache in _DERIVED_CACHES:
+        cache.clear()
+    _cache_entries(DEFAULT_WORDS)
+
+
+# Bit assigned to each character; a-z are fixed, and other characters of
+# secret words (accented letters, digits in phrases, ...) are assigned when
+# a word containing them is played. Guesses never add bits, so untrusted
+# input can't grow the table.
+_LETTER_BITS: Dict[str, int] = {
+    letter: 1 << index for index, letter in enumerate(ALPHABET)
+}
+# Character of each bit position
+_BIT_LETTERS: List[str] = list(_LETTER_BITS)
+# Bits of characters outside a-z: they may have had no bit when guessed
+OTHER_LETTERS = ~((1 << len(ALPHABET)) - 1)
+
+
+def letter_bit(letter: str) -> int:
+    """
+    Get the bitmask bit representing a single character
+    
+    Characters that appear in no word played so far get 0: they can't be
+    in the word, so a guess of one is a plain miss. As 0 can't be recorded
+    in a guessed-letters mask, callers detect repeats of such a guess
+    (see ``OTHER_LETTERS``) some other way.
+    """
+    return _LETTER_BITS.get(letter, 0)
+
+
+def letters_mask(letters: Iterable[str]) -> int:
+    """Get the bitmask of every character of a secret word, assigning bits to new characters"""
+    mask = 0
+    for letter in letters:
+        bit = _LETTER_BITS.get(letter)
+        if bit is None:
+            bit = _LETTER_BITS[letter] = 1 << len(_BIT_LETTERS)
+            _BIT_LETTERS.append(letter)
+        mask |= bit
+    return mask
+
+
+def mask_letters(mask: int) -> List[str]:
+    """Get the characters set in a bitmask, in bit order (a-z first)"""
+    letters = []
+    while mask:
+        low = mask & -mask
+        letters.append(_BIT_LETTERS[low.bit_length() - 1])
+        mask ^= low
+    return letters
+
+
+# Outcomes of a single guess, shared by every game engine
+ALREADY_GUESSED, CORRECT, WON, INCORRECT, LOST = range(5)
+
+MAX_INCORRECT_GUESSES = {
+    "easy": 8,
+    "medium": 6,
+    "hard": 4
+}
+
+
+def judge_guess(word_mask: int, guessed_mask: int, bit: int,
+                incorrect_guesses: int, max_incorrect_guesses: int) -> int:
+    """
+    Apply the Hangman rules to one guess without changing any state
+    
+    Args:
+        word_mask: Bitmask of the letters in the word
+        guessed_mask: Bitmask of the letters guessed so far
+        bit: Bit of the guessed letter
+        incorrect_guesses: Wrong guesses made so far
+        max_incorrect_guesses: Wrong guesses allowed
+        
+    Returns:
+        One of ALREADY_GUESSED, CORRECT, WON, INCORRECT or LOST
+    """
+    if guessed_mask & bit:
+        return ALREADY_GUESSED
+    if word_mask & bit:
+        return WON if word_mask & ~(guessed_mask | bit) == 0 else CORRECT
+    return LOST if incorrect_guesses + 1 >= max_incorrect_guesses else INCORRECT
+
+
+def guess_result(outcome: int, word: str) -> Dict:
+    """Build the result dict that ``make_guess`` returns for an outcome"""
+    if outcome == ALREADY_GUESSED:
+        return {
+            "valid": False,
+            "message": "Already guessed",
+            "correct": False
+        }
+    if outcome == WON:
+        return {
+            "valid": True,
+            "correct": True,
+            "game_won": True,
+            "message": f"Congratulations! You've guessed the word: {word}"
+        }
+    if outcome == CORRECT:
+        return {
+            "valid": True,
+            "correct": True,
+            "game_won": False
+        }
+    if outcome == LOST:
+        return {
+            "valid": True,
+            "correct": False,
+            "game_lost": True,
+            "message": f"Game Over! The word was: {word}"
+        }
+    return {
+        "valid": True,
+        "correct": False,
+        "game_lost": False
+    }
 
 
 class HangmanLogic:
     """Core Hangman game logic without UI dependencies"""
     
-    def __init__(self, difficulty: str = "medium"):
+    # Empty-word defaults, replaced by the property setters in __init__
+    _word = ""
+    _word_mask = 0
+    _positions: Dict[str, List[int]] = {}
+    _guessed_letters: Tuple[str, ...] = ()
+    _guessed_mask = 0
+    # Evil mode: indices of the words still possible (None means every word
+    # of the length being played)
+    _family: Optional[List[int]] = None
+    
+    def __init__(self, difficulty: str = "medium", words_file=None, no_repeat: bool = False,
+                 percentiles: Optional[Tuple[float, float]] = None, score_index=None,
+                 evil: bool = False):
         """
         Initialize the game logic
         
         Args:
             difficulty: Game difficulty level (easy, medium, hard)
+            words_file: Optional words JSON file or word pack to play from
+            no_repeat: Don't repeat a word until every word has been played
+            percentiles: Draw words from this (low, high) range of difficulty
+                score percentiles (0-100) instead of the difficulty's words
+            score_index: Score index file for ``percentiles`` (see
+                ``hangman_game.core.scoring``)
+            evil: Adversarial mode: the word isn't fixed, and each guess
+                keeps the largest family of words consistent with the
+                answers so far (see ``hangman_game.core.evil``)
         """
         self.difficulty = difficulty
+        self.words_file = words_file
+        self.no_repeat = no_repeat
+        self.percentiles = percentiles
+        self.score_index = score_index
+        self.evil = evil
+        self._word_bag = None
+        # Score index loaded on the first game in ``percentiles`` mode
+        self._scores = None
         self.words_with_clues = self._load_words()
+        # Corpora of every difficulty this engine has played, kept for reset()
+        self._corpora: Dict[str, Mapping] = {difficulty: self.words_with_clues}
         self.word_to_guess = ""
         self.hint = ""
         self.guessed_letters = []
@@ -27,49 +468,59 @@ class HangmanLogic:
         self.max_incorrect_guesses = self._get_max_incorrect_guesses()
         self.game_won = False
         self.game_lost = False
+    
+    @property
+    def word_to_guess(self) -> str:
+        """The secret word"""
+        return self._word
+    
+    @word_to_guess.setter
+    def word_to_guess(self, word: str):
+        positions: Dict[str, List[int]] = {}
+        for index, letter in enumerate(word):
+            positions.setdefault(letter, []).append(index)
+        self._word = word
+        self._word_mask = letters_mask(positions)
+        self._positions = positions
+        self._reset_reveal()
+    
+    @property
+    def guessed_letters(self) -> List[str]:
+        """Letters guessed so far, in guess order (treat as read-only)"""
+        return self._guessed_letters
+    
+    @guessed_letters.setter
+    def guessed_letters(self, letters: List[str]):
+        self._guessed_letters = list(letters)
+        mask = 0
+        for letter in self._guessed_letters:
+            mask |= letter_bit(letter)
+        self._guessed_mask = mask
+        self._reset_reveal()
+    
+    def _reset_reveal(self):
+        """Rebuild the reveal buffer from the word and every guessed letter"""
+        self._reveal = ["_"] * len(self._word)
+        self._display = None
+        for letter in self._guessed_letters:
+            self._reveal_letter(letter)
+    
+    def _reveal_letter(self, letter: str):
+        """Uncover every occurrence of a letter in the reveal buffer"""
+        positions = self._positions.get(letter)
+        if positions:
+            reveal = self._reveal
+            for index in positions:
+                reveal[index] = letter
+            self._display = None
         
     def _get_max_incorrect_guesses(self) -> int:
         """Get maximum incorrect guesses based on difficulty"""
-        difficulty_map = {
-            "easy": 8,
-            "medium": 6,
-            "hard": 4
-        }
-        return difficulty_map.get(self.difficulty, 6)
+        return MAX_INCORRECT_GUESSES.get(self.difficulty, 6)
     
-    def _load_words(self) -> Dict[str, str]:
-        """Load words and clues from data file"""
-        data_dir = Path(__file__).parent.parent / "data"
-        words_file = data_dir / "words.json"
-        
-        # Default words if file doesn't exist
-        default_words = {
-            "python": "A popular programming language.",
-            "hangman": "A word guessing game.",
-            "challenge": "A task that tests someone's abilities.",
-            "programming": "The process of writing computer code.",
-            "development": "The process of developing something.",
-            "computer": "An electronic device for processing data.",
-            "algorithm": "A step-by-step procedure for solving a problem.",
-            "database": "An organized collection of data.",
-            "network": "A group of interconnected computers.",
-            "software": "Programs and operating systems used by computers.",
-            "interface": "A point where two systems meet and interact.",
-            "function": "A block of code that performs a specific task.",
-            "variable": "A storage location with a symbolic name.",
-            "debugging": "The process of finding and fixing errors.",
-            "repository": "A storage location for software packages."
-        }
-        
-        if words_file.exists():
-            try:
-                with open(words_file, 'r') as f:
-                    words_data = json.load(f)
-                    return words_data.get(self.difficulty, default_words)
-            except (json.JSONDecodeError, IOError):
-                return default_words
-        
-        return default_words
+    def _load_words(self) -> Mapping:
+        """Load words and clues for this difficulty from the shared corpus cache"""
+        return load_words(self.difficulty, self.words_file)
     
     def start_new_game(self) -> Tuple[str, str]:
         """
@@ -79,17 +530,80 @@ class HangmanLogic:
             Tuple of (word, hint)
         """
         self.word_to_guess, self.hint = self._get_random_word_with_hint()
+        if self.evil:
+            # Only the length is chosen; the drawn word stands in for the
+            # family until a guess narrows it
+            self._family = None
+            self.hint = f"Any {len(self.word_to_guess)}-letter word - it changes as you guess!"
         self.guessed_letters = []
         self.incorrect_guesses = 0
         self.game_won = False
         self.game_lost = False
         return self.word_to_guess, self.hint
     
+    def preload(self, difficulties: Iterable[str] = ("easy", "medium", "hard")):
+        """
+        Load the corpora of other difficulties now, so that ``reset`` can
+        switch to them without reading the words file
+        
+        Args:
+            difficulties: Difficulty levels to keep resident
+        """
+        for difficulty in difficulties:
+            if difficulty not in self._corpora:
+                self._corpora[difficulty] = load_words(difficulty, self.words_file)
+    
+    def reset(self, difficulty: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Start a new game on this engine, optionally at another difficulty
+        
+        Unlike constructing a new ``HangmanLogic``, this reuses the corpora
+        (and score index) already loaded by this engine (see ``preload``),
+        so it does no file I/O; an edited words or score file is picked up
+        by a new engine.
+        
+        Args:
+            difficulty: Difficulty for the new game (default: keep the current one)
+            
+        Returns:
+            Tuple of (word, hint)
+        """
+        if difficulty is not None and difficulty != self.difficulty:
+            self.difficulty = difficulty
+            self.max_incorrect_guesses = self._get_max_incorrect_guesses()
+            self.preload((difficulty,))
+            self.words_with_clues = self._corpora[difficulty]
+            self._word_bag = None
+        return self.start_new_game()
+    
     def _get_random_word_with_hint(self) -> Tuple[str, str]:
         """Get a random word with its hint"""
-        word, hint = random.choice(list(self.words_with_clues.items()))
+        if self.percentiles is not None:
+            # The score index is sorted, so a percentile range is a slice
+            index = self._scores
+            if index is None:
+                from hangman_game.core.scoring import load_score_index
+                index = self._scores = load_score_index(self.score_index)
+            start, end = index.percentile_span(*self.percentiles)
+            _, word, hint = index.entries[start + self._draw_index(end - start)]
+            return word, hint
+        
+        entries = word_entries(self.words_with_clues)
+        word, hint = entries[self._draw_index(len(entries))]
         return word.lower(), hint
     
+    def _draw_index(self, size: int) -> int:
+        """Pick the index of the next word out of ``size`` candidates"""
+        if size <= 0:
+            # An empty corpus section or score index (range)
+            raise ValueError(f"No {self.difficulty} words to choose from")
+        if self.no_repeat:
+            from hangman_game.core.sampling import ShuffleBag
+            if self._word_bag is None or self._word_bag.size != size:
+                self._word_bag = ShuffleBag(size)
+            return self._word_bag.draw()
+        return random.randrange(size)
+    
     def make_guess(self, letter: str) -> Dict:
         """
         Process a letter guess
@@ -101,59 +615,68 @@ class HangmanLogic:
             Dict with result information
         """
         letter = letter.lower()
+        bit = letter_bit(letter)
+        if (bit == 0 or bit & OTHER_LETTERS) and letter in self._guessed_letters:
+            return guess_result(ALREADY_GUESSED, self._word)
+        if self.evil and not self._guessed_mask & bit and not (self.game_won or self.game_lost):
+            self._narrow_family(letter)
+        outcome = judge_guess(
+            self._word_mask, self._guessed_mask, bit,
+            self.incorrect_guesses, self.max_incorrect_guesses
+        )
+        if outcome == ALREADY_GUESSED:
+            return guess_result(outcome, self._word)
         
-        # Check if already guessed
-        if letter in self.guessed_letters:
-            return {
-                "valid": False,
-                "message": "Already guessed",
-                "correct": False
-            }
+        self._guessed_letters.append(letter)
+        self._guessed_mask |= bit
         
-        self.guessed_letters.append(letter)
-        
-        # Check if letter is in word
-        if letter in self.word_to_guess:
-            # Check if word is complete
-            if self.is_word_complete():
+        if outcome == CORRECT or outcome == WON:
+            self._reveal_letter(letter)
+            if outcome == WON:
                 self.game_won = True
-                return {
-                    "valid": True,
-                    "correct": True,
-                    "game_won": True,
-                    "message": f"Congratulations! You've guessed the word: {self.word_to_guess}"
-                }
-            return {
-                "valid": True,
-                "correct": True,
-                "game_won": False
-            }
         else:
             self.incorrect_guesses += 1
-            if self.incorrect_guesses >= self.max_incorrect_guesses:
+            if outcome == LOST:
                 self.game_lost = True
-                return {
-                    "valid": True,
-                    "correct": False,
-                    "game_lost": True,
-                    "message": f"Game Over! The word was: {self.word_to_guess}"
-                }
-            return {
-                "valid": True,
-                "correct": False,
-                "game_lost": False
-            }
+        return guess_result(outcome, self._word)
+    
+    def _narrow_family(self, letter: str):
+        """Keep the largest word family for a guess (evil mode)"""
+        from hangman_game.core.evil import WordFamilies
+        families = WordFamilies.for_words(self.words_with_clues)
+        length = len(self._word)
+        _, family = families.largest_family(length, self._family, letter)
+        if not family:
+            # The stand-in word isn't in the corpus (e.g. drawn by score);
+            # play it as a fixed word
+            return
+        self._family = family
+        word = families.group(length).words[family[0]]
+        if word != self._word:
+            # Same reveal pattern for every guess so far, so the display and
+            # guessed letters carry over
+            self.word_to_guess = word
     
     def get_display_word(self) -> str:
         """Get the current display state of the word"""
-        return " ".join([
-            letter if letter in self.guessed_letters else "_"
-            for letter in self.word_to_guess
-        ])
+        display = self._display
+        if display is None:
+            # Re-render only after a reveal; otherwise reuse the cached string
+            display = self._display = " ".join(self._reveal)
+        return display
+    
+    def matching_words(self) -> List[str]:
+        """
+        Get the corpus words still consistent with the display word and the
+        wrong guesses (the corpus is indexed on first use)
+        """
+        from hangman_game.core.pattern_index import PatternIndex
+        wrong = [letter for letter in self._guessed_letters if letter not in self._positions]
+        return PatternIndex.for_words(self.words_with_clues).candidates(self.get_display_word(), wrong)
     
     def is_word_complete(self) -> bool:
         """Check if the word has been completely guessed"""
-        return all(letter in self.guessed_letters for letter in self.word_to_guess)
+        return self._word_mask & ~self._guessed_mask == 0
     
     def get_game_state(self) -> Dict:
         """Get current game state"""
@@ -0,0 +1,182 @@
+"""
+Streaming lookup of one member of a large top-level JSON object
+
+``json.load`` builds every difficulty of a words file before the caller
+keeps one. ``load_member`` instead scans the file in fixed-size chunks,
+skipping the other members' values without parsing them (only brackets are
+counted, with strings skipped whole by a regular expression), records the byte span of the wanted value
+and parses just that span. Peak memory is the chunk plus the selected
+section, whatever the size of the file.
+"""
+
+import json
+import re
+from typing import Any, BinaryIO, Optional, Tuple
+
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+# Rest of a string after its opening quote, up to and including the closing one
+_STRING_REST = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+# Run of anything but brackets, with strings (which may contain brackets)
+# consumed whole; stops at a bracket or at a string cut off by the buffer end
+_SKIP = re.compile(rb'(?:[^"{}\[\]]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+# Rest of a number, true, false or null
+_SCALAR = re.compile(rb"[^,}\] \t\r\n]*")
+
+
+class _Reader:
+    """Buffered binary reader that knows the file offset of its position"""
+
+    def __init__(self, f: BinaryIO, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = b""
+        self.pos = 0
+        self.base = 0  # file offset of buf[0]
+        self.eof = False
+
+    @property
+    def offset(self) -> int:
+        return self.base + self.pos
+
+    def fill(self) -> bool:
+        """Read another chunk, dropping what has been consumed"""
+        if self.eof:
+            return False
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.base += self.pos
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def match(self, pattern) -> Optional[bytes]:
+        """Match a pattern at the position, reading more while it runs into the end"""
+        while True:
+            m = pattern.match(self.buf, self.pos)
+            if m is not None and (m.end() < len(self.buf) or self.eof):
+                self.pos = m.end()
+                return m.group()
+            if not self.fill():
+                if m is None:
+                    return None
+                self.pos = m.end()
+                return m.group()
+
+    def peek(self) -> bytes:
+        """Skip whitespace and return the next byte (b"" at end of file)"""
+        self.match(_WHITESPACE)
+        if self.pos >= len(self.buf) and not self.fill():
+            return b""
+        return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, char: bytes):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char.decode()!r} at byte {self.offset}")
+        self.pos += 1
+
+    def string(self) -> bytes:
+        """Consume a string (opening quote at the position) and return it with quotes"""
+        start = self.pos
+        self.pos += 1
+        while True:
+            m = _STRING_REST.match(self.buf, self.pos)
+            if m is not None:
+                self.pos = m.end()
+                return self.buf[start:self.pos]
+            # The closing quote isn't buffered yet; keep the partial string
+            # (fill() drops everything before pos)
+            self.pos = start
+            if not self.fill():
+                raise ValueError("Unterminated string")
+            start, self.pos = 0, 1
+
+    def skip_value(self):
+        """Consume one value without building it"""
+        char = self.peek()
+        if char == b'"':
+            self.string()
+        elif char in (b"{", b"["):
+            depth = 0
+            while True:
+                # One regex match skips all the strings and scalars up to the
+                # next bracket, so only brackets are handled in Python
+                self.pos = _SKIP.match(self.buf, self.pos).end()
+                token = self.buf[self.pos:self.pos + 1]
+                if token in (b"", b'"'):
+                    # End of buffer, possibly inside a string
+                    if not self.fill():
+                        raise ValueError("Unterminated object")
+                    continue
+                self.pos += 1
+                depth += 1 if token in (b"{", b"[") else -1
+                if depth == 0:
+                    return
+        elif char:
+            if not self.match(_SCALAR):
+                raise ValueError(f"Unexpected byte at {self.offset}")
+        else:
+            raise ValueError("Unexpected end of file")
+
+
+def find_member(f: BinaryIO, key: str, chunk_size: int = CHUNK_SIZE) -> Optional[Tuple[int, int]]:
+    """
+    Find the byte span of a member's value in a top-level JSON object
+
+    Args:
+        f: File opened in binary mode, positioned at the start
+        key: Member name
+        chunk_size: Bytes read at a time
+
+    Returns:
+        (start, end) file offsets of the value, or None if the key is absent
+    """
+    reader = _Reader(f, chunk_size)
+    reader.expect(b"{")
+    if reader.peek() == b"}":
+        return None
+    span = None
+    while True:
+        if reader.peek() != b'"':
+            raise ValueError(f"Expected a member name at byte {reader.offset}")
+        name = json.loads(reader.string())
+        reader.expect(b":")
+        reader.peek()
+        start = reader.offset
+        reader.skip_value()
+        if name == key:
+            # Later duplicates win, as with json.load
+            span = (start, reader.offset)
+        char = reader.peek()
+        reader.pos += 1
+        if char == b"}":
+            return span
+        if char != b",":
+            raise ValueError(f"Expected ',' or '}}' at byte {reader.offset - 1}")
+
+
+def load_member(path, key: str, chunk_size: int = CHUNK_SIZE) -> Any:
+    """
+    Parse one member of a JSON file's top-level object
+
+    Args:
+        path: JSON file whose top level is an object
+        key: Member to load (e.g. a difficulty)
+        chunk_size: Bytes read at a time while scanning
+
+    Returns:
+        The parsed value, or None if the key is absent
+
+    Raises:
+        ValueError: If the file isn't a well-formed JSON object
+        OSError: If the file can't be read
+    """
+    with open(path, "rb") as f:
+        span = find_member(f, key, chunk_size)
+        if span is None:
+            return None
+        f.seek(span[0])
+        return json.loads(f.read(span[1] - span[0]))
@@ -0,0 +1,191 @@
+"""
+Opt-in call metrics for the game's hot paths
+
+``enable()`` replaces the instrumented methods of ``HangmanLogic`` and
+``Statistics``, and the corpus loading functions of ``game_logic``, with
+timing wrappers; ``disable()`` puts the original functions back. While
+disabled nothing is wrapped, so the methods run exactly as they would
+without this module.
+
+    from hangman_game.core import metrics
+
+    metrics.enable()
+    ...play...
+    print(metrics.get_metrics()["HangmanLogic.make_guess"])
+
+Setting ``HANGMAN_METRICS=1`` makes ``hangman`` and ``hangman-cli`` enable
+metrics at startup and print them to stderr at exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import importlib
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Optional, Tuple
+
+# (module, class, method) triples that enable() wraps; a class of None
+# wraps a module-level function, which is only timed where it is looked up
+# through its module (callers that imported it by name are not). The
+# modules are only imported when metrics are enabled.
+TARGETS: Tuple[Tuple[str, Optional[str], str], ...] = (
+    ("hangman_game.core.game_logic", None, "load_words"),
+    ("hangman_game.core.game_logic", None, "_read_words_file"),
+    ("hangman_game.core.game_logic", None, "_read_words_section"),
+    ("hangman_game.core.game_logic", "HangmanLogic", "_load_words"),
+    ("hangman_game.core.game_logic", "HangmanLogic", "start_new_game"),
+    ("hangman_game.core.game_logic", "HangmanLogic", "make_guess"),
+    ("hangman_game.core.game_logic", "HangmanLogic", "get_display_word"),
+    ("hangman_game.core.statistics", "Statistics", "flush"),
+    ("hangman_game.core.statistics", "Statistics", "_append_events"),
+    ("hangman_game.core.statistics", "Statistics", "_save_stats"),
+)
+
+# Upper bounds of the latency histogram buckets, in seconds; the last
+# bucket counts everything slower
+BUCKETS = (1e-6, 2e-6, 5e-6, 1e-5, 2e-5, 5e-5, 1e-4, 2e-4, 5e-4,
+           1e-3, 2e-3, 5e-3, 1e-2, 1e-1, 1.0)
+
+_lock = threading.Lock()
+_originals: Dict[Tuple[object, str], object] = {}
+_metrics: Dict[str, "_Metric"] = {}
+_report_registered = False
+
+
+def _bucket_label(index: int) -> str:
+    if index == len(BUCKETS):
+        return f">{_format_seconds(BUCKETS[-1])}"
+    return f"<={_format_seconds(BUCKETS[index])}"
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.3g}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.3g}ms"
+    return f"{seconds * 1e6:.3g}us"
+
+
+class _Metric:
+    """Call count, total and histogram of one method's latency"""
+
+    __slots__ = ("calls", "total", "max", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * (len(BUCKETS) + 1)
+
+    def add(self, seconds: float):
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.histogram[bisect_left(BUCKETS, seconds)] += 1
+
+    def as_dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "total_seconds": self.total,
+            "mean_seconds": self.total / self.calls if self.calls else 0.0,
+            "max_seconds": self.max,
+            "histogram": {
+                _bucket_label(index): count
+                for index, count in enumerate(self.histogram) if count
+            },
+        }
+
+
+def _wrap(function, metric: _Metric):
+    """Build a wrapper that times every call of a function"""
+    perf_counter = time.perf_counter
+
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            with _lock:
+                metric.add(elapsed)
+    return timed
+
+
+def enable():
+    """Start recording metrics for every method in TARGETS"""
+    with _lock:
+        for module, class_name, name in TARGETS:
+            owner = importlib.import_module(module)
+            if class_name is None:
+                key = f"{module.rpartition('.')[2]}.{name}"
+            else:
+                owner = getattr(owner, class_name)
+                key = f"{class_name}.{name}"
+            if (owner, name) in _originals:
+                continue
+            metric = _metrics.setdefault(key, _Metric())
+            original = owner.__dict__[name]
+            _originals[(owner, name)] = original
+            setattr(owner, name, _wrap(original, metric))
+
+
+def disable():
+    """Stop recording and restore the original methods (metrics are kept)"""
+    with _lock:
+        for (owner, name), original in _originals.items():
+            setattr(owner, name, original)
+        _originals.clear()
+
+
+def is_enabled() -> bool:
+    """Check whether metrics are being recorded"""
+    return bool(_originals)
+
+
+def get_metrics() -> Dict[str, Dict]:
+    """
+    Get the metrics recorded so far
+
+    Returns:
+        Dict keyed by "Class.method" (or "module.function") with calls, total_seconds,
+        mean_seconds, max_seconds and a histogram of call counts keyed by
+        latency bucket ("<=5us", ..., ">1s")
+    """
+    with _lock:
+        return {key: metric.as_dict() for key, metric in _metrics.items()}
+
+
+def reset():
+    """Clear every recorded metric"""
+    with _lock:
+        for metric in _metrics.values():
+            metric.__init__()
+
+
+def format_metrics(metrics: Dict[str, Dict]) -> str:
+    """Render ``get_metrics()`` output as a table"""
+    lines = [f"{'method':30} {'calls':>8} {'total':>10} {'mean':>10} {'max':>10}"]
+    for key, metric in sorted(metrics.items()):
+        lines.append(
+            f"{key:30} {metric['calls']:>8} {_format_seconds(metric['total_seconds']):>10} "
+            f"{_format_seconds(metric['mean_seconds']):>10} {_format_seconds(metric['max_seconds']):>10}"
+        )
+    return "\n".join(lines)
+
+
+def enable_from_env():
+    """Enable metrics and report them at exit if HANGMAN_METRICS is set"""
+    global _report_registered
+    if os.environ.get("HANGMAN_METRICS", "") in ("", "0"):
+        return
+    enable()
+    if not _report_registered:
+        _report_registered = True
+        atexit.register(lambda: print(format_metrics(get_metrics()), file=sys.stderr))
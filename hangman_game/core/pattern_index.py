@@ -0,0 +1,136 @@
+"""
+Bitset index answering "which words match this display word" queries
+
+Words are grouped by length. For every length the index keeps one integer
+bitset per (position, letter) pair, with bit i set when word i has that
+letter at that position, and one per letter for the words containing it
+anywhere. A query ANDs the bitsets of the revealed positions, clears the
+words that have a revealed letter in a hidden position (Hangman reveals
+every occurrence) and clears the words containing a wrong guess, so its
+cost depends on the number of guesses, not on scanning every word.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from hangman_game.core.game_logic import cached_for_corpus, corpus_cache, words_by_length
+
+# Indexes of cached corpora, dropped when the corpus is reloaded
+_INDEXES = corpus_cache()
+
+
+def _bitset(indices: List[int], size: int) -> int:
+    """Build an integer with the given bits set"""
+    data = bytearray((size + 7) // 8)
+    for i in indices:
+        data[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(data, "little")
+
+
+def _normalize(pattern: str) -> str:
+    """Accept ``get_display_word()`` output ("p y _ _") as well as "py__" """
+    if len(pattern) > 1 and pattern[1::2].strip() == "":
+        return pattern[::2]
+    return pattern
+
+
+class _LengthBucket:
+    """Words of one length with their position and letter bitsets"""
+
+    __slots__ = ("words", "all", "at", "contains")
+
+    def __init__(self, words: List[str]):
+        self.words = words
+        self.all = (1 << len(words)) - 1
+        at: Dict[Tuple[int, str], List[int]] = {}
+        contains: Dict[str, List[int]] = {}
+        for i, word in enumerate(words):
+            for position, letter in enumerate(word):
+                at.setdefault((position, letter), []).append(i)
+            for letter in set(word):
+                contains.setdefault(letter, []).append(i)
+        size = len(words)
+        self.at = {key: _bitset(indices, size) for key, indices in at.items()}
+        self.contains = {letter: _bitset(indices, size) for letter, indices in contains.items()}
+
+
+class PatternIndex:
+    """Find the words matching a partly revealed word and wrong guesses"""
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Build the index
+
+        Args:
+            words: Dictionary words (lower-cased, duplicates removed)
+        """
+        by_length = words_by_length(words)
+        self.buckets = {length: _LengthBucket(words) for length, words in by_length.items()}
+
+    @classmethod
+    def for_words(cls, words: Mapping) -> "PatternIndex":
+        """
+        Get the index of a corpus mapping, building it on first use
+
+        Each corpus returned by ``load_words`` is indexed once, and its index
+        is dropped when the corpus is reloaded; other mappings are indexed
+        on every call.
+        """
+        return cached_for_corpus(_INDEXES, words, cls)
+
+    def match_mask(self, pattern: str, wrong: Iterable[str] = ()) -> Tuple[Optional[_LengthBucket], int]:
+        """
+        Get the bitset of matching words
+
+        Args:
+            pattern: Word with unrevealed letters as "_", or display-word form
+            wrong: Letters guessed that are not in the word
+
+        Returns:
+            Tuple of (length bucket or None, bitset over the bucket's words)
+        """
+        pattern = _normalize(pattern.lower())
+        bucket = self.buckets.get(len(pattern))
+        if bucket is None:
+            return None, 0
+
+        mask = bucket.all
+        revealed = set()
+        for position, letter in enumerate(pattern):
+            if letter != "_":
+                mask &= bucket.at.get((position, letter), 0)
+                revealed.add(letter)
+        if mask:
+            for position, letter in enumerate(pattern):
+                if letter == "_":
+                    for shown in revealed:
+                        mask &= ~bucket.at.get((position, shown), 0)
+            for letter in wrong:
+                mask &= ~bucket.contains.get(letter.lower(), 0)
+        return bucket, mask
+
+    def count(self, pattern: str, wrong: Iterable[str] = ()) -> int:
+        """Count the words matching a pattern and wrong guesses"""
+        return bin(self.match_mask(pattern, wrong)[1]).count("1")
+
+    def candidates(self, pattern: str, wrong: Iterable[str] = ()) -> List[str]:
+        """
+        List the words matching a pattern and wrong guesses
+
+        Args:
+            pattern: Word with unrevealed letters as "_", or display-word form
+            wrong: Letters guessed that are not in the word
+
+        Returns:
+            Matching words in alphabetical order
+        """
+        bucket, mask = self.match_mask(pattern, wrong)
+        if not mask:
+            return []
+        words: Sequence[str] = bucket.words
+        bits = bin(mask)[:1:-1]  # least significant bit first
+        found = []
+        i = bits.find("1")
+        while i >= 0:
+            found.append(words[i])
+            i = bits.find("1", i + 1)
+        return found
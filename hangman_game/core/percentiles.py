@@ -0,0 +1,16 @@
+"""
+Percentiles of measured samples (win rates, latencies)
+"""
+
+from typing import Sequence
+
+
+def percentile(ordered: Sequence, fraction: float):
+    """
+    Nearest-rank percentile of already sorted, non-empty samples
+
+    Args:
+        ordered: Samples in ascending order
+        fraction: Percentile as a fraction, e.g. 0.99
+    """
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
@@ -0,0 +1,56 @@
+"""
+Word sampling helpers for Hangman game
+"""
+
+import random
+from typing import Dict
+
+
+class ShuffleBag:
+    """
+    Draw indices from range(size) without repeats until all have been seen
+
+    The permutation is produced lazily with a sparse Fisher-Yates shuffle:
+    only positions that have been swapped are stored, so each draw is O(1)
+    and a bag over millions of words costs nothing until it is used. Once
+    every index has been drawn a fresh permutation starts.
+    """
+
+    def __init__(self, size: int, rng=None):
+        """
+        Initialize the bag
+
+        Args:
+            size: Number of indices to shuffle
+            rng: Random source with ``randrange`` (defaults to ``random``)
+        """
+        if size <= 0:
+            raise ValueError("ShuffleBag needs at least one item")
+        self.size = size
+        self._rng = rng or random
+        self._swaps: Dict[int, int] = {}
+        self._drawn = 0
+
+    @property
+    def remaining(self) -> int:
+        """Number of indices left before the bag is refilled"""
+        return self.size - self._drawn
+
+    def draw(self) -> int:
+        """Draw the next index of the current permutation"""
+        if self._drawn >= self.size:
+            self._swaps.clear()
+            self._drawn = 0
+
+        swaps = self._swaps
+        head = self._drawn
+        pick = self._rng.randrange(head, self.size)
+        # The head slot is never read again, so its entry can be dropped
+        head_value = swaps.pop(head, head)
+        if pick == head:
+            index = head_value
+        else:
+            index = swaps.get(pick, pick)
+            swaps[pick] = head_value
+        self._drawn += 1
+        return index
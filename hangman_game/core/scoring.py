@@ -0,0 +1,259 @@
+"""
+Word difficulty scoring and the sorted score index
+
+Every word of a dictionary gets a difficulty score from features that make
+Hangman words hard to guess:
+
+- letter rarity: mean surprisal (bits) of the word's distinct letters,
+  where a letter's probability is the share of dictionary words holding it
+- few distinct letters: fewer possible hits per guess (``jazz``, ``fuzz``)
+- short length: short words reveal little about their remaining letters
+- optionally, the wrong guesses the corpus ``Solver`` makes before solving
+  the word, which measures the above directly
+
+Higher scores are harder. The scores are written to an index sorted by
+score, so a percentile or score range is a contiguous slice found by
+bisection, and any dictionary can be bucketed into difficulties by
+percentile::
+
+    python -m hangman_game.core.scoring words.json scores.json --solver
+    python -m hangman_game.core.scoring words.json scores.json --buckets bucketed.json
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from hangman_game.core.game_logic import WORDS_FILE, file_signature, load_words
+
+SCORES_FILE = os.path.join(os.path.dirname(WORDS_FILE), "scores.json")
+INDEX_VERSION = 1
+
+# Weights of the heuristic features; with the solver, each wrong guess it
+# needs adds SOLVER_WEIGHT
+UNIQUE_WEIGHT = 6.0
+LENGTH_WEIGHT = 6.0
+SOLVER_WEIGHT = 1.0
+
+# Default percentile cut points for bucketing into easy / medium / hard
+BUCKET_CUTS = {"easy": (0, 33.3), "medium": (33.3, 66.7), "hard": (66.7, 100)}
+
+_INDEXES: Dict[str, Tuple[Optional[Tuple[int, int]], "ScoreIndex"]] = {}
+
+
+def letter_document_frequency(words: Iterable[str]) -> Dict[str, float]:
+    """Share of words containing each letter"""
+    counts = Counter()
+    total = 0
+    for word in words:
+        counts.update(set(word))
+        total += 1
+    return {letter: count / total for letter, count in counts.items()} if total else {}
+
+
+def heuristic_score(word: str, frequency: Mapping[str, float]) -> float:
+    """
+    Score a word from its letters alone
+
+    Args:
+        word: Lower-case word
+        frequency: Share of dictionary words containing each letter
+
+    Returns:
+        Difficulty score (higher is harder)
+    """
+    letters = set(word)
+    if not letters:
+        return 0.0
+    # Letters the dictionary never uses count as about 10 bits
+    rarity = sum(-math.log2(frequency.get(letter) or 1e-3) for letter in letters) / len(letters)
+    return rarity + UNIQUE_WEIGHT / len(letters) + LENGTH_WEIGHT / len(word)
+
+
+def solver_wrong_guesses(solver, word: str) -> int:
+    """Count the wrong guesses the solver makes before it has solved a word"""
+    guessed = set()
+    wrong = 0
+    pattern = "".join("_" if "a" <= ch <= "z" else ch for ch in word)
+    while "_" in pattern:
+        letter = solver.best_guess(pattern, guessed)
+        if letter in guessed:
+            break
+        guessed.add(letter)
+        if letter in word:
+            pattern = "".join(ch if ch in guessed or not "a" <= ch <= "z" else "_" for ch in word)
+        else:
+            wrong += 1
+    return wrong
+
+
+def score_words(words: Mapping[str, str], use_solver: bool = False) -> List[Tuple[float, str, str]]:
+    """
+    Score every word of a dictionary
+
+    Args:
+        words: Mapping of words to hints
+        use_solver: Add the solver's wrong guesses to each score (slow for
+            very large dictionaries without NumPy)
+
+    Returns:
+        List of (score, word, hint) sorted by score, then word
+    """
+    lowered = {word.lower(): hint for word, hint in words.items()}
+    frequency = letter_document_frequency(lowered)
+    solver = None
+    if use_solver:
+        from hangman_game.core.solver import Solver
+        solver = Solver(lowered)
+
+    scored = []
+    for word, hint in lowered.items():
+        score = heuristic_score(word, frequency)
+        if solver is not None:
+            score += SOLVER_WEIGHT * solver_wrong_guesses(solver, word)
+        scored.append((round(score, 6), word, hint))
+    scored.sort()
+    return scored
+
+
+class ScoreIndex:
+    """Words sorted by difficulty score, drawn from by percentile or score"""
+
+    def __init__(self, entries: List[Tuple[float, str, str]]):
+        """
+        Initialize the index
+
+        Args:
+            entries: (score, word, hint) tuples sorted by score
+        """
+        self.entries = entries
+        self.scores = [entry[0] for entry in entries]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def percentile_span(self, low: float, high: float) -> Tuple[int, int]:
+        """
+        Index range [start, end) of the words between two percentiles (0-100)
+
+        Adjacent ranges don't overlap, and a range narrower than one word
+        still holds the word at its position.
+        """
+        size = len(self.entries)
+        start = min(size, max(0, int(size * low / 100)))
+        end = min(size, max(start, int(size * high / 100)))
+        if end == start and size:
+            start, end = min(start, size - 1), min(start, size - 1) + 1
+        return start, end
+
+    def score_span(self, low: float, high: float) -> Tuple[int, int]:
+        """Index range [start, end) of the words scoring between low and high (inclusive)"""
+        return bisect_left(self.scores, low), bisect_right(self.scores, high)
+
+    def percentile_of(self, score: float) -> float:
+        """Percentage of words scoring below a score"""
+        return 100 * bisect_left(self.scores, score) / len(self.scores) if self.scores else 0.0
+
+    def draw(self, start: int, end: int, rng=None) -> Tuple[str, str]:
+        """Draw a random (word, hint) from an index range"""
+        if end <= start:
+            raise ValueError("No words in the requested range")
+        _, word, hint = self.entries[(rng or random).randrange(start, end)]
+        return word, hint
+
+    def bucket(self, cuts: Mapping[str, Tuple[float, float]] = BUCKET_CUTS) -> Dict[str, Dict[str, str]]:
+        """Split the words into a words-file mapping by percentile ranges"""
+        sections = {}
+        for name, (low, high) in cuts.items():
+            start, end = self.percentile_span(low, high)
+            sections[name] = {word: hint for _, word, hint in self.entries[start:end]}
+        return sections
+
+    def save(self, path):
+        """Write the index as JSON"""
+        with open(path, "w") as f:
+            json.dump({"version": INDEX_VERSION, "entries": self.entries}, f)
+
+    @classmethod
+    def load(cls, path) -> "ScoreIndex":
+        """Read an index written by ``save``"""
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported score index version: {data.get('version')}")
+        return cls([tuple(entry) for entry in data["entries"]])
+
+    @classmethod
+    def from_words(cls, words: Mapping[str, str], use_solver: bool = False) -> "ScoreIndex":
+        """Score a dictionary in memory"""
+        return cls(score_words(words, use_solver))
+
+
+def load_score_index(path=None) -> ScoreIndex:
+    """
+    Get a shared score index, reloaded when its file changes
+
+    Args:
+        path: Index file; defaults to ``data/scores.json``, or, if that
+            hasn't been built, an index scored in memory from every
+            difficulty of the bundled words
+
+    Returns:
+        The ScoreIndex
+    """
+    path = os.fspath(path) if path is not None else SCORES_FILE
+    signature = file_signature(path)
+    cached = _INDEXES.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    if signature is not None:
+        index = ScoreIndex.load(path)
+    elif path == SCORES_FILE:
+        words = {}
+        for difficulty in ("easy", "medium", "hard"):
+            for word, hint in load_words(difficulty).items():
+                words.setdefault(word, hint)
+        index = ScoreIndex.from_words(words)
+    else:
+        raise FileNotFoundError(path)
+    _INDEXES[path] = (signature, index)
+    return index
+
+
+def main(argv=None):
+    """Score a words file and write the sorted index"""
+    parser = argparse.ArgumentParser(description="Score Hangman words by difficulty")
+    parser.add_argument("source", help="words JSON file ({difficulty: {word: clue}})")
+    parser.add_argument("output", help="score index file to write")
+    parser.add_argument("--solver", action="store_true", help="include the solver's wrong guesses")
+    parser.add_argument("--buckets", help="also write a words file split into easy/medium/hard by percentile")
+    args = parser.parse_args(argv)
+
+    with open(args.source, "r") as f:
+        sections = json.load(f)
+    words: Dict[str, str] = {}
+    for section in sections.values():
+        if isinstance(section, dict):
+            for word, hint in section.items():
+                words.setdefault(word, hint)
+
+    index = ScoreIndex.from_words(words, use_solver=args.solver)
+    index.save(args.output)
+    print(f"Scored {len(index)} words into {args.output}")
+    if args.buckets:
+        buckets = index.bucket()
+        with open(args.buckets, "w") as f:
+            json.dump(buckets, f, indent=2)
+        print(f"Wrote {', '.join(f'{len(v)} {k}' for k, v in buckets.items())} words to {args.buckets}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
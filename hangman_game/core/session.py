@@ -0,0 +1,193 @@
+"""
+Compact game sessions for hosting very many concurrent games
+"""
+
+import random
+from collections.abc import Sequence
+from typing import Dict, List
+
+from hangman_game.core.game_logic import (
+    ALREADY_GUESSED, CORRECT, WON, LOST, MAX_INCORRECT_GUESSES, OTHER_LETTERS,
+    guess_result, judge_guess, letter_bit, letters_mask, load_words,
+    mask_letters, word_entries,
+)
+
+
+class GameSession:
+    """
+    A single Hangman game stored in a handful of slots
+
+    Unlike ``HangmanLogic`` a session has no ``__dict__``, shares the cached
+    corpus and refers to its word by index, and keeps its guesses in one
+    integer bitmask (plus a string of any guesses outside a-z), so an idle
+    game costs under 100 bytes. Guesses follow exactly the same rules as
+    ``HangmanLogic.make_guess``.
+    """
+
+    __slots__ = ("entries", "index", "guessed", "other_guesses", "incorrect_guesses",
+                 "max_incorrect_guesses", "status")
+
+    PLAYING, WON, LOST = 0, 1, 2
+
+    def __init__(self, entries: Sequence, index: int, max_incorrect_guesses: int = 6):
+        """
+        Initialize a session
+
+        Args:
+            entries: Shared sequence of (word, hint) pairs
+            index: Index of the secret word in ``entries``
+            max_incorrect_guesses: Wrong guesses allowed
+        """
+        self.entries = entries
+        self.index = index
+        self.guessed = 0
+        # Guessed characters outside a-z, which may have no bit to record
+        self.other_guesses = ""
+        self.incorrect_guesses = 0
+        self.max_incorrect_guesses = max_incorrect_guesses
+        self.status = GameSession.PLAYING
+
+    @classmethod
+    def new(cls, difficulty: str = "medium", words_file=None, rng=None) -> "GameSession":
+        """
+        Start a session on a random word from the shared corpus cache
+
+        Args:
+            difficulty: Game difficulty level (easy, medium, hard)
+            words_file: Optional words JSON file or word pack to play from
+            rng: Random source with ``randrange`` (defaults to ``random``)
+        """
+        entries = word_entries(load_words(difficulty, words_file))
+        index = (rng or random).randrange(len(entries))
+        return cls(entries, index, MAX_INCORRECT_GUESSES.get(difficulty, 6))
+
+    @property
+    def word(self) -> str:
+        """The secret word"""
+        return self.entries[self.index][0].lower()
+
+    @property
+    def hint(self) -> str:
+        """The clue for the secret word"""
+        return self.entries[self.index][1]
+
+    @property
+    def guessed_letters(self) -> List[str]:
+        """Letters guessed so far (in alphabetical order, not guess order)"""
+        letters = mask_letters(self.guessed & ~OTHER_LETTERS)
+        return letters + list(self.other_guesses)
+
+    @property
+    def game_won(self) -> bool:
+        return self.status == GameSession.WON
+
+    @property
+    def game_lost(self) -> bool:
+        return self.status == GameSession.LOST
+
+    def make_guess(self, letter: str) -> Dict:
+        """
+        Process a letter guess
+
+        Args:
+            letter: The guessed letter
+
+        Returns:
+            Dict with result information, as from ``HangmanLogic.make_guess``
+        """
+        word = self.word
+        # The word's mask first: it assigns bits to any new characters in it
+        word_mask = letters_mask(word)
+        letter = letter.lower()
+        bit = letter_bit(letter)
+        if (bit == 0 or bit & OTHER_LETTERS) and letter in self.other_guesses:
+            outcome = ALREADY_GUESSED
+        else:
+            outcome = judge_guess(
+                word_mask, self.guessed, bit,
+                self.incorrect_guesses, self.max_incorrect_guesses
+            )
+        if outcome != ALREADY_GUESSED:
+            self.guessed |= bit
+            if bit == 0 or bit & OTHER_LETTERS:
+                self.other_guesses += letter
+            if outcome == WON:
+                self.status = GameSession.WON
+            elif outcome != CORRECT:
+                self.incorrect_guesses += 1
+                if outcome == LOST:
+                    self.status = GameSession.LOST
+        return guess_result(outcome, word)
+
+    def get_display_word(self) -> str:
+        """Get the current display state of the word"""
+        guessed = self.guessed
+        return " ".join([
+            letter if letter_bit(letter) & guessed else "_"
+            for letter in self.word
+        ])
+
+    def get_game_state(self) -> Dict:
+        """Get current game state, with the same keys as ``HangmanLogic``"""
+        return {
+            "display_word": self.get_display_word(),
+            "incorrect_guesses": self.incorrect_guesses,
+            "max_incorrect_guesses": self.max_incorrect_guesses,
+            "guessed_letters": self.guessed_letters,
+            "hint": self.hint,
+            "game_won": self.game_won,
+            "game_lost": self.game_lost,
+            "is_game_over": self.status != GameSession.PLAYING
+        }
+
+
+def measure_bytes_per_session(factory, count: int = 10000) -> float:
+    """
+    Measure the average memory held by one live game
+
+    Args:
+        factory: Callable returning a started game with one guess made
+        count: Number of games to keep alive while measuring
+
+    Returns:
+        Average bytes allocated per game
+    """
+    import tracemalloc
+
+    factory()  # warm the corpus cache outside the measurement
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        games = [factory() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del games
+    return (after - before) / count
+
+
+def _logic_game():
+    from hangman_game.core.game_logic import HangmanLogic
+
+    game = HangmanLogic()
+    game.start_new_game()
+    game.make_guess("e")
+    return game
+
+
+def _session_game():
+    session = GameSession.new()
+    session.make_guess("e")
+    return session
+
+
+def main():
+    """Print bytes per game for HangmanLogic and GameSession"""
+    before = measure_bytes_per_session(_logic_game)
+    after = measure_bytes_per_session(_session_game)
+    print(f"HangmanLogic: {before:8.1f} bytes per game")
+    print(f"GameSession:  {after:8.1f} bytes per game ({before / after:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Automated Hangman player that picks the best letter over a word corpus
+
+The solver keeps every dictionary word bucketed by length. For a game state
+it narrows the bucket to the candidates consistent with the display word
+(revealed letters in place, no guessed letter in a hidden position) and
+picks the unguessed letter that appears in the most candidates, which
+maximises the chance of a hit, or the letter whose reveal pattern splits
+the candidates with the most expected information.
+
+With NumPy installed each bucket is a word x position matrix of letter codes
+plus a word x letter presence matrix, so filtering and counting are array
+operations; candidates from the previous move are reused while a game
+progresses. Without NumPy the same queries run through one compiled regular
+expression over the bucket.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from hangman_game.core.game_logic import ALPHABET, load_words, words_by_length
+
+# English letter frequency order, used when no candidate word is left
+FALLBACK_ORDER = "etaoinsrhldcumfpgwybvkxjqz"
+
+# Code used for characters outside a-z
+_OTHER = len(ALPHABET)
+
+# Letter counts are cached per bucket for game states with at most this
+# many guesses (few distinct states, and the largest candidate sets), up to
+# EARLY_CACHE_SIZE states
+EARLY_MOVES = 2
+EARLY_CACHE_SIZE = 4096
+
+FREQUENCY = "frequency"
+ENTROPY = "entropy"
+
+# Solvers of cached corpora: (difficulty, words file) -> (words mapping, solver)
+_SOLVERS: Dict[Tuple[str, Optional[str]], Tuple[Mapping, "Solver"]] = {}
+
+
+def _code(letter: str) -> int:
+    index = ord(letter) - 97
+    return index if 0 <= index < 26 else _OTHER
+
+
+def pattern_of(display_word: str) -> str:
+    """Turn ``get_display_word()`` output ("p y _ _") into a pattern ("py__")"""
+    return display_word[::2]
+
+
+class _Bucket:
+    """All dictionary words of one length"""
+
+    def __init__(self, words: List[str]):
+        self.words = words
+        self.text = "\n".join(words) + "\n"
+        self.early_counts: Dict[Tuple[str, frozenset], Counter] = {}
+        self.positions = None
+        self.presence = None
+        length = len(words[0])
+        if np is not None and length <= 64:
+            # positions[letter][word] has bit p set when the word has that
+            # letter at position p: a guess of the letter is consistent with
+            # a word exactly when the revealed positions equal this mask
+            dtype = np.uint16 if length <= 16 else np.uint32 if length <= 32 else np.uint64
+            codes = np.frombuffer(
+                "".join(words).encode("ascii", "replace"), dtype=np.uint8
+            ).reshape(len(words), length).astype(np.int16) - 97
+            positions = np.zeros((len(ALPHABET), len(words)), dtype=dtype)
+            for position in range(length):
+                column = codes[:, position]
+                rows = np.flatnonzero((column >= 0) & (column < 26))
+                positions[column[rows], rows] |= dtype(1 << position)
+            self.positions = positions
+            # presence[word] has bit c set when the word contains letter c,
+            # so counting letters over candidates gathers one value per word
+            presence = np.zeros(len(words), dtype=np.uint32)
+            for code in range(len(ALPHABET)):
+                presence |= (positions[code] != 0).astype(np.uint32) << np.uint32(code)
+            self.presence = presence
+
+
+class Solver:
+    """Pick Hangman guesses from the words of a dictionary"""
+
+    def __init__(self, words: Iterable[str]):
+        """
+        Precompute the per-length word matrices
+
+        Args:
+            words: Dictionary words (lower-cased, duplicates removed)
+        """
+        by_length = words_by_length(word for word in words if "\n" not in word)
+        self.buckets = {length: _Bucket(words) for length, words in by_length.items()}
+        # (length, pattern, guessed letters, candidate indices) of the last query
+        self._last = None
+
+    @classmethod
+    def for_corpus(cls, difficulty: str = "medium", words_file=None) -> "Solver":
+        """
+        Get the shared solver for a corpus from the word cache
+
+        The solver is rebuilt when ``load_words`` returns a new mapping,
+        i.e. after the words file changed, replacing the old one.
+        """
+        key = (difficulty, None if words_file is None else str(words_file))
+        words = load_words(difficulty, words_file)
+        cached = _SOLVERS.get(key)
+        if cached is not None and cached[0] is words:
+            return cached[1]
+        solver = cls(words)
+        _SOLVERS[key] = (words, solver)
+        return solver
+
+    def candidates(self, pattern: str, guessed: Iterable[str]) -> List[str]:
+        """
+        Get the dictionary words consistent with a game state
+
+        Args:
+            pattern: Word with unrevealed letters as "_" (see ``pattern_of``)
+            guessed: Every letter guessed so far, right or wrong
+
+        Returns:
+            List of candidate words
+        """
+        bucket = self.buckets.get(len(pattern))
+        if bucket is None:
+            return []
+        guessed = frozenset(guessed)
+        if bucket.positions is None:
+            return self._match(bucket, pattern, guessed)
+        indices = self._filter(bucket, pattern, guessed)
+        if indices is None:
+            return list(bucket.words)
+        return [bucket.words[i] for i in indices]
+
+    def _match(self, bucket: _Bucket, pattern: str, guessed: frozenset) -> List[str]:
+        """Find candidates with a regular expression over the bucket"""
+        hidden = "[^%s\\n]" % re.escape("".join(sorted(guessed))) if guessed else "[^\\n]"
+        regex = "".join(hidden if ch == "_" else re.escape(ch) for ch in pattern)
+        return re.findall("^%s$" % regex, bucket.text, re.MULTILINE)
+
+    def _filter(self, bucket: _Bucket, pattern: str, guessed: frozenset):
+        """Find candidate indices with array operations (None means all)"""
+        length = len(pattern)
+        last = self._last
+        if (last is not None and last[0] is bucket and last[2] <= guessed
+                and all(old == new or (old == "_" and new not in last[2])
+                        for old, new in zip(last[1], pattern))):
+            # Same game, later move: the previous candidates already satisfy
+            # the old guesses, so only the new letters need checking
+            indices, letters = last[3], guessed - last[2]
+        else:
+            indices, letters = None, guessed
+
+        for letter in letters:
+            code = _code(letter)
+            if code == _OTHER:
+                continue
+            revealed = sum(1 << i for i, ch in enumerate(pattern) if ch == letter)
+            column = bucket.positions[code]
+            if indices is None:
+                indices = np.flatnonzero(column == revealed)
+            else:
+                indices = indices[column[indices] == revealed]
+
+        self._last = (bucket, pattern, guessed, indices)
+        return indices
+
+    def letter_counts(self, pattern: str, guessed: Iterable[str]) -> Counter:
+        """Count, for each unguessed letter, the candidates containing it"""
+        guessed = frozenset(guessed)
+        bucket = self.buckets.get(len(pattern))
+        if bucket is None:
+            return Counter()
+        early = len(guessed) <= EARLY_MOVES
+        if early:
+            cached = bucket.early_counts.get((pattern, guessed))
+            if cached is not None:
+                return Counter(cached)
+
+        if bucket.positions is None:
+            counts = Counter()
+            for word in self._match(bucket, pattern, guessed):
+                counts.update(set(word))
+            counts = Counter({letter: counts[letter] for letter in ALPHABET if counts[letter]})
+        else:
+            indices = self._filter(bucket, pattern, guessed)
+            presence = bucket.presence if indices is None else bucket.presence[indices]
+            counts = Counter()
+            for code, letter in enumerate(ALPHABET):
+                if letter not in guessed:
+                    total = np.count_nonzero(presence & np.uint32(1 << code))
+                    if total:
+                        counts[letter] = int(total)
+        for letter in guessed:
+            counts.pop(letter, None)
+        if early and len(bucket.early_counts) < EARLY_CACHE_SIZE:
+            bucket.early_counts[(pattern, guessed)] = Counter(counts)
+        return counts
+
+    def letter_entropy(self, pattern: str, guessed: Iterable[str]) -> Dict[str, float]:
+        """Expected information (bits) from guessing each unguessed letter"""
+        guessed = frozenset(guessed)
+        bucket = self.buckets.get(len(pattern))
+        letters = [letter for letter in ALPHABET if letter not in guessed]
+        if bucket is None:
+            return {}
+
+        entropy = {}
+        if bucket.positions is not None:
+            # Each letter's reveal pattern is its position mask
+            indices = self._filter(bucket, pattern, guessed)
+            total = len(bucket.words) if indices is None else len(indices)
+            for letter in letters:
+                column = bucket.positions[_code(letter)]
+                if indices is not None:
+                    column = column[indices]
+                p = np.unique(column, return_counts=True)[1] / total
+                entropy[letter] = float(-(p * np.log2(p)).sum())
+            return entropy
+
+        words = self._match(bucket, pattern, guessed)
+        total = len(words)
+        for letter in letters:
+            sizes = Counter(
+                sum(1 << i for i, ch in enumerate(word) if ch == letter) for word in words
+            ).values()
+            entropy[letter] = -sum(size / total * math.log2(size / total) for size in sizes)
+        return entropy
+
+    def best_guess(self, pattern: str, guessed: Iterable[str], strategy: str = FREQUENCY) -> str:
+        """
+        Pick the next letter to guess
+
+        Args:
+            pattern: Word with unrevealed letters as "_" (see ``pattern_of``)
+            guessed: Every letter guessed so far
+            strategy: FREQUENCY (most likely hit) or ENTROPY (most information)
+
+        Returns:
+            The letter to guess
+        """
+        guessed = frozenset(guessed)
+        counts = self.letter_counts(pattern, guessed)
+        if not counts:
+            return next(
+                (letter for letter in FALLBACK_ORDER if letter not in guessed),
+                FALLBACK_ORDER[0]
+            )
+        if strategy == ENTROPY:
+            entropy = self.letter_entropy(pattern, guessed)
+            return max(counts, key=lambda letter: (entropy[letter], counts[letter]))
+        return max(counts, key=lambda letter: (counts[letter], -FALLBACK_ORDER.index(letter)))
+
+    def next_guess(self, game, strategy: str = FREQUENCY) -> str:
+        """
+        Pick the next letter for a running game
+
+        Args:
+            game: A ``HangmanLogic`` or ``GameSession``
+            strategy: FREQUENCY or ENTROPY
+
+        Returns:
+            The letter to guess
+        """
+        return self.best_guess(pattern_of(game.get_display_word()), game.guessed_letters, strategy)
@@ -0,0 +1,293 @@
+"""
+SQLite statistics store with per-game history for Hangman game
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from hangman_game.core.statistics import stats_changes
+
+Timestamp = Union[datetime, float, None]
+
+DIFFICULTIES = ("easy", "medium", "hard")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    difficulty TEXT NOT NULL,
+    word TEXT NOT NULL DEFAULT '',
+    guesses INTEGER NOT NULL,
+    won INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_ts ON games (ts);
+CREATE INDEX IF NOT EXISTS games_difficulty_ts ON games (difficulty, ts);
+CREATE INDEX IF NOT EXISTS games_word ON games (word);
+
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    games_played INTEGER NOT NULL DEFAULT 0,
+    games_won INTEGER NOT NULL DEFAULT 0,
+    games_lost INTEGER NOT NULL DEFAULT 0,
+    total_guesses INTEGER NOT NULL DEFAULT 0,
+    best_streak INTEGER NOT NULL DEFAULT 0,
+    current_streak INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO totals (id) VALUES (1);
+
+CREATE TABLE IF NOT EXISTS difficulty_totals (
+    difficulty TEXT PRIMARY KEY,
+    played INTEGER NOT NULL DEFAULT 0,
+    won INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def _timestamp(value: Timestamp) -> Optional[float]:
+    """Convert a datetime or UNIX time to UNIX time"""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return value
+
+
+class SQLiteStatistics:
+    """
+    Track game statistics in SQLite, one row per game
+
+    A drop-in alternative to ``Statistics`` (same ``record_game``,
+    ``get_stats``, ``get_win_rate``, ``reset_stats``, ``subscribe``,
+    ``refresh`` and ``flush``, so the GUI can use either) that also keeps
+    every game's timestamp, difficulty, word, guesses and outcome for
+    queries such as the win rate over the last week or for one word.
+    ``get_stats()`` and ``get_win_rate()`` read aggregate tables that are
+    updated in the same transaction as each insert, so they never scan the
+    history. The database runs in WAL mode, so readers in other processes
+    are not blocked by a writer.
+    """
+
+    def __init__(self, db_file=None):
+        """
+        Initialize statistics
+
+        Args:
+            db_file: Database file (defaults to ~/.hangman_stats.db)
+        """
+        self.db_file = Path(db_file) if db_file else Path.home() / ".hangman_stats.db"
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable[[Dict], None]] = []
+        self._published: Optional[Dict] = None
+        self._conn = sqlite3.connect(
+            str(self.db_file), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO difficulty_totals (difficulty) VALUES (?)",
+            [(difficulty,) for difficulty in DIFFICULTIES]
+        )
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def record_game(self, won: bool, difficulty: str = "medium", guesses: int = 0,
+                    word: str = "", timestamp: Timestamp = None):
+        """
+        Record a game result
+
+        Args:
+            won: Whether the game was won
+            difficulty: Game difficulty level
+            guesses: Number of guesses made
+            word: The word that was played
+            timestamp: When the game finished (defaults to now)
+        """
+        ts = _timestamp(timestamp)
+        won = int(bool(won))
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT INTO games (ts, difficulty, word, guesses, won) VALUES (?, ?, ?, ?, ?)",
+                    (time.time() if ts is None else ts, difficulty, word, guesses, won)
+                )
+                # Right-hand sides see the old row, so best_streak compares
+                # against the streak as it is after this game
+                conn.execute(
+                    """
+                    UPDATE totals SET
+                        games_played = games_played + 1,
+                        games_won = games_won + :won,
+                        games_lost = games_lost + 1 - :won,
+                        total_guesses = total_guesses + :guesses,
+                        current_streak = CASE WHEN :won THEN current_streak + 1 ELSE 0 END,
+                        best_streak = MAX(best_streak,
+                                          CASE WHEN :won THEN current_streak + 1 ELSE 0 END)
+                    WHERE id = 1
+                    """,
+                    {"won": won, "guesses": guesses}
+                )
+                conn.execute(
+                    "UPDATE difficulty_totals SET played = played + 1, won = won + ? WHERE difficulty = ?",
+                    (won, difficulty)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        self._notify()
+
+    def flush(self):
+        """Nothing to write: every game is committed by ``record_game``"""
+
+    def refresh(self):
+        """Tell subscribers about games other processes have recorded"""
+        self._notify()
+
+    def subscribe(self, callback: Callable[[Dict], None]) -> Callable[[], None]:
+        """
+        Call ``callback(changes)`` whenever the aggregate changes
+
+        Same contract as ``Statistics.subscribe``: ``changes`` maps changed
+        fields, as dotted keys, to their new values, and the first call
+        after subscribing carries every field.
+
+        Returns:
+            Function that unsubscribes the callback
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+            self._published = None
+        return lambda: self._subscribers.remove(callback)
+
+    def _notify(self):
+        """Send subscribers the fields changed since the last notification"""
+        if not self._subscribers:
+            return
+        stats = self.get_stats()
+        with self._lock:
+            self._published, changes = stats_changes(stats, self._published)
+        if changes:
+            for callback in list(self._subscribers):
+                callback(changes)
+
+    def get_stats(self) -> Dict:
+        """Get current statistics, in the same shape as ``Statistics``"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT games_played, games_won, games_lost, total_guesses,"
+                " best_streak, current_streak FROM totals WHERE id = 1"
+            ).fetchone()
+            by_difficulty = self._conn.execute(
+                "SELECT difficulty, played, won FROM difficulty_totals"
+            ).fetchall()
+        keys = ("games_played", "games_won", "games_lost", "total_guesses",
+                "best_streak", "current_streak")
+        stats = dict(zip(keys, row))
+        stats["by_difficulty"] = {
+            difficulty: {"played": played, "won": won}
+            for difficulty, played, won in by_difficulty
+        }
+        return stats
+
+    def get_win_rate(self) -> float:
+        """Get win rate percentage"""
+        with self._lock:
+            played, won = self._conn.execute(
+                "SELECT games_played, games_won FROM totals WHERE id = 1"
+            ).fetchone()
+        if played == 0:
+            return 0.0
+        return (won / played) * 100
+
+    def _where(self, since: Timestamp, until: Timestamp, difficulty: Optional[str],
+               word: Optional[str]) -> Tuple[str, List]:
+        """Build an indexed WHERE clause for history queries"""
+        clauses, params = [], []
+        if difficulty is not None:
+            clauses.append("difficulty = ?")
+            params.append(difficulty)
+        if word is not None:
+            clauses.append("word = ?")
+            params.append(word)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(_timestamp(since))
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(_timestamp(until))
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query_win_rate(self, since: Timestamp = None, until: Timestamp = None,
+                       difficulty: Optional[str] = None, word: Optional[str] = None) -> Tuple[int, float]:
+        """
+        Get the number of games and win rate for a slice of the history
+
+        Args:
+            since: Only games at or after this time
+            until: Only games before this time
+            difficulty: Only games at this difficulty
+            word: Only games played with this word
+
+        Returns:
+            Tuple of (games played, win rate percentage)
+        """
+        where, params = self._where(since, until, difficulty, word)
+        with self._lock:
+            played, won = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(won), 0) FROM games" + where, params
+            ).fetchone()
+        return played, (won / played * 100) if played else 0.0
+
+    def get_history(self, since: Timestamp = None, until: Timestamp = None,
+                    difficulty: Optional[str] = None, word: Optional[str] = None,
+                    limit: Optional[int] = None) -> List[Dict]:
+        """
+        Get recorded games, newest first
+
+        Args:
+            since: Only games at or after this time
+            until: Only games before this time
+            difficulty: Only games at this difficulty
+            word: Only games played with this word
+            limit: Maximum number of games to return
+
+        Returns:
+            List of dicts with ts, difficulty, word, guesses and won
+        """
+        where, params = self._where(since, until, difficulty, word)
+        sql = "SELECT ts, difficulty, word, guesses, won FROM games" + where + " ORDER BY ts DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {"ts": ts, "difficulty": difficulty, "word": word, "guesses": guesses, "won": bool(won)}
+            for ts, difficulty, word, guesses, won in rows
+        ]
+
+    def reset_stats(self):
+        """Reset all statistics and delete the game history"""
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM games")
+                conn.execute(
+                    "UPDATE totals SET games_played = 0, games_won = 0, games_lost = 0,"
+                    " total_guesses = 0, best_streak = 0, current_streak = 0"
+                )
+                conn.execute("UPDATE difficulty_totals SET played = 0, won = 0")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        self._notify()
@@ -2,53 +2,429 @@
 Statistics tracking for Hangman game
 """
 
+import atexit
 import json
+import os
+import tempfile
+import threading
+import time
+import weakref
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict
-from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Buffered Statistics instances with results still to write at exit
+_BUFFERED = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    """Write every buffered instance's pending results at interpreter exit"""
+    for stats in list(_BUFFERED):
+        stats.flush()
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Get the (inode, mtime_ns, size) signature of a file, or None if missing"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _default_stats() -> Dict:
+    """Get a fresh, empty statistics aggregate"""
+    return {
+        "games_played": 0,
+        "games_won": 0,
+        "games_lost": 0,
+        "total_guesses": 0,
+        "best_streak": 0,
+        "current_streak": 0,
+        "by_difficulty": {
+            "easy": {"played": 0, "won": 0},
+            "medium": {"played": 0, "won": 0},
+            "hard": {"played": 0, "won": 0}
+        }
+    }
+
+
+def _apply_game(stats: Dict, won: bool, difficulty: str, guesses: int):
+    """Add one game result to a statistics aggregate"""
+    stats["games_played"] += 1
+    stats["total_guesses"] += guesses
+    
+    if won:
+        stats["games_won"] += 1
+        stats["current_streak"] += 1
+        if stats["current_streak"] > stats["best_streak"]:
+            stats["best_streak"] = stats["current_streak"]
+    else:
+        stats["games_lost"] += 1
+        stats["current_streak"] = 0
+    
+    # Update difficulty stats
+    if difficulty in stats["by_difficulty"]:
+        stats["by_difficulty"][difficulty]["played"] += 1
+        if won:
+            stats["by_difficulty"][difficulty]["won"] += 1
+
+
+def _flatten(stats: Dict, prefix: str = "") -> Dict:
+    """Flatten an aggregate into dotted keys ("by_difficulty.easy.won")"""
+    flat = {}
+    for key, value in stats.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+
+def stats_changes(stats: Dict, published: Optional[Dict]) -> Tuple[Dict, Dict]:
+    """
+    Compare an aggregate with the fields last sent to subscribers
+    
+    Args:
+        stats: Statistics aggregate, as from ``get_stats()``
+        published: Flattened fields last published (None for none yet)
+        
+    Returns:
+        Tuple of (all flattened fields, the fields that changed)
+    """
+    current = _flatten(stats)
+    published = published or {}
+    changes = {key: value for key, value in current.items()
+               if key not in published or published[key] != value}
+    return current, changes
 
 
 class Statistics:
-    """Track game statistics"""
+    """
+    Track game statistics
     
-    def __init__(self):
-        self.stats_file = Path.home() / ".hangman_stats.json"
-        self.stats = self._load_stats()
+    The files are first read when the statistics are used (``stats``,
+    ``get_stats()``, ``record_game()``...), not when the instance is created.
+    
+    Results are stored as an append-only event log (``~/.hangman_stats.log``,
+    one compact JSON line per game) on top of an aggregate snapshot
+    (``~/.hangman_stats.json``). Loading replays the log over the snapshot;
+    every ``COMPACT_EVERY`` games the aggregate is written to a new snapshot
+    atomically and the log is truncated. Each event carries a sequence number
+    and the snapshot records the last one it includes, so a crash between
+    the two steps never counts a game twice.
+    
+    With ``buffered=True`` results are kept in memory and appended in one
+    write per batch: when ``flush_every`` results are pending, when the
+    oldest pending result is ``flush_interval`` seconds old, on ``flush()``
+    and at normal interpreter exit. A crash or kill can therefore lose at
+    most the last ``flush_every`` results or ``flush_interval`` seconds of
+    results, whichever is smaller.
+    
+    Several processes may share the same files: every write takes an
+    advisory ``fcntl`` lock (``~/.hangman_stats.lock``), first merges any
+    results other processes have logged since, and only then appends or
+    compacts, so no process overwrites another's games.
+    
+    ``subscribe()`` registers callbacks told which fields changed after
+    every recorded game, merge of other processes' results and reset.
+    """
+    
+    COMPACT_EVERY = 1000
+    
+    def __init__(self, stats_file=None, buffered: bool = False,
+                 flush_every: int = 100, flush_interval: float = 5.0):
+        """
+        Initialize statistics
+        
+        Args:
+            stats_file: Snapshot file (defaults to ~/.hangman_stats.json);
+                the event log lives next to it with a ``.log`` suffix
+            buffered: Batch writes instead of writing every result
+            flush_every: Pending results that trigger a write when buffered
+            flush_interval: Seconds a result may wait unwritten when buffered
+        """
+        self.stats_file = Path(stats_file) if stats_file else Path.home() / ".hangman_stats.json"
+        self.log_file = self.stats_file.with_suffix(".log")
+        self.buffered = buffered
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.lock_file = self.stats_file.with_suffix(".lock")
+        self._seq = 0
+        self._log_events = 0
+        self._log_offset = 0
+        self._snapshot_signature = None
+        self._pending: List[Dict] = []
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        self._file_lock_depth = 0
+        self._stats: Optional[Dict] = None
+        self._subscribers: List[Callable[[Dict], None]] = []
+        self._published: Optional[Dict] = None
+        if buffered:
+            _BUFFERED.add(self)
+    
+    @property
+    def stats(self) -> Dict:
+        """The aggregate statistics, read from disk on first use"""
+        if self._stats is None:
+            with self._file_lock():
+                if self._stats is None:
+                    self._stats = self._load_stats()
+        return self._stats
+    
+    @stats.setter
+    def stats(self, stats: Dict):
+        self._stats = stats
+    
+    @contextmanager
+    def _file_lock(self):
+        """
+        Hold the advisory lock that serialises every process's writes
+        
+        Re-entrant within this instance. Where ``fcntl`` isn't available
+        only threads of this process are serialised.
+        """
+        with self._lock:
+            if self._file_lock_depth or fcntl is None:
+                self._file_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._file_lock_depth -= 1
+                return
+            
+            try:
+                lock = open(self.lock_file, 'a')
+            except IOError:
+                lock = None
+            try:
+                if lock is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                self._file_lock_depth += 1
+                yield
+            finally:
+                self._file_lock_depth -= 1
+                if lock is not None:
+                    lock.close()  # closing releases the lock
     
     def _load_stats(self) -> Dict:
-        """Load statistics from file"""
-        default_stats = {
-            "games_played": 0,
-            "games_won": 0,
-            "games_lost": 0,
-            "total_guesses": 0,
-            "best_streak": 0,
-            "current_streak": 0,
-            "by_difficulty": {
-                "easy": {"played": 0, "won": 0},
-                "medium": {"played": 0, "won": 0},
-                "hard": {"played": 0, "won": 0}
-            }
-        }
+        """Load statistics from the snapshot and replay the event log"""
+        stats = _default_stats()
+        snapshot_seq = 0
         
-        if self.stats_file.exists():
+        self._snapshot_signature = _file_signature(self.stats_file)
+        if self._snapshot_signature is not None:
             try:
                 with open(self.stats_file, 'r') as f:
-                    return json.load(f)
+                    stats = json.load(f)
+                snapshot_seq = stats.pop("log_seq", 0)
             except (json.JSONDecodeError, IOError):
-                return default_stats
+                stats = _default_stats()
+        
+        self._seq = snapshot_seq
+        self._log_events = 0
+        events, self._log_offset = self._read_log(0)
+        self._apply_events(stats, events)
+        return stats
+    
+    def _apply_events(self, stats: Dict, events: List[Dict]):
+        """Apply logged events newer than the last applied sequence number"""
+        for event in events:
+            self._log_events += 1
+            if event["seq"] > self._seq:
+                _apply_game(stats, event["won"], event["difficulty"], event["guesses"])
+                self._seq = event["seq"]
+    
+    def _read_log(self, offset: int) -> Tuple[List[Dict], int]:
+        """
+        Read every complete event from a log offset, skipping torn lines
+        
+        Returns:
+            Tuple of (events, offset just past the last complete line)
+        """
+        try:
+            with open(self.log_file, 'rb') as f:
+                f.seek(offset)
+                data = f.read()
+        except IOError:
+            return [], 0
         
-        return default_stats
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            # Writers hold the lock for a whole append, so a partial line
+            # is a torn write from a crash; cut it off so the next append
+            # starts on a fresh line
+            try:
+                with open(self.log_file, 'r+b') as f:
+                    f.truncate(offset + complete)
+            except IOError:
+                pass
+        
+        events = []
+        for line in data[:complete].splitlines():
+            try:
+                event = json.loads(line)
+                events.append({
+                    "seq": int(event["seq"]),
+                    "won": bool(event["won"]),
+                    "difficulty": event["difficulty"],
+                    "guesses": int(event["guesses"]),
+                })
+            except (ValueError, KeyError, TypeError):
+                continue
+        return events, offset + complete
+    
+    def _sync(self):
+        """
+        Merge results written by other processes into the aggregate
+        
+        Must be called with the file lock held. New log lines are applied
+        incrementally; if another process compacted or reset the files the
+        aggregate is reloaded and this instance's unwritten results are
+        applied on top again.
+        """
+        if self._stats is None:
+            self._stats = self._load_stats()
+            return
+        
+        try:
+            log_size = os.path.getsize(self.log_file)
+        except OSError:
+            log_size = 0
+        
+        if (_file_signature(self.stats_file) != self._snapshot_signature
+                or log_size < self._log_offset):
+            self.stats = self._load_stats()
+            for event in self._pending:
+                _apply_game(self.stats, event["won"], event["difficulty"], event["guesses"])
+        elif log_size > self._log_offset:
+            events, self._log_offset = self._read_log(self._log_offset)
+            self._apply_events(self.stats, events)
+    
+    def _append_events(self, events: List[Dict]):
+        """Append events to the log in a single write"""
+        data = "".join(json.dumps(event, separators=(",", ":")) + "\n" for event in events)
+        try:
+            with open(self.log_file, 'ab') as f:
+                f.write(data.encode("utf-8"))
+                self._log_offset = f.tell()
+        except IOError:
+            pass
     
     def _save_stats(self):
-        """Save statistics to file"""
+        """
+        Write the aggregate snapshot atomically and truncate the event log
+        
+        Must be called with the file lock held, after ``_sync()``.
+        """
+        # Pending results are part of the aggregate, so they only need
+        # sequence numbers, not an append
+        self._seq += len(self._pending)
+        self._pending = []
+        self._cancel_flush_timer()
+        snapshot = dict(self.stats, log_seq=self._seq)
         try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.stats_file.parent), prefix=self.stats_file.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(snapshot, f, indent=2)
+                os.replace(tmp_path, self.stats_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._snapshot_signature = _file_signature(self.stats_file)
+            # Events up to log_seq are now in the snapshot and are skipped on
+            # replay, so truncating late or not at all is harmless
+            open(self.log_file, 'w').close()
+            self._log_offset = 0
+            self._log_events = 0
         except IOError:
             pass
     
-    def record_game(self, won: bool, difficulty: str = "medium", guesses: int = 0):
+    def subscribe(self, callback: Callable[[Dict], None]) -> Callable[[], None]:
+        """
+        Call ``callback(changes)`` whenever the aggregate changes
+        
+        ``changes`` maps each changed field, flattened to a dotted key
+        (``games_won``, ``by_difficulty.easy.played``), to its new value; the
+        first call after subscribing carries every field. Callbacks run on
+        the thread that changed the statistics.
+        
+        Args:
+            callback: Function taking the dict of changed fields
+            
+        Returns:
+            Function that unsubscribes the callback
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+            self._published = None
+        return lambda: self._subscribers.remove(callback)
+    
+    def _notify(self):
+        """Send subscribers the fields changed since the last notification"""
+        if not self._subscribers:
+            return
+        with self._lock:
+            if self._stats is None:
+                return
+            self._published, changes = stats_changes(self._stats, self._published)
+        if changes:
+            for callback in list(self._subscribers):
+                callback(changes)
+    
+    def compact(self):
+        """Fold the event log into the snapshot"""
+        with self._file_lock():
+            self._sync()
+            self._save_stats()
+        self._notify()
+    
+    def refresh(self):
+        """Merge in results recorded by other processes since the last write"""
+        with self._file_lock():
+            self._sync()
+        self._notify()
+    
+    def flush(self):
+        """Write all pending results to the event log"""
+        with self._file_lock():
+            self._cancel_flush_timer()
+            if not self._pending:
+                return
+            self._sync()
+            events = []
+            for event in self._pending:
+                self._seq += 1
+                events.append(dict(event, seq=self._seq))
+            self._pending = []
+            self._append_events(events)
+            self._log_events += len(events)
+            if self._log_events >= self.COMPACT_EVERY:
+                self._save_stats()
+    
+    def _cancel_flush_timer(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+    
+    def _schedule_flush(self):
+        """Make sure pending results get written within flush_interval"""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def record_game(self, won: bool, difficulty: str = "medium", guesses: int = 0, word: str = ""):
         """
         Record a game result
         
@@ -56,26 +432,24 @@ class Statistics:
             won: Whether the game was won
             difficulty: Game difficulty level
             guesses: Number of guesses made
+            word: The word that was played (kept in the event log only)
         """
-        self.stats["games_played"] += 1
-        self.stats["total_guesses"] += guesses
-        
-        if won:
-            self.stats["games_won"] += 1
-            self.stats["current_streak"] += 1
-            if self.stats["current_streak"] > self.stats["best_streak"]:
-                self.stats["best_streak"] = self.stats["current_streak"]
-        else:
-            self.stats["games_lost"] += 1
-            self.stats["current_streak"] = 0
-        
-        # Update difficulty stats
-        if difficulty in self.stats["by_difficulty"]:
-            self.stats["by_difficulty"][difficulty]["played"] += 1
-            if won:
-                self.stats["by_difficulty"][difficulty]["won"] += 1
-        
-        self._save_stats()
+        with self._lock:
+            _apply_game(self.stats, won, difficulty, guesses)
+            # Sequence numbers are assigned under the file lock when written
+            self._pending.append({
+                "ts": round(time.time(), 3),
+                "won": int(won),
+                "difficulty": difficulty,
+                "guesses": guesses,
+                "word": word,
+            })
+            
+            if not self.buffered or len(self._pending) >= self.flush_every:
+                self.flush()
+            else:
+                self._schedule_flush()
+        self._notify()
     
     def get_stats(self) -> Dict:
         """Get current statistics"""
@@ -89,17 +463,9 @@ class Statistics:
     
     def reset_stats(self):
         """Reset all statistics"""
-        self.stats = {
-            "games_played": 0,
-            "games_won": 0,
-            "games_lost": 0,
-            "total_guesses": 0,
-            "best_streak": 0,
-            "current_streak": 0,
-            "by_difficulty": {
-                "easy": {"played": 0, "won": 0},
-                "medium": {"played": 0, "won": 0},
-                "hard": {"played": 0, "won": 0}
-            }
-        }
-        self._save_stats()
+        with self._file_lock():
+            self._sync()
+            self.stats = _default_stats()
+            self._pending = []
+            self._save_stats()
+        self._notify()
@@ -0,0 +1,268 @@
+"""
+Compiled, memory-mapped word-pack format for very large dictionaries
+
+A word pack holds every difficulty section of a ``words.json`` file as a
+sorted offset table plus a UTF-8 blob, so a word and its clue can be read
+by index (or looked up by binary search) straight from an ``mmap`` without
+materialising the corpus as Python objects.
+
+Layout (all integers little-endian)::
+
+    header   magic b"HMWP", version u32, section count u32
+    sections name length u16, name (UTF-8), entry count u64,
+             offsets position u64, blob position u64
+    offsets  2 * count + 1 u64 blob offsets: word_0, hint_0, word_1, ...
+    blob     word_0 hint_0 word_1 hint_1 ... (UTF-8, no separators)
+
+Build a pack from the command line with::
+
+    python -m hangman_game.core.wordpack words.json words.pack
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from collections.abc import Mapping, Sequence
+from typing import Dict, Iterator, Tuple
+
+MAGIC = b"HMWP"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sII")
+_NAME_LEN = struct.Struct("<H")
+_SECTION = struct.Struct("<QQQ")
+_OFFSET = struct.Struct("<Q")
+_ENTRY = struct.Struct("<QQQ")
+
+
+class WordPackError(Exception):
+    """Raised when a word pack file is malformed"""
+
+
+class WordPackEntries(Sequence):
+    """Indexable (word, hint) view over a word pack section"""
+
+    def __init__(self, section: "WordPackSection"):
+        self._section = section
+
+    def __len__(self) -> int:
+        return len(self._section)
+
+    def __getitem__(self, index: int) -> Tuple[str, str]:
+        return self._section.entry(index)
+
+
+class WordPackSection(Mapping):
+    """Read-only word -> clue mapping for one difficulty of a word pack"""
+
+    def __init__(self, buffer, count: int, offsets_pos: int, blob_pos: int):
+        self._buffer = buffer
+        self._count = count
+        self._offsets_pos = offsets_pos
+        self._blob_pos = blob_pos
+        self.entries = WordPackEntries(self)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _span(self, index: int) -> Tuple[int, int, int]:
+        """Get the blob offsets of a word, its clue and the next word"""
+        return _ENTRY.unpack_from(self._buffer, self._offsets_pos + 16 * index)
+
+    def _decode(self, start: int, end: int) -> str:
+        base = self._blob_pos
+        return bytes(self._buffer[base + start:base + end]).decode("utf-8")
+
+    def word(self, index: int) -> str:
+        """Get the word stored at an index"""
+        word_start, hint_start, _ = self._span(index)
+        return self._decode(word_start, hint_start)
+
+    def entry(self, index: int) -> Tuple[str, str]:
+        """
+        Get the word and clue stored at an index
+
+        Args:
+            index: Entry position, 0 <= index < len(section)
+
+        Returns:
+            Tuple of (word, hint)
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("word pack index out of range")
+        word_start, hint_start, next_start = self._span(index)
+        return self._decode(word_start, hint_start), self._decode(hint_start, next_start)
+
+    def _find(self, word: str) -> int:
+        """Binary search the sorted words, returning the index or -1"""
+        target = word.encode("utf-8")
+        base = self._blob_pos
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            word_start, hint_start, _ = self._span(mid)
+            candidate = bytes(self._buffer[base + word_start:base + hint_start])
+            if candidate < target:
+                lo = mid + 1
+            elif candidate > target:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def __getitem__(self, word: str) -> str:
+        index = self._find(word) if isinstance(word, str) else -1
+        if index < 0:
+            raise KeyError(word)
+        return self.entry(index)[1]
+
+    def __contains__(self, word) -> bool:
+        return isinstance(word, str) and self._find(word) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self.word(index)
+
+
+class WordPack:
+    """A memory-mapped word pack file"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise WordPackError(f"{path} is empty")
+        self.sections: Dict[str, WordPackSection] = {}
+        try:
+            self._read_header()
+        except struct.error:
+            self.close()
+            raise WordPackError(f"{path} is truncated")
+
+    def _read_header(self):
+        magic, version, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise WordPackError(f"{self.path} is not a version {VERSION} word pack")
+
+        pos = _HEADER.size
+        for _ in range(count):
+            (name_len,) = _NAME_LEN.unpack_from(self._mmap, pos)
+            pos += _NAME_LEN.size
+            name = bytes(self._mmap[pos:pos + name_len]).decode("utf-8")
+            pos += name_len
+            entries, offsets_pos, blob_pos = _SECTION.unpack_from(self._mmap, pos)
+            pos += _SECTION.size
+            self.sections[name] = WordPackSection(self._mmap, entries, offsets_pos, blob_pos)
+
+    def section(self, difficulty: str) -> WordPackSection:
+        """Get the section for a difficulty (raises KeyError if missing)"""
+        return self.sections[difficulty]
+
+    def close(self):
+        """Unmap the file; sections become unusable afterwards"""
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def build_wordpack(sections: Dict[str, Dict[str, str]], pack_path) -> int:
+    """
+    Write difficulty sections of words and clues as a word pack
+
+    Args:
+        sections: Mapping of difficulty -> {word: clue}
+        pack_path: Destination file
+
+    Returns:
+        Total number of entries written
+    """
+    header = bytearray(_HEADER.pack(MAGIC, VERSION, len(sections)))
+    encoded = []
+    for name, words in sections.items():
+        name_bytes = name.encode("utf-8")
+        lowered = {word.lower(): str(hint) for word, hint in words.items()}
+        entries = sorted(
+            (word.encode("utf-8"), hint.encode("utf-8"))
+            for word, hint in lowered.items()
+        )
+        encoded.append((name_bytes, entries))
+        header += _NAME_LEN.pack(len(name_bytes)) + name_bytes + _SECTION.pack(0, 0, 0)
+
+    # Written to a temporary file and renamed over the destination, so a
+    # process that has the old pack memory-mapped keeps reading it intact
+    # (truncating a mapped file kills the reader with SIGBUS)
+    pack_path = os.fspath(pack_path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(pack_path)),
+        prefix=os.path.basename(pack_path), suffix=".tmp"
+    )
+    total = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            pos = len(header)
+            table_pos = _HEADER.size
+            for name_bytes, entries in encoded:
+                offsets_pos = pos
+                blob_pos = offsets_pos + _OFFSET.size * (2 * len(entries) + 1)
+                offset = 0
+                offsets = bytearray()
+                for word, hint in entries:
+                    offsets += _OFFSET.pack(offset)
+                    offset += len(word)
+                    offsets += _OFFSET.pack(offset)
+                    offset += len(hint)
+                offsets += _OFFSET.pack(offset)
+                f.write(offsets)
+                for word, hint in entries:
+                    f.write(word)
+                    f.write(hint)
+
+                # Patch this section's table entry now that positions are known
+                table_pos += _NAME_LEN.size + len(name_bytes)
+                end = f.tell()
+                f.seek(table_pos)
+                f.write(_SECTION.pack(len(entries), offsets_pos, blob_pos))
+                f.seek(end)
+                table_pos += _SECTION.size
+                pos = blob_pos + offset
+                total += len(entries)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, pack_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return total
+
+
+def main(argv=None):
+    """Build a word pack from a words JSON file"""
+    parser = argparse.ArgumentParser(
+        description="Compile a Hangman words JSON file into a memory-mapped word pack"
+    )
+    parser.add_argument("source", help="words JSON file ({difficulty: {word: clue}})")
+    parser.add_argument("output", help="word pack file to write")
+    args = parser.parse_args(argv)
+
+    with open(args.source, "r") as f:
+        sections = json.load(f)
+    count = build_wordpack(sections, args.output)
+    print(f"Wrote {count} words in {len(sections)} sections to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
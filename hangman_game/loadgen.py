@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Load generator for the headless Hangman server
+
+Opens many concurrent connections, plays complete games with random guesses
+and reports request throughput and latency percentiles::
+
+    python -m hangman_game.loadgen --clients 1000 --games 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import string
+import sys
+import time
+from typing import Dict, List
+
+from hangman_game.core.percentiles import percentile
+from hangman_game.server import DEFAULT_HOST, DEFAULT_PORT
+
+
+async def _request(reader, writer, latencies: List[float], request: Dict) -> Dict:
+    """Send one request and wait for its response, recording the latency"""
+    start = time.perf_counter()
+    writer.write(json.dumps(request, separators=(",", ":")).encode() + b"\n")
+    line = await reader.readline()
+    latencies.append(time.perf_counter() - start)
+    if not line:
+        raise ConnectionError("Server closed the connection")
+    return json.loads(line)
+
+
+async def run_client(host: str, port: int, games: int, difficulty: str,
+                     latencies: List[float], seed: int) -> int:
+    """Play games on one connection; returns the number of games won"""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    won = 0
+    try:
+        for _ in range(games):
+            response = await _request(reader, writer, latencies,
+                                      {"cmd": "new_game", "difficulty": difficulty})
+            game_id = response["game"]
+            letters = list(string.ascii_lowercase)
+            rng.shuffle(letters)
+            for letter in letters:
+                response = await _request(reader, writer, latencies,
+                                          {"cmd": "guess", "game": game_id, "letter": letter})
+                if response["state"]["is_game_over"]:
+                    won += response["state"]["game_won"]
+                    break
+            await _request(reader, writer, latencies, {"cmd": "end_game", "game": game_id})
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    return won
+
+
+async def run_load(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, clients: int = 100,
+                   games: int = 10, difficulty: str = "medium", seed: int = 0) -> Dict:
+    """
+    Run the load test
+
+    Args:
+        host: Server address
+        port: Server port
+        clients: Number of concurrent connections
+        games: Games played per connection
+        difficulty: Difficulty of every game
+        seed: Base seed for the random guesses
+
+    Returns:
+        Dict with request counts, throughput and latency percentiles (ms)
+    """
+    latencies: List[float] = []
+    start = time.perf_counter()
+    results = await asyncio.gather(*[
+        run_client(host, port, games, difficulty, latencies, seed + client)
+        for client in range(clients)
+    ])
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        "clients": clients,
+        "games": clients * games,
+        "games_won": sum(results),
+        "requests": len(ordered),
+        "seconds": elapsed,
+        "requests_per_second": len(ordered) / elapsed if elapsed else 0.0,
+        "games_per_second": clients * games / elapsed if elapsed else 0.0,
+        "latency_ms": {
+            "p50": percentile(ordered, 0.50) * 1000,
+            "p95": percentile(ordered, 0.95) * 1000,
+            "p99": percentile(ordered, 0.99) * 1000,
+            "max": ordered[-1] * 1000,
+        } if ordered else {},
+    }
+
+
+def main(argv=None):
+    """Main entry point for the load generator"""
+    parser = argparse.ArgumentParser(description="Load generator for the Hangman server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--clients", type=int, default=100, help="concurrent connections")
+    parser.add_argument("--games", type=int, default=10, help="games per connection")
+    parser.add_argument("--difficulty", default="medium", choices=["easy", "medium", "hard"])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_load(args.host, args.port, args.clients, args.games,
+                                  args.difficulty, args.seed))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Headless Hangman game server speaking newline-delimited JSON over TCP
+
+Every request is one JSON object per line with a ``cmd`` field; every
+response is one JSON object per line. An optional ``id`` field is echoed
+back so clients can pipeline requests.
+
+Commands::
+
+    {"cmd": "new_game", "difficulty": "easy"}   -> {"ok": true, "game": "1", "state": {...}}
+    {"cmd": "guess", "game": "1", "letter": "e"} -> {"ok": true, "result": {...}, "state": {...}}
+    {"cmd": "state", "game": "1"}                -> {"ok": true, "state": {...}}
+    {"cmd": "end_game", "game": "1"}             -> {"ok": true}
+
+Errors are reported as ``{"ok": false, "error": "..."}``. Games belong to
+the connection that created them and are dropped when it closes.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+from typing import Dict
+
+from hangman_game.core.game_logic import ALPHABET, MAX_INCORRECT_GUESSES, preload_words
+from hangman_game.core.session import GameSession
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Longest request line accepted before the connection is closed
+MAX_LINE_BYTES = 4096
+
+# Letters a client may guess
+GUESSABLE = frozenset(ALPHABET)
+
+
+class RequestError(Exception):
+    """Raised for a request the server can't process"""
+
+
+class HangmanServer:
+    """Hosts many concurrent game sessions on a single event loop"""
+
+    def __init__(self, words_file=None, max_games_per_client: int = 16):
+        """
+        Initialize the server
+
+        Args:
+            words_file: Optional words JSON file or word pack to play from
+            max_games_per_client: Open games allowed per connection
+        """
+        self.words_file = words_file
+        self.max_games_per_client = max_games_per_client
+        self.sessions: Dict[str, GameSession] = {}
+        self._game_ids = itertools.count(1)
+        self.connections = 0
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """Start listening; returns the ``asyncio.Server``"""
+        preload_words(words_file=self.words_file)
+        return await asyncio.start_server(
+            self.handle_client, host, port, limit=MAX_LINE_BYTES
+        )
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one connection until it closes"""
+        owned = set()
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    writer.write(b'{"ok": false, "error": "Request too long"}\n')
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    writer.write(self.handle_line(line, owned))
+                    # Only wait when the peer isn't keeping up
+                    if writer.transport.get_write_buffer_size() > 65536:
+                        await writer.drain()
+        finally:
+            self.connections -= 1
+            for game_id in owned:
+                self.sessions.pop(game_id, None)
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def handle_line(self, line: bytes, owned: set) -> bytes:
+        """Process one request line and return the encoded response line"""
+        request_id = None
+        try:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                raise RequestError("Invalid JSON")
+            if not isinstance(request, dict):
+                raise RequestError("Request must be a JSON object")
+            request_id = request.get("id")
+            response = self.dispatch(request, owned)
+        except RequestError as e:
+            response = {"ok": False, "error": str(e)}
+        except Exception:
+            # A request the checks above missed must not end the connection
+            response = {"ok": False, "error": "Internal error"}
+        if request_id is not None:
+            response["id"] = request_id
+        return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+    def dispatch(self, request: Dict, owned: set) -> Dict:
+        """Run a single decoded request"""
+        cmd = request.get("cmd")
+        if cmd == "new_game":
+            return self.new_game(request, owned)
+        if cmd == "guess":
+            session = self._session(request, owned)
+            letter = request.get("letter")
+            if not isinstance(letter, str) or letter.lower() not in GUESSABLE:
+                raise RequestError("Guess must be a single letter (a-z)")
+            result = session.make_guess(letter.lower())
+            return {"ok": True, "result": result, "state": session.get_game_state()}
+        if cmd == "state":
+            session = self._session(request, owned)
+            return {"ok": True, "state": session.get_game_state()}
+        if cmd == "end_game":
+            self._session(request, owned)
+            game_id = request["game"]
+            owned.discard(game_id)
+            del self.sessions[game_id]
+            return {"ok": True}
+        raise RequestError(f"Unknown command: {cmd}")
+
+    def new_game(self, request: Dict, owned: set) -> Dict:
+        """Start a game for this connection"""
+        difficulty = request.get("difficulty", "medium")
+        if not isinstance(difficulty, str) or difficulty not in MAX_INCORRECT_GUESSES:
+            raise RequestError(f"Unknown difficulty: {difficulty}")
+        if len(owned) >= self.max_games_per_client:
+            raise RequestError("Too many open games")
+
+        game_id = str(next(self._game_ids))
+        session = GameSession.new(difficulty, self.words_file)
+        self.sessions[game_id] = session
+        owned.add(game_id)
+        return {"ok": True, "game": game_id, "state": session.get_game_state()}
+
+    def _session(self, request: Dict, owned: set) -> GameSession:
+        """Get a game owned by this connection"""
+        game_id = request.get("game")
+        if not isinstance(game_id, str) or game_id not in owned:
+            raise RequestError("Unknown game")
+        return self.sessions[game_id]
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, words_file=None):
+    """Run a server until cancelled"""
+    server = await HangmanServer(words_file).start(host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Hangman server listening on {addresses}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Main entry point for the headless server"""
+    parser = argparse.ArgumentParser(description="Headless JSON-lines Hangman server")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"address to bind (default {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port to bind (default {DEFAULT_PORT})")
+    parser.add_argument("--words", help="words JSON file or word pack to play from")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.words))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Batch simulation of headless Hangman games for difficulty calibration
+
+Plays many games per difficulty with a pluggable guessing strategy across a
+``multiprocessing`` pool and reports win rates per difficulty and per word::
+
+    python -m hangman_game.simulate --games 1000000 --strategy frequency
+
+Games are split into fixed-size chunks, each seeded from the base seed, the
+difficulty and the chunk number, so results are identical for any number of
+worker processes. Workers return per-word tallies rather than games, and
+the parent merges them as they arrive, so memory stays proportional to the
+corpus size however many games are played.
+"""
+
+import argparse
+import functools
+import importlib
+import json
+import multiprocessing
+import random
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from hangman_game.core.game_logic import ALPHABET, MAX_INCORRECT_GUESSES, load_words, word_entries
+from hangman_game.core.percentiles import percentile
+from hangman_game.core.session import GameSession
+from hangman_game.core.solver import FALLBACK_ORDER, Solver
+
+ALL_LETTERS = (1 << len(ALPHABET)) - 1
+
+CHUNK_SIZE = 5000
+
+# A strategy picks the next letter for a game: strategy(game, rng) -> letter.
+# Strategies with a true ``uses_solver`` attribute are also passed the
+# corpus solver as ``solver=``, resolved once per chunk.
+Strategy = Callable[[GameSession, random.Random], str]
+
+
+def random_strategy(game: GameSession, rng: random.Random) -> str:
+    """Guess a random unguessed letter"""
+    guessed = set(game.guessed_letters)
+    return rng.choice([letter for letter in ALPHABET if letter not in guessed])
+
+
+def english_order_strategy(game: GameSession, rng: random.Random) -> str:
+    """Guess letters in English frequency order"""
+    guessed = game.guessed_letters
+    return next(letter for letter in FALLBACK_ORDER if letter not in guessed)
+
+
+def _solver_strategy(kind: str) -> Strategy:
+    def strategy(game: GameSession, rng: random.Random, solver: Solver) -> str:
+        return solver.next_guess(game, kind)
+    strategy.__doc__ = f"Guess with the corpus solver ({kind})"
+    strategy.uses_solver = True
+    return strategy
+
+
+STRATEGIES: Dict[str, Strategy] = {
+    "random": random_strategy,
+    "english": english_order_strategy,
+    "frequency": _solver_strategy("frequency"),
+    "entropy": _solver_strategy("entropy"),
+}
+
+
+def resolve_strategy(name: str) -> Strategy:
+    """
+    Look up a strategy by name or import one as ``package.module:function``
+
+    Args:
+        name: A key of STRATEGIES or an importable ``module:function``
+
+    Returns:
+        The strategy callable
+    """
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    module_name, _, attr = name.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown strategy: {name}")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def play_chunk(task: Tuple) -> Dict:
+    """
+    Play one chunk of games (runs in a worker process)
+
+    Args:
+        task: (difficulty, chunk number, games, seed, strategy name,
+               words file, max incorrect guesses)
+
+    Returns:
+        Partial tallies: per-word [played, won] and a histogram of wrong
+        guesses per game
+    """
+    difficulty, chunk, games, seed, strategy_name, words_file, max_incorrect = task
+
+    rng = random.Random(f"{seed}:{difficulty}:{chunk}")
+    strategy = resolve_strategy(strategy_name)
+    if getattr(strategy, "uses_solver", False):
+        # Once per chunk: Solver.for_corpus checks the words file each call
+        strategy = functools.partial(strategy, solver=Solver.for_corpus(difficulty, words_file))
+    entries = word_entries(load_words(difficulty, words_file))
+    words: Dict[int, List[int]] = {}
+    # A limit below 1 still ends a game at its first wrong guess
+    wrong = [0] * (max(max_incorrect, 1) + 1)
+
+    for _ in range(games):
+        index = rng.randrange(len(entries))
+        game = GameSession(entries, index, max_incorrect)
+        # Words with characters outside a-z can't be completed; the game
+        # ends as a loss once every letter has been tried (a strategy
+        # repeating a guess ends it too, rather than looping forever)
+        while not game.status and game.guessed & ALL_LETTERS != ALL_LETTERS:
+            if not game.make_guess(strategy(game, rng))["valid"]:
+                break
+        tally = words.get(index)
+        if tally is None:
+            tally = words[index] = [0, 0]
+        tally[0] += 1
+        if game.status == GameSession.WON:
+            tally[1] += 1
+        wrong[game.incorrect_guesses] += 1
+
+    return {
+        "difficulty": difficulty,
+        "words": {entries[index][0].lower(): tally for index, tally in words.items()},
+        "wrong_guesses": wrong,
+    }
+
+
+def _tasks(difficulties: List[str], games: int, seed: int, strategy: str,
+           words_file, max_incorrect: Optional[int]) -> Iterator[Tuple]:
+    for difficulty in difficulties:
+        limit = max_incorrect
+        if limit is None:
+            limit = MAX_INCORRECT_GUESSES.get(difficulty, 6)
+        for chunk, start in enumerate(range(0, games, CHUNK_SIZE)):
+            yield (difficulty, chunk, min(CHUNK_SIZE, games - start), seed, strategy,
+                   words_file, limit)
+
+
+def summarize(words: Dict[str, List[int]], wrong: List[int]) -> Dict:
+    """Build the report for one difficulty from merged tallies"""
+    played = sum(tally[0] for tally in words.values())
+    won = sum(tally[1] for tally in words.values())
+    rates = {word: tally[1] / tally[0] for word, tally in words.items()}
+    ordered = sorted(rates.values())
+    by_rate = sorted(rates, key=lambda word: (rates[word], word))
+    return {
+        "games": played,
+        "win_rate": won / played if played else 0.0,
+        "mean_wrong_guesses": sum(n * count for n, count in enumerate(wrong)) / played if played else 0.0,
+        "wrong_guesses_histogram": wrong,
+        "word_win_rate_distribution": {
+            "min": ordered[0],
+            "p10": percentile(ordered, 0.10),
+            "p50": percentile(ordered, 0.50),
+            "p90": percentile(ordered, 0.90),
+            "max": ordered[-1],
+        } if ordered else {},
+        "hardest_words": [[word, rates[word]] for word in by_rate[:5]],
+        "easiest_words": [[word, rates[word]] for word in by_rate[::-1][:5]],
+        "words": {word: {"played": tally[0], "won": tally[1]} for word, tally in sorted(words.items())},
+    }
+
+
+def simulate(games: int = 10000, difficulties=("easy", "medium", "hard"), strategy: str = "frequency",
+             processes: Optional[int] = None, seed: int = 0, words_file=None,
+             max_incorrect: Optional[int] = None, progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+    """
+    Play games in parallel and report win rates
+
+    Args:
+        games: Games per difficulty
+        difficulties: Difficulties to simulate
+        strategy: Strategy name or ``module:function``
+        processes: Worker processes (defaults to the CPU count; 1 runs inline)
+        seed: Base random seed
+        words_file: Optional words JSON file or word pack
+        max_incorrect: Override the wrong-guess limit of every difficulty
+        progress: Called with (games done, games total) as chunks complete
+
+    Returns:
+        Dict with a report per difficulty
+    """
+    resolve_strategy(strategy)  # fail fast on a bad name
+    difficulties = list(difficulties)
+    tasks = list(_tasks(difficulties, games, seed, strategy, words_file, max_incorrect))
+    words = {difficulty: {} for difficulty in difficulties}
+    wrong = {difficulty: [] for difficulty in difficulties}
+    total, done = games * len(difficulties), 0
+
+    def merge(partial: Dict):
+        nonlocal done
+        merged = words[partial["difficulty"]]
+        for word, (played, won) in partial["words"].items():
+            tally = merged.get(word)
+            if tally is None:
+                merged[word] = [played, won]
+            else:
+                tally[0] += played
+                tally[1] += won
+        histogram = wrong[partial["difficulty"]]
+        for n, count in enumerate(partial["wrong_guesses"]):
+            if n < len(histogram):
+                histogram[n] += count
+            else:
+                histogram.append(count)
+        done += sum(played for played, _ in partial["words"].values())
+        if progress is not None:
+            progress(done, total)
+
+    start = time.perf_counter()
+    if processes == 1:
+        for task in tasks:
+            merge(play_chunk(task))
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            for partial in pool.imap_unordered(play_chunk, tasks):
+                merge(partial)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "strategy": strategy,
+        "seed": seed,
+        "seconds": elapsed,
+        "games_per_second": total / elapsed if elapsed else 0.0,
+        "difficulties": {
+            difficulty: summarize(words[difficulty], wrong[difficulty])
+            for difficulty in difficulties
+        },
+    }
+
+
+def _print_report(report: Dict):
+    print(f"Strategy: {report['strategy']}  "
+          f"({report['games_per_second']:.0f} games/sec, {report['seconds']:.1f}s)")
+    for difficulty, summary in report["difficulties"].items():
+        spread = summary["word_win_rate_distribution"]
+        print(f"\n{difficulty.capitalize()}: {summary['games']} games, "
+              f"win rate {summary['win_rate'] * 100:.1f}%, "
+              f"{summary['mean_wrong_guesses']:.2f} wrong guesses on average")
+        if spread:
+            print("  Per-word win rate: "
+                  + ", ".join(f"{key} {value * 100:.1f}%" for key, value in spread.items()))
+        print("  Hardest: " + ", ".join(f"{word} ({rate * 100:.0f}%)" for word, rate in summary["hardest_words"]))
+
+
+def main(argv=None):
+    """Main entry point for the simulator"""
+    parser = argparse.ArgumentParser(description="Simulate Hangman games to calibrate difficulty")
+    parser.add_argument("--games", type=int, default=10000, help="games per difficulty")
+    parser.add_argument("--difficulty", action="append", choices=list(MAX_INCORRECT_GUESSES),
+                        help="difficulty to simulate (repeatable; default all)")
+    parser.add_argument("--strategy", default="frequency",
+                        help=f"one of {', '.join(STRATEGIES)} or module:function")
+    parser.add_argument("--processes", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--words", help="words JSON file or word pack")
+    parser.add_argument("--max-incorrect", type=int, help="override every difficulty's wrong-guess limit")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    args = parser.parse_args(argv)
+
+    def progress(done, total):
+        print(f"\r{done}/{total} games", end="", file=sys.stderr, flush=True)
+
+    report = simulate(
+        games=args.games,
+        difficulties=args.difficulty or list(MAX_INCORRECT_GUESSES),
+        strategy=args.strategy,
+        processes=args.processes,
+        seed=args.seed,
+        words_file=args.words,
+        max_incorrect=args.max_incorrect,
+        progress=progress,
+    )
+    print(file=sys.stderr)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,14 +4,34 @@ Enhanced GUI for Hangman game with improved UX
 
 import tkinter as tk
 from tkinter import messagebox, ttk
+from hangman_game.core import metrics
 from hangman_game.core.game_logic import HangmanLogic
 from hangman_game.core.statistics import Statistics
 from hangman_game.ui.hangman_art import get_hangman_stage
+from hangman_game.ui.io_worker import IOWorker
 
 
 class HangmanGUI:
     """Enhanced Hangman game GUI"""
     
+    # Statistics window rows: (field, label), with None for a spacer
+    STATS_ROWS = (
+        ("games_played", "Games Played"),
+        ("games_won", "Games Won"),
+        ("games_lost", "Games Lost"),
+        ("win_rate", "Win Rate"),
+        None,
+        ("current_streak", "Current Streak"),
+        ("best_streak", "Best Streak"),
+        None,
+        ("by_difficulty.easy.played", "Easy Played"),
+        ("by_difficulty.easy.won", "Easy Won"),
+        ("by_difficulty.medium.played", "Medium Played"),
+        ("by_difficulty.medium.won", "Medium Won"),
+        ("by_difficulty.hard.played", "Hard Played"),
+        ("by_difficulty.hard.won", "Hard Won"),
+    )
+    
     def __init__(self, master):
         self.master = master
         self.master.title("Hangman Game")
@@ -20,13 +40,31 @@ class HangmanGUI:
         
         # Game components
         self.difficulty = tk.StringVar(value="medium")
-        self.game_logic = None
+        # One engine for the whole session, with every difficulty's words
+        # loaded up front so new games never read the words file
+        self.game_logic = HangmanLogic(difficulty=self.difficulty.get())
+        self.game_logic.preload()
+        # Statistics files are read and written on the I/O worker thread
+        # only, so a slow home directory never blocks the window
         self.stats = Statistics()
+        self.io = IOWorker(self.master)
+        # Latest statistics by field, kept current by the subscription; the
+        # statistics window is built on first use and then only hidden
+        self.stats_values = {}
+        self.stats_window = None
+        self.stats_labels = {}
+        self.stats.subscribe(lambda changes: self.io.post(self.on_stats_changed, changes))
         
         # UI variables
         self.display_word = tk.StringVar()
         self.hangman_display = tk.StringVar()
         
+        # Redraw bookkeeping: values last applied to the widgets, the pending
+        # status message and the scheduled after_idle redraw
+        self._rendered = {}
+        self._status = ("Ready to play!", None)
+        self._redraw_id = None
+        
         # Colors and styling
         self.bg_color = "#f0f0f0"
         self.primary_color = "#2c3e50"
@@ -40,6 +78,10 @@ class HangmanGUI:
         
         # Bind keyboard events
         self.master.bind('<Key>', self.on_key_press)
+        self.master.protocol("WM_DELETE_WINDOW", self.close)
+        
+        # Read the statistics once the window is up
+        self.master.after_idle(lambda: self.io.submit(self.stats.refresh))
     
     def create_widgets(self):
         """Create all GUI widgets"""
@@ -211,16 +253,9 @@ class HangmanGUI:
     
     def start_new_game(self):
         """Start a new game"""
-        self.game_logic = HangmanLogic(difficulty=self.difficulty.get())
-        word, hint = self.game_logic.start_new_game()
-        
-        # Update UI
-        self.display_word.set(self.game_logic.get_display_word())
-        self.hint_label.config(text=f"💡 Hint: {hint}")
-        self.update_hangman_display()
-        self.update_incorrect_label()
-        self.enable_all_buttons()
-        self.status_label.config(text=f"Game started! Difficulty: {self.difficulty.get().capitalize()}")
+        word, hint = self.game_logic.reset(difficulty=self.difficulty.get())
+        
+        self.set_status(f"Game started! Difficulty: {self.difficulty.get().capitalize()}")
     
     def change_difficulty(self):
         """Handle difficulty change"""
@@ -238,59 +273,98 @@ class HangmanGUI:
             messagebox.showinfo("Already Guessed", "You've already guessed that letter!")
             return
         
-        # Disable the button
-        self.buttons[letter].config(
-            state=tk.DISABLED,
-            bg="#95a5a6" if not result["correct"] else "#27ae60"
-        )
-        
-        # Update display
-        self.display_word.set(self.game_logic.get_display_word())
-        self.update_hangman_display()
-        self.update_incorrect_label()
-        
         # Check game state
         if result.get("game_won"):
             self.handle_game_won()
         elif result.get("game_lost"):
             self.handle_game_lost()
         elif result["correct"]:
-            self.status_label.config(text="✓ Correct letter!", bg=self.success_color)
+            self.set_status("✓ Correct letter!", self.success_color)
         else:
-            self.status_label.config(text="✗ Wrong letter!", bg=self.danger_color)
+            self.set_status("✗ Wrong letter!", self.danger_color)
     
     def on_key_press(self, event):
         """Handle keyboard input"""
         if event.char.isalpha() and len(event.char) == 1:
             letter = event.char.lower()
-            if letter in self.letters and self.buttons[letter]["state"] != tk.DISABLED:
+            # Checked against the game rather than the button, which may not
+            # be redrawn yet
+            if letter in self.letters and letter not in self.game_logic.guessed_letters:
                 self.guess(letter)
     
-    def update_hangman_display(self):
-        """Update the hangman ASCII art"""
-        state = self.game_logic.get_game_state()
-        art = get_hangman_stage(
-            state["incorrect_guesses"],
-            state["max_incorrect_guesses"]
-        )
-        self.hangman_display.set(art)
+    def set_status(self, text, bg=None):
+        """
+        Set the status bar message (applied with the next redraw)
+        
+        Args:
+            text: Message to show
+            bg: Background color, or None to keep the current one
+        """
+        self._status = (text, bg)
+        self.schedule_redraw()
+    
+    def schedule_redraw(self):
+        """
+        Redraw the game widgets once the pending events have been handled
+        
+        Every guess and new game calls this, but a burst of events (such as
+        a held-down key) is drawn by a single idle callback.
+        """
+        if self._redraw_id is None:
+            self._redraw_id = self.master.after_idle(self._redraw)
     
-    def update_incorrect_label(self):
-        """Update the incorrect guesses label"""
+    def _changed(self, key, value):
+        """Record the value for a widget and tell whether it differs from the drawn one"""
+        if self._rendered.get(key) == value:
+            return False
+        self._rendered[key] = value
+        return True
+    
+    def _redraw(self):
+        """Apply the current game state to the widgets whose values changed"""
+        self._redraw_id = None
         state = self.game_logic.get_game_state()
-        self.incorrect_label.config(
-            text=f"❌ Incorrect guesses: {state['incorrect_guesses']}/{state['max_incorrect_guesses']}"
-        )
+        
+        display_word = state["display_word"]
+        if self._changed("word", display_word):
+            self.display_word.set(display_word)
+        
+        if self._changed("hint", state["hint"]):
+            self.hint_label.config(text=f"💡 Hint: {state['hint']}")
+        
+        stage = (state["incorrect_guesses"], state["max_incorrect_guesses"])
+        if self._changed("stage", stage):
+            self.hangman_display.set(get_hangman_stage(*stage))
+            self.incorrect_label.config(text=f"❌ Incorrect guesses: {stage[0]}/{stage[1]}")
+        
+        # Guessed letters are disabled, green if revealed and gray if wrong;
+        # the rest are disabled only once the game is over
+        guessed = set(state["guessed_letters"])
+        over = state["is_game_over"]
+        for letter, button in self.buttons.items():
+            if letter in guessed:
+                view = (tk.DISABLED, "#27ae60" if letter in display_word else "#95a5a6")
+            else:
+                view = (tk.DISABLED if over else tk.NORMAL, "#3498db")
+            if self._changed(("button", letter), view):
+                button.config(state=view[0], bg=view[1])
+        
+        text, bg = self._status
+        if self._changed("status", text):
+            self.status_label.config(text=text)
+        if bg is not None and self._changed("status_bg", bg):
+            self.status_label.config(bg=bg)
     
     def handle_game_won(self):
         """Handle game won state"""
-        self.disable_all_buttons()
-        self.stats.record_game(
+        self.io.submit(
+            self.stats.record_game,
             won=True,
             difficulty=self.difficulty.get(),
-            guesses=len(self.game_logic.guessed_letters)
+            guesses=len(self.game_logic.guessed_letters),
+            word=self.game_logic.word_to_guess
         )
-        self.status_label.config(text="🎉 Congratulations! You won!", bg=self.success_color)
+        self.set_status("🎉 Congratulations! You won!", self.success_color)
         messagebox.showinfo(
             "Victory! 🎉",
             f"Congratulations! You've guessed the word:\n\n{self.game_logic.word_to_guess.upper()}\n\n"
@@ -299,35 +373,56 @@ class HangmanGUI:
     
     def handle_game_lost(self):
         """Handle game lost state"""
-        self.disable_all_buttons()
-        self.stats.record_game(
+        self.io.submit(
+            self.stats.record_game,
             won=False,
             difficulty=self.difficulty.get(),
-            guesses=len(self.game_logic.guessed_letters)
+            guesses=len(self.game_logic.guessed_letters),
+            word=self.game_logic.word_to_guess
         )
-        self.status_label.config(text="😢 Game Over - You lost!", bg=self.danger_color)
+        self.set_status("😢 Game Over - You lost!", self.danger_color)
         messagebox.showinfo(
             "Game Over 😢",
             f"Sorry, you've run out of guesses!\n\nThe word was:\n\n{self.game_logic.word_to_guess.upper()}"
         )
     
-    def enable_all_buttons(self):
-        """Enable all letter buttons"""
-        for button in self.buttons.values():
-            button.config(state=tk.NORMAL, bg="#3498db")
+    def on_stats_changed(self, changes):
+        """Store changed statistics fields and update their labels if shown"""
+        self.stats_values.update(changes)
+        if "games_played" in changes or "games_won" in changes:
+            played = self.stats_values.get("games_played", 0)
+            win_rate = self.stats_values.get("games_won", 0) / played * 100 if played else 0.0
+            changes = dict(changes, win_rate=win_rate)
+            self.stats_values["win_rate"] = win_rate
+        if self.stats_window is not None:
+            for field, value in changes.items():
+                label = self.stats_labels.get(field)
+                if label is not None:
+                    label.config(text=self.format_stat(field, value))
     
-    def disable_all_buttons(self):
-        """Disable all letter buttons"""
-        for button in self.buttons.values():
-            button.config(state=tk.DISABLED)
+    @staticmethod
+    def format_stat(field, value):
+        """Format a statistics field for its label"""
+        if field == "win_rate":
+            return f"{value:.1f}%"
+        return str(value)
     
     def show_statistics(self):
-        """Show statistics window"""
+        """Show the statistics window, building it the first time"""
+        if self.stats_window is None:
+            self.create_statistics_window()
+        else:
+            self.stats_window.deiconify()
+            self.stats_window.lift()
+    
+    def create_statistics_window(self):
+        """Build the statistics window (hidden rather than destroyed on close)"""
         stats_window = tk.Toplevel(self.master)
         stats_window.title("Game Statistics")
-        stats_window.geometry("400x400")
+        stats_window.geometry("400x480")
         stats_window.resizable(False, False)
         stats_window.configure(bg=self.bg_color)
+        stats_window.protocol("WM_DELETE_WINDOW", stats_window.withdraw)
         
         # Title
         tk.Label(
@@ -338,53 +433,37 @@ class HangmanGUI:
             fg=self.primary_color
         ).pack(pady=15)
         
-        stats = self.stats.get_stats()
-        win_rate = self.stats.get_win_rate()
-        
-        # Stats frame
-        stats_frame = tk.Frame(stats_window, bg="white", relief=tk.RIDGE, bd=2)
+        # Stats frame: one name and one value label per field
+        stats_frame = tk.Frame(stats_window, bg="white", relief=tk.RIDGE, bd=2, padx=20, pady=10)
         stats_frame.pack(pady=10, padx=20, fill=tk.BOTH, expand=True)
         
-        # General stats
-        stats_text = f"""
-        Games Played: {stats['games_played']}
-        Games Won: {stats['games_won']}
-        Games Lost: {stats['games_lost']}
-        Win Rate: {win_rate:.1f}%
-        
-        Current Streak: {stats['current_streak']}
-        Best Streak: {stats['best_streak']}
-        
-        By Difficulty:
-        
-        Easy:
-          Played: {stats['by_difficulty']['easy']['played']}
-          Won: {stats['by_difficulty']['easy']['won']}
-        
-        Medium:
-          Played: {stats['by_difficulty']['medium']['played']}
-          Won: {stats['by_difficulty']['medium']['won']}
-        
-        Hard:
-          Played: {stats['by_difficulty']['hard']['played']}
-          Won: {stats['by_difficulty']['hard']['won']}
-        """
-        
-        tk.Label(
-            stats_frame,
-            text=stats_text,
-            font=("Courier", 11),
-            bg="white",
-            justify=tk.LEFT,
-            padx=20,
-            pady=10
-        ).pack()
+        for row, entry in enumerate(self.STATS_ROWS):
+            if entry is None:
+                tk.Label(stats_frame, text="", bg="white").grid(row=row, column=0)
+                continue
+            field, name = entry
+            tk.Label(
+                stats_frame,
+                text=f"{name}:",
+                font=("Courier", 11),
+                bg="white",
+                anchor=tk.W
+            ).grid(row=row, column=0, sticky=tk.W)
+            value = self.stats_values.get(field)
+            self.stats_labels[field] = tk.Label(
+                stats_frame,
+                text="…" if value is None else self.format_stat(field, value),
+                font=("Courier", 11, "bold"),
+                bg="white",
+                anchor=tk.E
+            )
+            self.stats_labels[field].grid(row=row, column=1, sticky=tk.E, padx=(20, 0))
         
         # Reset button
         reset_button = tk.Button(
             stats_window,
             text="Reset Statistics",
-            command=lambda: self.reset_statistics(stats_window),
+            command=self.reset_statistics,
             font=("Helvetica", 10),
             bg=self.danger_color,
             fg="white",
@@ -397,7 +476,7 @@ class HangmanGUI:
         close_button = tk.Button(
             stats_window,
             text="Close",
-            command=stats_window.destroy,
+            command=stats_window.withdraw,
             font=("Helvetica", 10),
             bg=self.primary_color,
             fg="white",
@@ -405,17 +484,28 @@ class HangmanGUI:
             pady=5
         )
         close_button.pack(pady=5)
+        self.stats_window = stats_window
     
-    def reset_statistics(self, window):
+    def reset_statistics(self):
         """Reset all statistics"""
-        if messagebox.askyesno("Reset Statistics", "Are you sure you want to reset all statistics?"):
-            self.stats.reset_stats()
-            window.destroy()
-            messagebox.showinfo("Statistics Reset", "All statistics have been reset.")
+        if messagebox.askyesno("Reset Statistics", "Are you sure you want to reset all statistics?",
+                               parent=self.stats_window):
+            self.io.submit(
+                self.stats.reset_stats,
+                on_done=lambda _: messagebox.showinfo(
+                    "Statistics Reset", "All statistics have been reset.", parent=self.stats_window
+                )
+            )
+    
+    def close(self):
+        """Write outstanding statistics, then close the window"""
+        self.io.stop()
+        self.master.destroy()
 
 
 def main():
     """Main entry point for the GUI"""
+    metrics.enable_from_env()
     root = tk.Tk()
     app = HangmanGUI(root)
     root.mainloop()
@@ -0,0 +1,123 @@
+"""
+Background I/O worker for the Tk GUI
+"""
+
+import queue
+import threading
+from typing import Callable, Optional
+
+
+class IOWorker:
+    """
+    Run blocking calls (statistics file I/O) on one background thread
+
+    Jobs run in submission order, so a statistics read queued after a write
+    sees that write. Results are handed back to the Tk thread: while jobs are
+    outstanding the worker polls its completion queue with ``master.after()``
+    and calls each job's ``on_done`` or ``on_error`` there, so callbacks can
+    touch widgets. Tk isn't called from the worker thread.
+
+    ``submit`` and ``stop`` must be called from the Tk thread.
+    """
+
+    POLL_MS = 20
+
+    def __init__(self, master, poll_ms: int = POLL_MS):
+        """
+        Start the worker thread
+
+        Args:
+            master: Tk widget used to schedule completion callbacks
+            poll_ms: Milliseconds between completion checks while jobs run
+        """
+        self.master = master
+        self.poll_ms = poll_ms
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._done: "queue.Queue" = queue.Queue()
+        self._outstanding = 0
+        self._poll_id = None
+        self._thread = threading.Thread(target=self._run, name="hangman-io", daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        """Whether submitted jobs haven't reported back yet"""
+        return self._outstanding > 0
+
+    def submit(self, func: Callable, *args, on_done: Optional[Callable] = None,
+               on_error: Optional[Callable] = None, **kwargs):
+        """
+        Queue a call to run on the worker thread
+
+        Args:
+            func: Function to call with ``*args`` and ``**kwargs``
+            on_done: Called on the Tk thread with the function's result
+            on_error: Called on the Tk thread with the exception if the
+                function raised (without one, the exception is re-raised
+                there and reported like any Tk callback error)
+        """
+        self._outstanding += 1
+        self._jobs.put((func, args, kwargs, on_done, on_error))
+        if self._poll_id is None:
+            self._poll_id = self.master.after(self.poll_ms, self._poll)
+
+    def _run(self):
+        """Worker thread: run jobs until the stop marker"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            func, args, kwargs, on_done, on_error = job
+            try:
+                self._done.put((True, on_done, on_error, func(*args, **kwargs), None))
+            except Exception as e:
+                self._done.put((True, on_done, on_error, None, e))
+
+    def post(self, callback: Callable, value=None):
+        """
+        Have ``callback(value)`` called on the Tk thread (callable from any thread)
+
+        Delivery rides on the completion polling, so this is meant for jobs
+        reporting progress or events (e.g. a ``Statistics`` subscriber
+        called during ``record_game``): posts made while no job is
+        outstanding are delivered after the next submitted job.
+        """
+        self._done.put((False, callback, None, value, None))
+
+    def _poll(self):
+        """Deliver finished jobs' results, polling again while any are left"""
+        self._poll_id = None
+        try:
+            while True:
+                try:
+                    finished, on_done, on_error, result, error = self._done.get_nowait()
+                except queue.Empty:
+                    break
+                if finished:
+                    self._outstanding -= 1
+                if error is None:
+                    if on_done is not None:
+                        on_done(result)
+                elif on_error is not None:
+                    on_error(error)
+                else:
+                    raise error
+        finally:
+            if self._outstanding and self._poll_id is None:
+                self._poll_id = self.master.after(self.poll_ms, self._poll)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Finish the queued jobs and end the worker thread
+
+        Call before the window is destroyed so that recorded games are
+        written; callbacks of jobs still outstanding are not run.
+
+        Args:
+            timeout: Seconds to wait for the queued jobs (None waits for all)
+        """
+        if self._poll_id is not None:
+            self.master.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._jobs.put(None)
+        self._thread.join(timeout)
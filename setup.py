@@ -33,15 +33,22 @@ setup(
     install_requires=[
         # No external dependencies - uses tkinter which comes with Python
     ],
+    extras_require={
+        # Vectorized candidate filtering for the automated solver
+        "solver": ["numpy"],
+    },
     entry_points={
         "console_scripts": [
             "hangman=hangman_game.ui.gui:main",
             "hangman-cli=hangman_game.cli:main",
+            "hangman-server=hangman_game.server:main",
+            "hangman-simulate=hangman_game.simulate:main",
         ],
     },
     package_data={
         "hangman_game": [
             "data/*.json",
+            "data/*.pack",
         ],
     },
     keywords="hangman game puzzle word-game tkinter gui",
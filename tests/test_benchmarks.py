@@ -0,0 +1,63 @@
+"""
+Smoke tests for the core benchmark suite
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'benchmarks')))
+
+import bench_core
+
+
+def test_benchmarks_run():
+    """Test that every benchmark runs and reports a time"""
+    print("Testing benchmark suite...")
+    report = bench_core.run_benchmarks(sizes=[10, 1000], repeat=1, min_time=0.001)
+    results = report["results"]
+    for name in ("make_guess", "load_words", "load_words_cold", "get_game_state",
+                 "record_game", "record_game_buffered", "get_hangman_stage",
+                 "game[10]", "game[1000]"):
+        assert results[name]["seconds_per_op"] > 0
+    assert "load_seconds" in results["game[1000]"]
+    assert len(bench_core.synthetic_corpus(500)) == 500
+    print("✓ Benchmark suite test passed")
+
+
+def test_benchmark_compare():
+    """Test regression detection against a baseline"""
+    print("\nTesting benchmark comparison...")
+    baseline = {"results": {"a": {"seconds_per_op": 1.0}, "b": {"seconds_per_op": 1.0}}}
+    current = {"results": {"a": {"seconds_per_op": 1.2}, "b": {"seconds_per_op": 1.5},
+                           "new": {"seconds_per_op": 9.0}}}
+    assert bench_core.compare(baseline, current, threshold=0.25) == [("b", 1.5)]
+    assert bench_core.compare(baseline, current, threshold=0.1) == [("a", 1.2), ("b", 1.5)]
+    print("✓ Benchmark comparison test passed")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 50)
+    print("Running Hangman Benchmark Tests")
+    print("=" * 50)
+
+    try:
+        test_benchmarks_run()
+        test_benchmark_compare()
+
+        print("\n" + "=" * 50)
+        print("✅ All tests passed!")
+        print("=" * 50)
+        return True
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n❌ Error during testing: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
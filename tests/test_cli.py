@@ -0,0 +1,146 @@
+"""
+Tests for the scripted (batch) mode of hangman-cli
+"""
+
+import sys
+import os
+import io
+import json
+import subprocess
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hangman_game import cli
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_batch_games():
+    """Test per-guess and per-game result lines"""
+    print("Testing batch games...")
+    lines = [
+        '{"difficulty": "easy", "word": "cat", "guesses": "eaect"}',
+        "",
+        "# comment",
+        '{"difficulty": "hard", "word": "dog", "guesses": ["x", "1", "y", "z", "w", "d"]}',
+        '{"difficulty": "extreme", "guesses": "a"}',
+        "easy etaoinshrdlucmfwypvbgkqjxz",
+        '{"difficulty": [], "guesses": "a"}',
+        '{"hint": 5, "guesses": "a"}',
+    ]
+    out = io.StringIO()
+    summary = cli.play_batch(lines, out)
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert summary["games"] == 3 and summary["errors"] == 3
+    assert summary["won"] + summary["lost"] == 3
+
+    guesses = [r for r in records if r["type"] == "guess" and r["game"] == 1]
+    assert [r["letter"] for r in guesses] == ["e", "a", "e", "c", "t"]
+    assert guesses[2]["valid"] == False
+    assert guesses[-1]["display_word"] == "c a t"
+    games = [r for r in records if r["type"] == "game"]
+    assert games[0] == {"type": "game", "game": 1, "line": 1, "difficulty": "easy", "word": "cat",
+                        "won": True, "lost": False, "incorrect_guesses": 1, "guesses": 4}
+
+    # Hard allows 4 wrong guesses; "1" isn't counted and "d" comes too late
+    assert games[1]["lost"] == True and games[1]["incorrect_guesses"] == 4
+    assert games[1]["guesses"] == 4
+    assert records[[r["type"] for r in records].index("error")]["line"] == 5
+    # The whole alphabet always finishes a random word
+    assert games[2]["won"] != games[2]["lost"] and games[2]["line"] == 6
+    errors = [r for r in records if r["type"] == "error"]
+    assert [r["error"] for r in errors[1:]] == ["difficulty must be a string", "hint must be a string"]
+    print("✓ Batch games test passed")
+
+
+def test_batch_preload():
+    """Test that batch games switch difficulty without reading the words file again"""
+    print("\nTesting batch corpus preload...")
+    with tempfile.TemporaryDirectory() as tmp:
+        words_file = os.path.join(tmp, "words.json")
+        with open(words_file, "w") as f:
+            json.dump({"easy": {"cat": "A pet."}, "medium": {"horse": "A farm animal."},
+                       "hard": {"jazz": "Music."}}, f)
+
+        def lines():
+            yield '{"difficulty": "easy", "guesses": "cat"}'
+            os.remove(words_file)
+            yield '{"difficulty": "hard", "guesses": "jaz"}'
+            yield '{"difficulty": "medium", "guesses": "horse"}'
+
+        out = io.StringIO()
+        summary = cli.play_batch(lines(), out, words_file=words_file)
+    games = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [g["word"] for g in games if g["type"] == "game"] == ["cat", "jazz", "horse"]
+    assert summary["won"] == 3
+    print("✓ Batch corpus preload test passed")
+
+
+def test_batch_command():
+    """Test driving hangman-cli --batch through stdin"""
+    print("\nTesting batch command...")
+    script = "\n".join(['{"word": "python", "guesses": "pythonz"}'] * 3)
+    result = subprocess.run(
+        [sys.executable, "-m", "hangman_game.cli", "--batch", "--games-only", "--seed", "7"],
+        cwd=ROOT, input=script, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["type"] for r in records] == ["game"] * 3
+    assert all(r["won"] and r["guesses"] == 6 for r in records)
+
+    # An undecodable line is an error record; the other lines still play
+    script = b'{"word": "cat", "guesses": "cat"}\n{"word": "caf\xe9", "guesses": "c"}\n' \
+             b'{"word": "dog", "guesses": "dog"}\n'
+    for args in (["--batch"], ["--batch", "script.txt"]):
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "script.txt"), "wb") as f:
+                f.write(script)
+            result = subprocess.run(
+                [sys.executable, "-m", "hangman_game.cli", "--games-only"] + args,
+                cwd=tmp, input=script, capture_output=True, timeout=60,
+                env=dict(os.environ, PYTHONPATH=ROOT)
+            )
+        assert result.returncode == 1, result.stderr
+        records = [json.loads(line) for line in result.stdout.decode().splitlines()]
+        assert [r["type"] for r in records] == ["game", "error", "game"]
+        assert records[1] == {"type": "error", "line": 2, "error": "Line is not valid UTF-8"}
+
+    result = subprocess.run(
+        [sys.executable, "-m", "hangman_game.cli", "--batch", "no-such-script.txt"],
+        cwd=ROOT, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 2
+    assert result.stderr.startswith("hangman-cli: cannot read no-such-script.txt")
+    assert "Traceback" not in result.stderr
+    print("✓ Batch command test passed")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 50)
+    print("Running Hangman CLI Tests")
+    print("=" * 50)
+
+    try:
+        test_batch_games()
+        test_batch_preload()
+        test_batch_command()
+
+        print("\n" + "=" * 50)
+        print("✅ All tests passed!")
+        print("=" * 50)
+        return True
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n❌ Error during testing: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
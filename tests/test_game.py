@@ -8,8 +8,24 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from hangman_game.core.game_logic import HangmanLogic
+import json
+import multiprocessing
+import tempfile
+import time
+import warnings
+
+from hangman_game.core.game_logic import HangmanLogic, load_words, WORDS_FILE
+from hangman_game.core.jsonstream import load_member
+from hangman_game.core.pattern_index import PatternIndex
+from hangman_game.core.sampling import ShuffleBag
+from hangman_game.core.scoring import ScoreIndex
+from hangman_game.core.session import GameSession
+from hangman_game.core import evil, game_logic, metrics, pattern_index
+from hangman_game.core import solver as solver_module
+from hangman_game.core.solver import Solver, pattern_of
+from hangman_game.core.wordpack import WordPack, build_wordpack
 from hangman_game.core.statistics import Statistics
+from hangman_game.core.sqlite_statistics import SQLiteStatistics
 
 
 def test_game_initialization():
@@ -152,6 +168,698 @@ def test_game_state():
     print("✓ Game state test passed")
 
 
+def test_word_cache():
+    """Test the shared word corpus cache"""
+    print("\nTesting word corpus cache...")
+    first = HangmanLogic(difficulty="easy")
+    second = HangmanLogic(difficulty="easy")
+    assert first.words_with_clues is second.words_with_clues
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        words_file = os.path.join(tmp, "words.json")
+        with open(words_file, "w") as f:
+            json.dump({"easy": {"cat": "A pet."}}, f)
+        assert load_words("easy", words_file) == {"cat": "A pet."}
+        
+        # Rewriting the file changes its size, so the cache reloads it
+        time.sleep(0.01)
+        with open(words_file, "w") as f:
+            json.dump({"easy": {"horse": "A farm animal."}}, f)
+        assert load_words("easy", words_file) == {"horse": "A farm animal."}
+    print("✓ Word cache test passed")
+
+
+def test_streaming_words():
+    """Test streaming one difficulty out of a large words file"""
+    print("\nTesting streaming word loader...")
+    sections = {
+        "easy": {"cat": "A pet with \"whiskers\" {not a brace}.", "dog": "[Woof]"},
+        "meta": [1, {"nested": ["}", "\\"]}, None, True, -2.5],
+        "hard": {"quixotic": "Idealistic \u2014 unrealistically so."},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        words_file = os.path.join(tmp, "words.json")
+        with open(words_file, "w") as f:
+            json.dump(sections, f, indent=2)
+        for key in sections:
+            for chunk_size in (1, 5, 1 << 20):
+                assert load_member(words_file, key, chunk_size) == sections[key]
+        assert load_member(words_file, "medium") is None
+        
+        threshold = game_logic.STREAM_THRESHOLD
+        game_logic.STREAM_THRESHOLD = 0
+        try:
+            assert load_words("hard", words_file) == sections["hard"]
+            cached = [key for key in game_logic._CORPUS_CACHE if key[0] == words_file]
+            assert cached == [(words_file, "hard")]
+            assert load_words("easy", words_file) == sections["easy"]
+            game = HangmanLogic(difficulty="hard", words_file=words_file)
+            assert game.start_new_game() == ("quixotic", sections["hard"]["quixotic"])
+        finally:
+            game_logic.STREAM_THRESHOLD = threshold
+    print("✓ Streaming word loader test passed")
+
+
+def test_wordpack():
+    """Test building and playing from a memory-mapped word pack"""
+    print("\nTesting word pack...")
+    with open(WORDS_FILE) as f:
+        sections = json.load(f)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pack_file = os.path.join(tmp, "words.pack")
+        build_wordpack(sections, pack_file)
+        
+        with WordPack(pack_file) as pack:
+            hard = pack.section("hard")
+            assert len(hard) == len(sections["hard"])
+            assert dict(hard.items()) == sections["hard"]
+            assert "kubernetes" in hard
+            assert "banana" not in hard
+            
+            # Rebuilding replaces the file instead of truncating the mapped one
+            build_wordpack({"hard": {"zephyr": "A gentle breeze."}}, pack_file)
+            assert dict(hard.items()) == sections["hard"]
+            assert os.listdir(tmp) == ["words.pack"]
+            with WordPack(pack_file) as rebuilt:
+                assert list(rebuilt.section("hard")) == ["zephyr"]
+            build_wordpack(sections, pack_file)
+        
+        game = HangmanLogic(difficulty="hard", words_file=pack_file)
+        word, hint = game.start_new_game()
+        assert sections["hard"][word] == hint
+        
+        # A pack older than the JSON file it was built from is skipped
+        words_file = os.path.join(tmp, "words.json")
+        with open(words_file, "w") as f:
+            json.dump({"hard": {"zephyr": "A gentle breeze."}}, f)
+        os.utime(pack_file, ns=(1, 1))
+        saved = game_logic.WORDS_FILE, game_logic.WORDPACK_FILE
+        game_logic.WORDS_FILE, game_logic.WORDPACK_FILE = words_file, pack_file
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                assert load_words("hard") == {"zephyr": "A gentle breeze."}
+            assert "older than" in str(caught[0].message)
+            os.utime(words_file, ns=(0, 0))
+            assert "kubernetes" in load_words("hard")
+        finally:
+            game_logic.WORDS_FILE, game_logic.WORDPACK_FILE = saved
+    print(f"✓ Word pack test passed (word: {word})")
+
+
+def test_no_repeat_words():
+    """Test shuffle-bag word selection"""
+    print("\nTesting no-repeat word selection...")
+    bag = ShuffleBag(50)
+    drawn = [bag.draw() for _ in range(50)]
+    assert sorted(drawn) == list(range(50))
+    assert bag.remaining == 0
+    
+    game = HangmanLogic(difficulty="easy", no_repeat=True)
+    count = len(game.words_with_clues)
+    words = {game.start_new_game()[0] for _ in range(count)}
+    assert len(words) == count
+    print(f"✓ No-repeat test passed ({count} distinct words)")
+
+
+def test_full_game_win():
+    """Test winning a game with repeated letters"""
+    print("\nTesting full game win...")
+    game = HangmanLogic()
+    game.start_new_game()
+    game.word_to_guess = "banana"
+    
+    assert game.make_guess("b")["game_won"] == False
+    assert game.make_guess("A")["correct"] == True
+    assert game.make_guess("a")["valid"] == False
+    result = game.make_guess("n")
+    assert result["game_won"] == True
+    assert game.game_won == True
+    assert game.guessed_letters == ["b", "a", "n"]
+    assert game.get_display_word() == "b a n a n a"
+    print("✓ Full game win test passed")
+
+
+def test_incremental_display():
+    """Test the cached, incrementally revealed display word"""
+    print("\nTesting incremental display word...")
+    game = HangmanLogic()
+    game.start_new_game()
+    game.word_to_guess = "letter"
+    
+    display = game.get_display_word()
+    assert display == "_ _ _ _ _ _"
+    assert game.get_display_word() is display
+    
+    game.make_guess("t")
+    assert game.get_display_word() == "_ _ t t _ _"
+    game.make_guess("z")
+    game.make_guess("e")
+    assert game.get_display_word() == "_ e t t e _"
+    
+    game.guessed_letters = ["l", "r"]
+    assert game.get_display_word() == "l _ _ _ _ r"
+    print("✓ Incremental display test passed")
+
+
+def test_unknown_letters():
+    """Test that guesses of unseen characters are misses that add no bits"""
+    print("\nTesting unknown letters...")
+    known = len(game_logic._LETTER_BITS)
+    game = HangmanLogic(difficulty="hard")
+    game.start_new_game()
+    game.word_to_guess = "python"
+    for letter in ("\u00e9", "\u03c9", "\u4e00"):
+        result = game.make_guess(letter)
+        assert result["valid"] == True and result["correct"] == False
+    assert game.incorrect_guesses == 3
+    assert len(game_logic._LETTER_BITS) == known
+    # Repeating one is caught without a bit, in both engines
+    assert game.make_guess("1")["valid"] == True
+    for letter in ("\u00e9", "1"):
+        result = game.make_guess(letter)
+        assert result["valid"] == False and result["message"] == "Already guessed"
+    assert game.incorrect_guesses == 4
+    assert game.guessed_letters == ["\u00e9", "\u03c9", "\u4e00", "1"]
+    session = GameSession([("python", "A language.")], 0)
+    for letter in ("\u00e9", "1", "\u00e9", "p", "1"):
+        session.make_guess(letter)
+    assert session.incorrect_guesses == 2
+    assert session.guessed_letters == ["p", "\u00e9", "1"]
+    assert len(game_logic._LETTER_BITS) == known
+    
+    # Characters of a played word get bits, and so can be guessed
+    game.start_new_game()
+    game.word_to_guess = "caf\u00e9"
+    for letter in "caf\u00e9":
+        game.make_guess(letter)
+    assert game.game_won == True
+    assert game_logic.mask_letters(game_logic.letters_mask("\u00e9ba")) == ["a", "b", "\u00e9"]
+    print("✓ Unknown letters test passed")
+
+
+def test_game_session():
+    """Test that compact sessions follow the same rules as HangmanLogic"""
+    print("\nTesting compact game session...")
+    session = GameSession([("banana", "A yellow fruit.")], 0, max_incorrect_guesses=2)
+    game = HangmanLogic()
+    game.start_new_game()
+    game.word_to_guess = "banana"
+    game.max_incorrect_guesses = 2
+    
+    assert not hasattr(session, "__dict__")
+    for letter in "bxbay":
+        assert session.make_guess(letter) == game.make_guess(letter)
+        assert session.get_display_word() == game.get_display_word()
+    
+    assert session.game_lost and game.game_lost
+    assert session.guessed_letters == ["a", "b", "x", "y"]
+    assert session.get_game_state()["is_game_over"] == True
+    print("✓ Game session test passed")
+
+
+def test_statistics_event_log():
+    """Test the append-only statistics log and compaction"""
+    print("\nTesting statistics event log...")
+    with tempfile.TemporaryDirectory() as tmp:
+        stats_file = os.path.join(tmp, "stats.json")
+        stats = Statistics(stats_file=stats_file)
+        stats.record_game(won=True, difficulty="easy", guesses=4)
+        stats.record_game(won=True, difficulty="hard", guesses=7)
+        stats.record_game(won=False, difficulty="hard", guesses=9)
+        
+        # One line per game, no snapshot rewrite
+        with open(stats.log_file) as f:
+            assert len(f.readlines()) == 3
+        assert not os.path.exists(stats_file)
+        
+        # A torn trailing line is ignored on replay
+        with open(stats.log_file, "a") as f:
+            f.write('{"seq": 4, "won"')
+        reloaded = Statistics(stats_file=stats_file)
+        assert reloaded.get_stats() == stats.get_stats()
+        assert reloaded.stats["best_streak"] == 2
+        
+        reloaded.record_game(won=False, difficulty="easy", guesses=2)
+        assert Statistics(stats_file=stats_file).stats["games_played"] == 4
+        
+        reloaded.compact()
+        assert os.path.getsize(reloaded.log_file) == 0
+        reloaded.record_game(won=True, difficulty="medium", guesses=3)
+        again = Statistics(stats_file=stats_file)
+        assert again.stats["games_played"] == 5
+        assert again.stats["by_difficulty"]["hard"] == {"played": 2, "won": 1}
+    print("✓ Statistics event log test passed")
+
+
+def test_statistics_buffered():
+    """Test write-behind batching of statistics"""
+    print("\nTesting buffered statistics...")
+    
+    def logged_games(stats):
+        if not os.path.exists(stats.log_file):
+            return 0
+        with open(stats.log_file) as f:
+            return len(f.readlines())
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        stats_file = os.path.join(tmp, "stats.json")
+        stats = Statistics(stats_file=stats_file, buffered=True,
+                           flush_every=3, flush_interval=0.05)
+        stats.record_game(won=True, difficulty="easy", guesses=4)
+        stats.record_game(won=False, difficulty="easy", guesses=6)
+        assert logged_games(stats) == 0
+        assert stats.stats["games_played"] == 2
+        
+        stats.record_game(won=True, difficulty="easy", guesses=5)
+        assert logged_games(stats) == 3
+        
+        # The time threshold writes a lone result on its own
+        stats.record_game(won=True, difficulty="hard", guesses=5)
+        time.sleep(0.3)
+        assert logged_games(stats) == 4
+        
+        stats.record_game(won=True, difficulty="hard", guesses=5)
+        stats.flush()
+        assert Statistics(stats_file=stats_file).get_stats() == stats.get_stats()
+    print("✓ Buffered statistics test passed")
+
+
+def _record_games_worker(args):
+    """Record games from a separate process (used by the stress test)"""
+    stats_file, count, buffered = args
+    # Compact often so compactions race with other processes' appends
+    Statistics.COMPACT_EVERY = 25
+    stats = Statistics(stats_file=stats_file, buffered=buffered, flush_every=7)
+    for i in range(count):
+        stats.record_game(won=i % 3 != 0, difficulty="easy", guesses=1)
+    stats.flush()
+
+
+def test_statistics_multiprocess():
+    """Stress test: several processes recording into the same statistics"""
+    print("\nTesting concurrent statistics from multiple processes...")
+    processes, games = 6, 150
+    with tempfile.TemporaryDirectory() as tmp:
+        stats_file = os.path.join(tmp, "stats.json")
+        jobs = [(stats_file, games, worker % 2 == 0) for worker in range(processes)]
+        with multiprocessing.Pool(processes) as pool:
+            pool.map(_record_games_worker, jobs)
+        
+        stats = Statistics(stats_file=stats_file).get_stats()
+        assert stats["games_played"] == processes * games
+        assert stats["games_won"] == processes * (games - games // 3)
+        assert stats["total_guesses"] == processes * games
+        assert stats["by_difficulty"]["easy"]["played"] == processes * games
+    print(f"✓ Multiprocess statistics test passed ({processes * games} games)")
+
+
+def test_sqlite_statistics():
+    """Test the SQLite statistics store and history queries"""
+    print("\nTesting SQLite statistics...")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = os.path.join(tmp, "stats.db")
+        stats = SQLiteStatistics(db_file=db_file)
+        json_stats = Statistics(stats_file=os.path.join(tmp, "stats.json"))
+        now = time.time()
+        games = [
+            (True, "easy", 4, "cat", now - 10 * 86400),
+            (True, "hard", 6, "quantum", now - 3 * 86400),
+            (False, "hard", 9, "quantum", now - 2 * 86400),
+            (True, "hard", 5, "kubernetes", now - 3600),
+            (True, "medium", 7, "python", now),
+        ]
+        for won, difficulty, guesses, word, ts in games:
+            stats.record_game(won=won, difficulty=difficulty, guesses=guesses,
+                              word=word, timestamp=ts)
+            json_stats.record_game(won=won, difficulty=difficulty, guesses=guesses)
+        
+        # Aggregates match the JSON store exactly
+        assert stats.get_stats() == json_stats.get_stats()
+        assert stats.get_win_rate() == json_stats.get_win_rate()
+        
+        assert stats.query_win_rate(since=now - 7 * 86400) == (4, 75.0)
+        assert stats.query_win_rate(difficulty="hard", since=now - 7 * 86400) == (3, 2 / 3 * 100)
+        assert stats.query_win_rate(word="quantum") == (2, 50.0)
+        assert [game["word"] for game in stats.get_history(limit=2)] == ["python", "kubernetes"]
+        
+        plan = stats._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM games WHERE difficulty = 'hard' AND ts >= 0"
+        ).fetchall()
+        assert "games_difficulty_ts" in str(plan)
+        
+        # Same interface as Statistics for the GUI and CLI, subscriptions included
+        for name in ("record_game", "get_stats", "get_win_rate", "reset_stats",
+                     "subscribe", "refresh", "flush"):
+            assert callable(getattr(stats, name)) and callable(getattr(json_stats, name)), name
+        changes = []
+        stats.subscribe(changes.append)
+        stats.refresh()
+        assert changes[-1]["games_played"] == 5
+        other = SQLiteStatistics(db_file=db_file)
+        other.record_game(won=False, difficulty="easy", guesses=3)
+        other.close()
+        stats.flush()
+        stats.refresh()
+        assert changes[-1] == {"games_played": 6, "games_lost": 2, "total_guesses": 34,
+                               "current_streak": 0, "by_difficulty.easy.played": 2}
+        
+        stats.reset_stats()
+        assert changes[-1]["games_played"] == 0
+        assert stats.get_stats()["games_played"] == 0
+        assert stats.get_history() == []
+        stats.close()
+    print("✓ SQLite statistics test passed")
+
+
+def test_solver():
+    """Test the automated solver, with and without NumPy"""
+    print("\nTesting solver...")
+    words = ["cat", "cot", "cut", "dog", "dig", "bat", "python", "banana"]
+    numpy = solver_module.np
+    try:
+        for np in {numpy, None}:
+            solver_module.np = np
+            solver = Solver(words)
+            assert sorted(solver.candidates("___", [])) == ["bat", "cat", "cot", "cut", "dig", "dog"]
+            assert sorted(solver.candidates("c_t", ["c", "t", "a"])) == ["cot", "cut"]
+            assert solver.candidates("_a_", ["a", "c"]) == ["bat"]
+            assert solver.best_guess("___", []) == "t"
+            assert solver.best_guess("c_t", ["c", "t"], strategy="entropy") in "aou"
+            
+            for word in words:
+                game = HangmanLogic()
+                game.start_new_game()
+                game.word_to_guess = word
+                while not game.game_won and not game.game_lost:
+                    game.make_guess(solver.next_guess(game))
+                assert game.game_won, word
+    finally:
+        solver_module.np = numpy
+    
+    assert pattern_of("p y _ _ o _") == "py__o_"
+    
+    # The shared solver follows edits to the words file
+    with tempfile.TemporaryDirectory() as tmp:
+        words_file = os.path.join(tmp, "words.json")
+        with open(words_file, "w") as f:
+            json.dump({"easy": {"cat": "A pet."}}, f)
+        solver = Solver.for_corpus("easy", words_file)
+        assert Solver.for_corpus("easy", words_file) is solver
+        assert solver.candidates("___", []) == ["cat"]
+        with open(words_file, "w") as f:
+            json.dump({"easy": {"dog": "Another pet."}}, f)
+        assert Solver.for_corpus("easy", words_file).candidates("___", []) == ["dog"]
+    print(f"✓ Solver test passed (NumPy {'available' if numpy else 'not installed'})")
+
+
+def test_metrics():
+    """Test opt-in hot-path metrics"""
+    print("\nTesting metrics...")
+    original = HangmanLogic.make_guess
+    metrics.reset()
+    metrics.enable()
+    try:
+        assert metrics.is_enabled()
+        assert HangmanLogic.make_guess is not original
+        with tempfile.TemporaryDirectory() as tmp:
+            words_file = os.path.join(tmp, "words.json")
+            with open(words_file, "w") as f:
+                json.dump({"easy": {"cat": "A pet."}, "medium": {"horse": "A farm animal."},
+                           "hard": {"jazz": "Music."}}, f)
+            game = HangmanLogic(difficulty="easy", words_file=words_file)
+            game.preload()
+            game.reset(difficulty="medium")
+            for letter in "etaoin":
+                game.make_guess(letter)
+            game.get_display_word()
+            stats = Statistics(os.path.join(tmp, "stats.json"))
+            stats.record_game(True, "medium", 6)
+            stats.flush()
+            stats.reset_stats()
+    finally:
+        metrics.disable()
+    assert HangmanLogic.make_guess is original
+    
+    recorded = metrics.get_metrics()
+    assert recorded["HangmanLogic.make_guess"]["calls"] == 6
+    assert sum(recorded["HangmanLogic.make_guess"]["histogram"].values()) == 6
+    assert recorded["HangmanLogic._load_words"]["calls"] == 1
+    assert recorded["HangmanLogic.start_new_game"]["calls"] == 1
+    assert recorded["HangmanLogic.get_display_word"]["calls"] == 1
+    # preload() and reset() load corpora without going through _load_words;
+    # the file itself is only read once
+    assert recorded["game_logic.load_words"]["calls"] == 3
+    assert recorded["game_logic._read_words_file"]["calls"] == 1
+    assert recorded["Statistics.flush"]["calls"] >= 1
+    assert recorded["Statistics._append_events"]["calls"] == 1
+    assert recorded["Statistics._save_stats"]["calls"] == 1
+    
+    # Nothing is recorded while disabled
+    game.make_guess("s")
+    assert metrics.get_metrics()["HangmanLogic.make_guess"]["calls"] == 6
+    metrics.reset()
+    assert metrics.get_metrics()["HangmanLogic.make_guess"]["calls"] == 0
+    print("✓ Metrics test passed")
+
+
+def test_score_index():
+    """Test difficulty scoring and drawing words by score percentile"""
+    print("\nTesting word difficulty scoring...")
+    words = {"jazz": "Music.", "fuzz": "Fluff.", "cat": "A pet.",
+             "orchestration": "Coordination.", "information": "Data.", "keyboard": "Keys."}
+    index = ScoreIndex.from_words(words)
+    assert index.scores == sorted(index.scores)
+    ranked = [word for _, word, _ in index.entries]
+    assert ranked.index("jazz") > ranked.index("information")
+    assert ranked.index("fuzz") > ranked.index("orchestration")
+    
+    assert index.percentile_span(0, 50) == (0, 3)
+    assert index.percentile_span(50, 100) == (3, 6)
+    assert index.percentile_span(99, 100) == (5, 6)
+    start, end = index.score_span(index.scores[1], index.scores[3])
+    assert (start, end) == (1, 4)
+    buckets = index.bucket()
+    assert sum(len(section) for section in buckets.values()) == len(words)
+    assert set(buckets["hard"]) <= set(ranked[3:])
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        index_file = os.path.join(tmp, "scores.json")
+        ScoreIndex.from_words(words, use_solver=True).save(index_file)
+        assert len(ScoreIndex.load(index_file)) == len(words)
+        
+        hardest = ScoreIndex.load(index_file).entries[-1][1]
+        game = HangmanLogic(difficulty="hard", percentiles=(90, 100), score_index=index_file)
+        for _ in range(5):
+            word, hint = game.start_new_game()
+            assert (word, hint) == (hardest, words[hardest])
+        assert game.max_incorrect_guesses == 4
+        
+        # Later games reuse the engine's index without touching the file
+        os.rename(index_file, index_file + ".moved")
+        assert game.reset(difficulty="easy")[0] == hardest
+        os.rename(index_file + ".moved", index_file)
+        
+        game = HangmanLogic(percentiles=(0, 100), score_index=index_file, no_repeat=True)
+        assert {game.start_new_game()[0] for _ in range(len(words))} == set(words)
+        
+        # An empty index is an error, not an empty random range
+        empty_file = os.path.join(tmp, "empty.json")
+        ScoreIndex.from_words({}).save(empty_file)
+        for no_repeat in (False, True):
+            game = HangmanLogic(percentiles=(0, 100), score_index=empty_file, no_repeat=no_repeat)
+            try:
+                game.start_new_game()
+                assert False, "drew a word from an empty index"
+            except ValueError as e:
+                assert "No medium words" in str(e)
+    print("✓ Word difficulty scoring test passed")
+
+
+def test_pattern_index():
+    """Test pattern queries against the bitset word index"""
+    print("\nTesting pattern index...")
+    words = ["latte", "lotto", "basket", "bottle", "cattle", "rattle", "settle", "little", "tattoo"]
+    index = PatternIndex(words)
+    assert index.candidates("_a__le") == ["cattle", "rattle"]
+    assert index.candidates("_ a _ _ l e", wrong=["r"]) == ["cattle"]
+    # A revealed letter can't hide in an unrevealed position
+    assert index.candidates("__tt__") == ["bottle", "cattle", "little", "rattle", "settle"]
+    assert index.candidates("t_tt__") == ["tattoo"]
+    assert index.candidates("___t__", wrong=["e"]) == []
+    assert index.candidates("______", wrong=["e", "a"]) == []
+    assert index.count("______") == 7
+    assert index.candidates("l____") == ["latte", "lotto"]
+    assert index.candidates("xyz") == []
+    assert PatternIndex.for_words(load_words("easy")) is PatternIndex.for_words(load_words("easy"))
+    
+    game = HangmanLogic(difficulty="easy")
+    game.start_new_game()
+    assert game.word_to_guess in game.matching_words()
+    for letter in "etaoinsrhl":
+        game.make_guess(letter)
+        assert game.word_to_guess in game.matching_words()
+    print("✓ Pattern index test passed")
+
+
+def test_evil_mode():
+    """Test the adversarial mode that keeps the largest word family"""
+    print("\nTesting evil mode...")
+    words = {word: "Hint." for word in ("cat", "cot", "dog", "dig", "bat", "hat", "horse")}
+    with tempfile.TemporaryDirectory() as tmp:
+        words_file = os.path.join(tmp, "words.json")
+        with open(words_file, "w") as f:
+            json.dump({"medium": words}, f)
+        
+        game = HangmanLogic(difficulty="medium", words_file=words_file, evil=True)
+        while len(game.start_new_game()[0]) != 3:
+            pass
+        assert "3-letter" in game.hint
+        
+        # cat/bat/hat vs cot/dog/dig: a tie, so the guess misses
+        result = game.make_guess("a")
+        assert result["correct"] == False
+        assert game.word_to_guess in ("cot", "dog", "dig")
+        # cot/dog keep the o, which beats dig alone
+        result = game.make_guess("o")
+        assert result["correct"] == True
+        assert game.get_display_word() == "_ o _"
+        assert game.word_to_guess in ("cot", "dog")
+        assert game.make_guess("o")["valid"] == False
+        
+        game.make_guess("d")
+        assert game.word_to_guess == "cot"
+        game.make_guess("c")
+        game.make_guess("t")
+        state = game.get_game_state()
+        assert state["game_won"] == True
+        assert state["display_word"] == "c o t"
+        assert state["incorrect_guesses"] == 2
+        assert state["guessed_letters"] == ["a", "o", "d", "c", "t"]
+        
+        # Structures built for a corpus are dropped when it is reloaded
+        old = load_words("medium", words_file)
+        assert evil._FAMILIES[id(old)][0] is old
+        PatternIndex.for_words(old)
+        with open(words_file, "w") as f:
+            json.dump({"medium": {"cot": "Hint."}}, f)
+        new = load_words("medium", words_file)
+        assert new is not old
+        assert id(old) not in evil._FAMILIES and id(old) not in pattern_index._INDEXES
+        assert evil.WordFamilies.for_words(new) is evil.WordFamilies.for_words(new)
+        # Mappings that aren't cached corpora aren't kept
+        size = len(pattern_index._INDEXES)
+        assert PatternIndex.for_words({"cat": "A pet."}).candidates("c_t") == ["cat"]
+        assert len(pattern_index._INDEXES) == size
+    print("✓ Evil mode test passed")
+
+
+def test_engine_reset():
+    """Test starting games on one engine without reloading words"""
+    print("\nTesting engine reset...")
+    sections = {"easy": {"cat": "A pet."}, "hard": {"quixotic": "Idealistic."}}
+    with tempfile.TemporaryDirectory() as tmp:
+        words_file = os.path.join(tmp, "words.json")
+        with open(words_file, "w") as f:
+            json.dump(sections, f)
+        game = HangmanLogic(difficulty="easy", words_file=words_file)
+        game.preload(("easy", "hard"))
+        game.make_guess("c")
+        
+        # The resident corpora survive the words file going away
+        os.remove(words_file)
+        assert game.reset(difficulty="hard") == ("quixotic", "Idealistic.")
+        assert game.max_incorrect_guesses == 4
+        assert game.guessed_letters == []
+        assert game.reset(difficulty="easy") == ("cat", "A pet.")
+        assert game.max_incorrect_guesses == 8
+        assert game.reset()[0] == "cat"
+        assert game.get_game_state()["incorrect_guesses"] == 0
+    print("✓ Engine reset test passed")
+
+
+def test_io_worker():
+    """Test the GUI's background I/O worker without a display"""
+    print("\nTesting background I/O worker...")
+    from hangman_game.ui.io_worker import IOWorker
+    
+    class FakeMaster:
+        """Stands in for Tk: runs after() callbacks when pumped"""
+        def __init__(self):
+            self.scheduled = []
+        def after(self, ms, callback):
+            self.scheduled.append(callback)
+            return len(self.scheduled)
+        def after_cancel(self, after_id):
+            pass
+        def pump(self):
+            while self.scheduled:
+                self.scheduled.pop(0)()
+                time.sleep(0.005)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = Statistics(stats_file=os.path.join(tmp, "stats.json"))
+        master = FakeMaster()
+        worker = IOWorker(master)
+        results, errors = [], []
+        worker.submit(stats.record_game, won=True, difficulty="easy", guesses=5)
+        worker.submit(stats.get_stats, on_done=results.append)
+        worker.submit(int, "not a number", on_error=errors.append)
+        worker.submit(worker.post, results.append, "posted")
+        master.pump()
+        assert not worker.busy
+        assert results[0]["games_won"] == 1
+        assert isinstance(errors[0], ValueError)
+        assert results[1] == "posted"
+        
+        # stop() finishes queued writes before returning
+        worker.submit(stats.record_game, won=False, difficulty="easy", guesses=3)
+        worker.stop()
+        assert Statistics(stats_file=os.path.join(tmp, "stats.json")).get_stats()["games_played"] == 2
+    print("✓ I/O worker test passed")
+
+
+def test_statistics_subscribe():
+    """Test statistics change notifications"""
+    print("\nTesting statistics subscriptions...")
+    with tempfile.TemporaryDirectory() as tmp:
+        stats_file = os.path.join(tmp, "stats.json")
+        stats = Statistics(stats_file=stats_file)
+        changes = []
+        unsubscribe = stats.subscribe(changes.append)
+        
+        stats.refresh()
+        assert changes[-1]["games_played"] == 0
+        assert changes[-1]["by_difficulty.hard.won"] == 0
+        
+        stats.record_game(won=True, difficulty="hard", guesses=4)
+        assert changes[-1] == {
+            "games_played": 1, "games_won": 1, "total_guesses": 4,
+            "current_streak": 1, "best_streak": 1,
+            "by_difficulty.hard.played": 1, "by_difficulty.hard.won": 1,
+        }
+        stats.record_game(won=False, difficulty="hard", guesses=2)
+        assert changes[-1] == {
+            "games_played": 2, "games_lost": 1, "total_guesses": 6,
+            "current_streak": 0, "by_difficulty.hard.played": 2,
+        }
+        
+        # Games recorded by another instance arrive with the next refresh
+        Statistics(stats_file=stats_file).record_game(won=True, difficulty="easy")
+        count = len(changes)
+        stats.refresh()
+        assert len(changes) == count + 1
+        assert changes[-1]["games_played"] == 3
+        stats.refresh()
+        assert len(changes) == count + 1
+        
+        unsubscribe()
+        stats.reset_stats()
+        assert len(changes) == count + 1
+    print("✓ Statistics subscription test passed")
+
+
 def run_all_tests():
     """Run all tests"""
     print("=" * 50)
@@ -169,6 +877,26 @@ def run_all_tests():
         test_word_complete()
         test_statistics()
         test_game_state()
+        test_word_cache()
+        test_streaming_words()
+        test_wordpack()
+        test_no_repeat_words()
+        test_full_game_win()
+        test_incremental_display()
+        test_unknown_letters()
+        test_game_session()
+        test_statistics_event_log()
+        test_statistics_buffered()
+        test_statistics_multiprocess()
+        test_sqlite_statistics()
+        test_solver()
+        test_metrics()
+        test_score_index()
+        test_pattern_index()
+        test_evil_mode()
+        test_engine_reset()
+        test_io_worker()
+        test_statistics_subscribe()
         
         print("\n" + "=" * 50)
         print("✅ All tests passed!")
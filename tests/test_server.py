@@ -0,0 +1,119 @@
+"""
+Tests for the headless JSON-lines game server
+"""
+
+import sys
+import os
+import asyncio
+import json
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hangman_game.server import HangmanServer
+from hangman_game.loadgen import run_load
+
+
+async def _start_server():
+    """Start a server on a free port, returning (HangmanServer, asyncio server, port)"""
+    hangman = HangmanServer()
+    server = await hangman.start("127.0.0.1", 0)
+    return hangman, server, server.sockets[0].getsockname()[1]
+
+
+def test_server_protocol():
+    """Test a game over the JSON-lines protocol"""
+    print("Testing server protocol...")
+
+    async def run():
+        hangman, server, port = await _start_server()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def request(payload):
+            writer.write(json.dumps(payload).encode() + b"\n")
+            return json.loads(await reader.readline())
+
+        try:
+            created = await request({"cmd": "new_game", "difficulty": "hard", "id": 7})
+            assert created["ok"] == True
+            assert created["id"] == 7
+            assert created["state"]["max_incorrect_guesses"] == 4
+            game_id = created["game"]
+
+            response = await request({"cmd": "guess", "game": game_id, "letter": "e"})
+            assert response["result"]["valid"] == True
+            assert "e" in response["state"]["guessed_letters"]
+            response = await request({"cmd": "guess", "game": game_id, "letter": "e"})
+            assert response["result"]["valid"] == False
+
+            assert await request({"cmd": "state", "game": "nope"}) == {"ok": False, "error": "Unknown game"}
+            assert (await request({"cmd": "fly"}))["ok"] == False
+
+            # Malformed fields are errors, and the connection stays usable
+            assert (await request({"cmd": "new_game", "difficulty": [1]}))["ok"] == False
+            assert (await request({"cmd": "guess", "game": game_id, "letter": "\u00e9"}))["ok"] == False
+            assert (await request({"cmd": "guess", "game": game_id, "letter": ["a"]}))["ok"] == False
+            assert (await request({"cmd": "state", "game": game_id}))["ok"] == True
+
+            assert (await request({"cmd": "end_game", "game": game_id}))["ok"] == True
+            assert len(hangman.sessions) == 0
+        finally:
+            writer.close()
+            await writer.wait_closed()
+            # Let the server notice the disconnect before shutting down
+            while hangman.connections:
+                await asyncio.sleep(0.001)
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(run())
+    print("✓ Server protocol test passed")
+
+
+def test_server_load():
+    """Test many concurrent clients with the load generator"""
+    print("\nTesting server under load...")
+
+    async def run():
+        hangman, server, port = await _start_server()
+        try:
+            report = await run_load("127.0.0.1", port, clients=50, games=3)
+            while hangman.connections:
+                await asyncio.sleep(0.001)
+        finally:
+            server.close()
+            await server.wait_closed()
+        return hangman, report
+
+    hangman, report = asyncio.run(run())
+    assert report["games"] == 150
+    assert report["requests"] >= 150 * 2
+    assert len(hangman.sessions) == 0
+    print(f"✓ Server load test passed ({report['requests_per_second']:.0f} requests/sec)")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 50)
+    print("Running Hangman Server Tests")
+    print("=" * 50)
+
+    try:
+        test_server_protocol()
+        test_server_load()
+
+        print("\n" + "=" * 50)
+        print("✅ All tests passed!")
+        print("=" * 50)
+        return True
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n❌ Error during testing: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,115 @@
+"""
+Tests for the batch game simulator
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from hangman_game import simulate
+
+
+def test_simulate_deterministic():
+    """Test that results don't depend on the number of worker processes"""
+    print("Testing simulation determinism...")
+    kwargs = dict(games=simulate.CHUNK_SIZE + 500, difficulties=["easy", "hard"],
+                  strategy="english", seed=42)
+    inline = simulate.simulate(processes=1, **kwargs)
+    pooled = simulate.simulate(processes=2, **kwargs)
+
+    for difficulty in ("easy", "hard"):
+        a = inline["difficulties"][difficulty]
+        b = pooled["difficulties"][difficulty]
+        assert a["games"] == simulate.CHUNK_SIZE + 500
+        assert a["words"] == b["words"]
+        assert a["wrong_guesses_histogram"] == b["wrong_guesses_histogram"]
+        assert sum(a["wrong_guesses_histogram"]) == a["games"]
+    assert len(inline["difficulties"]["hard"]["wrong_guesses_histogram"]) == 5
+
+    other_seed = simulate.simulate(processes=1, **dict(kwargs, seed=7))
+    assert other_seed["difficulties"]["easy"]["words"] != inline["difficulties"]["easy"]["words"]
+    print("✓ Simulation determinism test passed")
+
+
+def test_simulate_strategies():
+    """Test the built-in strategies and strategy lookup"""
+    print("\nTesting simulation strategies...")
+    report = simulate.simulate(games=200, difficulties=["easy"], strategy="frequency", processes=1)
+    easy = report["difficulties"]["easy"]
+    assert easy["games"] == 200
+    assert easy["win_rate"] > 0.9
+
+    report = simulate.simulate(games=200, difficulties=["medium"], strategy="random",
+                               processes=1, max_incorrect=25)
+    assert report["difficulties"]["medium"]["win_rate"] == 1.0
+
+    # An explicit limit of 0 isn't the default: every first miss loses
+    report = simulate.simulate(games=200, difficulties=["easy"], strategy="english",
+                               processes=1, max_incorrect=0)
+    assert len(report["difficulties"]["easy"]["wrong_guesses_histogram"]) == 2
+    assert report["difficulties"]["easy"]["win_rate"] < 0.5
+
+    # The corpus solver is looked up once per chunk, not per guess
+    calls = []
+    original = simulate.Solver.__dict__["for_corpus"]
+    for_corpus = simulate.Solver.for_corpus
+    simulate.Solver.for_corpus = lambda *args: calls.append(args) or for_corpus(*args)
+    try:
+        simulate.play_chunk(("easy", 0, 50, 1, "frequency", None, 6))
+    finally:
+        simulate.Solver.for_corpus = original
+    assert calls == [("easy", None)]
+
+    assert simulate.resolve_strategy("hangman_game.simulate:random_strategy") is simulate.random_strategy
+    try:
+        simulate.resolve_strategy("nonsense")
+        assert False, "unknown strategy accepted"
+    except ValueError:
+        pass
+    print("✓ Simulation strategies test passed")
+
+
+def test_simulate_exhausted_letters():
+    """Test that games end once every letter has been guessed"""
+    print("\nTesting exhausted guesses...")
+    with tempfile.TemporaryDirectory() as tmp:
+        words_file = os.path.join(tmp, "words.json")
+        with open(words_file, "w") as f:
+            json.dump({"easy": {"ice-cream": "A frozen dessert."}}, f)
+        for strategy in ("random", "english", "frequency"):
+            result = simulate.play_chunk(("easy", 0, 3, 1, strategy, words_file, 30))
+            assert result["words"] == {"ice-cream": [3, 0]}
+            assert sum(result["wrong_guesses"]) == 3
+    print("✓ Exhausted guesses test passed")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 50)
+    print("Running Hangman Simulation Tests")
+    print("=" * 50)
+
+    try:
+        test_simulate_deterministic()
+        test_simulate_strategies()
+        test_simulate_exhausted_letters()
+
+        print("\n" + "=" * 50)
+        print("✅ All tests passed!")
+        print("=" * 50)
+        return True
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n❌ Error during testing: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
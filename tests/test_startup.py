@@ -0,0 +1,78 @@
+"""
+Import-time regression tests for the hangman-cli entry point
+"""
+
+import sys
+import os
+import subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Cumulative import time allowed for hangman_game.cli (best of RUNS)
+BUDGET_MS = float(os.environ.get("HANGMAN_STARTUP_BUDGET_MS", "50"))
+RUNS = 5
+
+# Modules the CLI must not load just by being imported
+FORBIDDEN = ("tkinter", "hangman_game.ui.gui", "json", "pathlib",
+             "hangman_game.core.statistics", "hangman_game.core.wordpack")
+
+
+def _import_cli():
+    """Import the CLI in a fresh interpreter, returning (import times, modules)"""
+    # -S keeps site-packages hooks out of the measurement and of sys.modules
+    result = subprocess.run(
+        [sys.executable, "-S", "-X", "importtime", "-c",
+         "import sys, hangman_game.cli; print('\\n'.join(sys.modules))"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative) / 1000
+    return times, set(result.stdout.split())
+
+
+def test_cli_imports():
+    """Test that importing the CLI loads no GUI, JSON or statistics code"""
+    print("Testing CLI imports...")
+    _, modules = _import_cli()
+    loaded = [name for name in FORBIDDEN if name in modules]
+    assert not loaded, f"hangman_game.cli imports {loaded}"
+    print("✓ CLI imports test passed")
+
+
+def test_cli_import_budget():
+    """Test that the CLI imports within the startup budget"""
+    print("\nTesting CLI import time...")
+    best = min(_import_cli()[0]["hangman_game.cli"] for _ in range(RUNS))
+    assert best <= BUDGET_MS, f"hangman_game.cli took {best:.1f} ms to import (budget {BUDGET_MS:.0f} ms)"
+    print(f"✓ CLI import time test passed ({best:.1f} ms)")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("=" * 50)
+    print("Running Hangman Startup Tests")
+    print("=" * 50)
+
+    try:
+        test_cli_imports()
+        test_cli_import_budget()
+
+        print("\n" + "=" * 50)
+        print("✅ All tests passed!")
+        print("=" * 50)
+        return True
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        return False
+    except Exception as e:
+        print(f"\n❌ Error during testing: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)